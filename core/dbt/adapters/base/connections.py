@@ -24,6 +24,7 @@ from typing import (
 import agate
 
 import dbt.exceptions
+from dbt.clients.agate_helper import ResultStream
 from dbt.contracts.connection import (
     Connection,
     Identifier,
@@ -55,6 +56,8 @@ from dbt.utils import cast_to_str
 SleepTime = Union[int, float]  # As taken by time.sleep.
 AdapterHandle = Any  # Adapter connection handle objects can be any class.
 
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
 
 class BaseConnectionManager(metaclass=abc.ABCMeta):
     """Methods to implement:
@@ -414,6 +417,28 @@ class BaseConnectionManager(metaclass=abc.ABCMeta):
         """
         raise dbt.exceptions.NotImplementedError("`execute` is not implemented for this adapter!")
 
+    def execute_stream(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, ResultStream]:
+        """Execute the given SQL, and stream its results in batches of up to
+        batch_size rows. Unless an adapter implements this, all of the results
+        are fetched with `execute` and returned as a single batch.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param int limit: If set, limits the result set
+        :param int batch_size: The number of rows to fetch at a time.
+        :return: A tuple of the query status and a stream of its results.
+        :rtype: Tuple[AdapterResponse, ResultStream]
+        """
+        response, table = self.execute(sql, auto_begin=auto_begin, fetch=True, limit=limit)
+        return response, ResultStream(iter([table]))
+
     def add_select_query(self, sql: str) -> Tuple[Connection, Any]:
         """
         This was added here because base.impl.BaseAdapter.get_column_schema_from_query expects it to be here.
@@ -47,6 +47,7 @@ from dbt.exceptions import (
 
 from dbt.adapters.protocol import AdapterConfig
 from dbt.clients.agate_helper import (
+    ResultStream,
     empty_table,
     get_column_value_uncased,
     merge_tables,
@@ -67,7 +68,12 @@ from dbt.events.types import (
 )
 from dbt.utils import filter_null_values, executor, cast_to_str, AttrDict
 
-from dbt.adapters.base.connections import Connection, AdapterResponse, BaseConnectionManager
+from dbt.adapters.base.connections import (
+    DEFAULT_STREAM_BATCH_SIZE,
+    Connection,
+    AdapterResponse,
+    BaseConnectionManager,
+)
 from dbt.adapters.base.meta import AdapterMeta, available
 from dbt.adapters.base.relation import (
     ComponentName,
@@ -83,6 +89,7 @@ from dbt import deprecations
 GET_CATALOG_MACRO_NAME = "get_catalog"
 GET_CATALOG_RELATIONS_MACRO_NAME = "get_catalog_relations"
 FRESHNESS_MACRO_NAME = "collect_freshness"
+FRESHNESS_BATCH_MACRO_NAME = "collect_freshness_batch"
 GET_RELATION_LAST_MODIFIED_MACRO_NAME = "get_relation_last_modified"
 
 
@@ -308,6 +315,30 @@ class BaseAdapter(metaclass=AdapterMeta):
         """
         return self.connections.execute(sql=sql, auto_begin=auto_begin, fetch=fetch, limit=limit)
 
+    @available.parse(lambda *a, **k: ("", ResultStream(iter([empty_table()]))))
+    def execute_stream(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, ResultStream]:
+        """Execute the given SQL, and stream its results in batches instead of
+        fetching them all at once. This is a thin wrapper around
+        ConnectionManager.execute_stream.
+
+        :param str sql: The sql to execute.
+        :param bool auto_begin: If set, and dbt is not currently inside a
+            transaction, automatically begin one.
+        :param Optional[int] limit: If set, only fetch n number of rows
+        :param int batch_size: The number of rows to fetch at a time.
+        :return: A tuple of the query status and a stream of its results.
+        :rtype: Tuple[AdapterResponse, ResultStream]
+        """
+        return self.connections.execute_stream(
+            sql=sql, auto_begin=auto_begin, limit=limit, batch_size=batch_size
+        )
+
     def validate_sql(self, sql: str) -> AdapterResponse:
         """Submit the given SQL to the engine for validation, but not execution.
 
@@ -1239,21 +1270,45 @@ class BaseAdapter(metaclass=AdapterMeta):
         # the current time according to the db.
         if len(table) != 1 or len(table[0]) != 2:
             raise MacroResultError(FRESHNESS_MACRO_NAME, table)
-        if table[0][0] is None:
-            # no records in the table, so really the max_loaded_at was
-            # infinitely long ago. Just call it 0:00 January 1 year UTC
-            max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
-        else:
-            max_loaded_at = _utc(table[0][0], source, loaded_at_field)
+        freshness = self._freshness_response(table[0][0], table[0][1], source, loaded_at_field)
+        return adapter_response, freshness
 
-        snapshotted_at = _utc(table[0][1], source, loaded_at_field)
-        age = (snapshotted_at - max_loaded_at).total_seconds()
-        freshness: FreshnessResponse = {
-            "max_loaded_at": max_loaded_at,
-            "snapshotted_at": snapshotted_at,
-            "age": age,
+    def calculate_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        manifest: Optional[Manifest] = None,
+    ) -> Tuple[Optional[AdapterResponse], List[Optional[FreshnessResponse]]]:
+        """Calculate the freshness of many sources with one query. Each source
+        is a (relation, loaded_at_field, filter) tuple, and its freshness is
+        returned at the same position, or None if its max loaded_at_field
+        isn't a timestamp so the source should be checked on its own.
+        """
+        kwargs: Dict[str, Any] = {
+            "sources": [
+                {"source": source, "loaded_at_field": loaded_at_field, "filter": filter}
+                for source, loaded_at_field, filter in sources
+            ]
         }
-        return adapter_response, freshness
+        result = self.execute_macro(FRESHNESS_BATCH_MACRO_NAME, kwargs=kwargs, manifest=manifest)
+        adapter_response, table = result.response, result.table  # type: ignore[attr-defined]
+        # a 1-row table with the maximum `loaded_at_field` value of each source,
+        # and then the current time according to the db
+        if len(table) != 1 or len(table[0]) != len(sources) + 1:
+            raise MacroResultError(FRESHNESS_BATCH_MACRO_NAME, table)
+
+        row = table[0]
+        snapshotted_at = _utc(row[-1], None, "snapshotted_at")
+        freshnesses: List[Optional[FreshnessResponse]] = []
+        for (source, loaded_at_field, _), max_loaded_at in zip(sources, row):
+            try:
+                freshness = self._freshness_response(
+                    max_loaded_at, snapshotted_at, source, loaded_at_field
+                )
+            except UnexpectedNonTimestampError:
+                freshnesses.append(None)
+            else:
+                freshnesses.append(freshness)
+        return adapter_response, freshnesses
 
     def calculate_freshness_from_metadata(
         self,
@@ -1276,24 +1331,76 @@ class BaseAdapter(metaclass=AdapterMeta):
         except Exception:
             raise MacroResultError(GET_RELATION_LAST_MODIFIED_MACRO_NAME, table)
 
-        if last_modified_val is None:
-            # Interpret missing value as "infinitely long ago"
+        freshness = self._freshness_response(
+            last_modified_val, snapshotted_at_val, None, "last_modified"
+        )
+        return adapter_response, freshness
+
+    def calculate_freshness_from_metadata_batch(
+        self,
+        sources: List[BaseRelation],
+        manifest: Optional[Manifest] = None,
+    ) -> Tuple[Optional[AdapterResponse], Dict[BaseRelation, FreshnessResponse]]:
+        """Calculate the freshness of many sources with one metadata query.
+        The sources must share an information schema, and the macro's rows
+        must have schema and identifier columns to match them back up; any
+        source without a row is left out of the result.
+        """
+        kwargs: Dict[str, Any] = {
+            "information_schema": sources[0].information_schema_only(),
+            "relations": sources,
+        }
+        result = self.execute_macro(
+            GET_RELATION_LAST_MODIFIED_MACRO_NAME, kwargs=kwargs, manifest=manifest
+        )
+        adapter_response, table = result.response, result.table  # type: ignore[attr-defined]
+
+        sources_by_name = {
+            (
+                source.path.get_lowered_part(ComponentName.Schema),
+                source.path.get_lowered_part(ComponentName.Identifier),
+            ): source
+            for source in sources
+        }
+        freshnesses: Dict[BaseRelation, FreshnessResponse] = {}
+        for row in table:
+            try:
+                schema = get_column_value_uncased("schema", row)
+                identifier = get_column_value_uncased("identifier", row)
+                last_modified_val = get_column_value_uncased("last_modified", row)
+                snapshotted_at_val = get_column_value_uncased("snapshotted_at", row)
+            except Exception:
+                raise MacroResultError(GET_RELATION_LAST_MODIFIED_MACRO_NAME, table)
+
+            source = sources_by_name.get((str(schema).lower(), str(identifier).lower()))
+            if source is not None:
+                freshnesses[source] = self._freshness_response(
+                    last_modified_val, snapshotted_at_val, None, "last_modified"
+                )
+        return adapter_response, freshnesses
+
+    @staticmethod
+    def _freshness_response(
+        max_loaded_at_val: Any,
+        snapshotted_at_val: Any,
+        source: Optional[BaseRelation],
+        field_name: str,
+    ) -> FreshnessResponse:
+        if max_loaded_at_val is None:
+            # no records in the table, so really the max_loaded_at was
+            # infinitely long ago. Just call it 0:00 January 1 year UTC
             max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
         else:
-            max_loaded_at = _utc(last_modified_val, None, "last_modified")
-
-        snapshotted_at = _utc(snapshotted_at_val, None, "snapshotted_at")
+            max_loaded_at = _utc(max_loaded_at_val, source, field_name)
 
+        snapshotted_at = _utc(snapshotted_at_val, source, field_name)
         age = (snapshotted_at - max_loaded_at).total_seconds()
-
-        freshness: FreshnessResponse = {
+        return {
             "max_loaded_at": max_loaded_at,
             "snapshotted_at": snapshotted_at,
             "age": age,
         }
 
-        return adapter_response, freshness
-
     def pre_model_hook(self, config: Mapping[str, Any]) -> Any:
         """A hook for running some operation before the model materialization
         runs. The hook can assume it has a connection available.
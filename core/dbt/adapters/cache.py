@@ -169,6 +169,10 @@ class RelationsCache:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
         self.lock = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
+        # the known relations by their (lowercased) database and schema
+        self._relations_by_schema: Dict[
+            Tuple[Optional[str], Optional[str]], Dict[_ReferenceKey, _CachedRelation]
+        ] = {}
 
     def add_schema(
         self,
@@ -240,7 +244,28 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
-        return self.relations.setdefault(key, relation)
+        if key not in self.relations:
+            self._set_relation(key, relation)
+        return self.relations[key]
+
+    def _set_relation(self, key: _ReferenceKey, relation: _CachedRelation) -> None:
+        """Store a relation under the given key, and index it by its schema.
+        Callers should hold the lock.
+        """
+        self.relations[key] = relation
+        self._relations_by_schema.setdefault((key.database, key.schema), {})[key] = relation
+
+    def _pop_relation(self, key: _ReferenceKey) -> _CachedRelation:
+        """Remove and return the relation stored under the given key. Callers
+        should hold the lock.
+        """
+        relation = self.relations.pop(key)
+        schema_key = (key.database, key.schema)
+        in_schema = self._relations_by_schema[schema_key]
+        del in_schema[key]
+        if not in_schema:
+            del self._relations_by_schema[schema_key]
+        return relation
 
     def _add_link(self, referenced_key, dependent_key):
         """Add a link between two relations to the database. Both the old and
@@ -341,7 +366,7 @@ class RelationsCache:
         """
         # remove direct refs
         for key in keys:
-            del self.relations[key]
+            self._pop_relation(key)
         # then remove all entries from each child
         for cached in self.relations.values():
             cached.release_references(keys)
@@ -385,7 +410,7 @@ class RelationsCache:
         # previously referenced by old_name to be referenced by new_name.
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
-        relation = self.relations.pop(old_key)
+        relation = self._pop_relation(old_key)
         new_key = new_relation.key()
 
         # relation has to rename its innards, so it needs the _CachedRelation.
@@ -404,7 +429,7 @@ class RelationsCache:
 
                 cached.rename_key(old_key, new_key)
 
-        self.relations[new_key] = relation
+        self._set_relation(new_key, relation)
         # also fixup the schemas!
         self.add_schema(new_key.database, new_key.schema)
 
@@ -478,14 +503,10 @@ class RelationsCache:
         :return List[BaseRelation]: The list of relations with the given
             schema
         """
-        database = lowercase(database)
-        schema = lowercase(schema)
+        key = (lowercase(database), lowercase(schema))
         with self.lock:
-            results = [
-                r.inner
-                for r in self.relations.values()
-                if (lowercase(r.schema) == schema and lowercase(r.database) == database)
-            ]
+            in_schema = self._relations_by_schema.get(key)
+            results = [r.inner for r in in_schema.values()] if in_schema else []
 
         if None in results:
             raise NoneRelationFoundError()
@@ -495,6 +516,7 @@ class RelationsCache:
         """Clear the cache"""
         with self.lock:
             self.relations.clear()
+            self._relations_by_schema.clear()
             self.schemas.clear()
 
     def _list_relations_in_schema(
@@ -502,12 +524,7 @@ class RelationsCache:
     ) -> List[_CachedRelation]:
         """Get the relations in a schema. Callers should hold the lock."""
         key = (lowercase(database), lowercase(schema))
-
-        to_remove: List[_CachedRelation] = []
-        for cachekey, relation in self.relations.items():
-            if (cachekey.database, cachekey.schema) == key:
-                to_remove.append(relation)
-        return to_remove
+        return list(self._relations_by_schema.get(key, {}).values())
 
     def _remove_all(self, to_remove: List[_CachedRelation]):
         """Remove all the listed relations. Ignore relations that have been
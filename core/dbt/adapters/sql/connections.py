@@ -1,12 +1,14 @@
 import abc
 import time
-from typing import List, Optional, Tuple, Any, Iterable, Dict
+from typing import List, Optional, Tuple, Any, Iterable, Iterator, Dict
 
 import agate
 
 import dbt.clients.agate_helper
 import dbt.exceptions
 from dbt.adapters.base import BaseConnectionManager
+from dbt.adapters.base.connections import DEFAULT_STREAM_BATCH_SIZE
+from dbt.clients.agate_helper import ResultStream
 from dbt.contracts.connection import Connection, ConnectionState, AdapterResponse
 from dbt.events.functions import fire_event
 from dbt.events.types import ConnectionUsed, SQLQuery, SQLCommit, SQLQueryStatus
@@ -101,6 +103,11 @@ class SQLConnectionManager(BaseConnectionManager):
     def process_results(
         cls, column_names: Iterable[str], rows: Iterable[Any]
     ) -> List[Dict[str, Any]]:
+        cls.deduplicate_column_names(column_names)
+        return [dict(zip(column_names, row)) for row in rows]
+
+    @classmethod
+    def deduplicate_column_names(cls, column_names: Iterable[str]) -> None:
         # TODO CT-211
         unique_col_names = dict()  # type: ignore[var-annotated]
         # TODO CT-211
@@ -114,11 +121,10 @@ class SQLConnectionManager(BaseConnectionManager):
             else:
                 # TODO CT-211
                 unique_col_names[column_names[idx]] = 1  # type: ignore[index]
-        return [dict(zip(column_names, row)) for row in rows]
 
     @classmethod
     def get_result_from_cursor(cls, cursor: Any, limit: Optional[int]) -> agate.Table:
-        data: List[Any] = []
+        rows: List[Any] = []
         column_names: List[str] = []
 
         if cursor.description is not None:
@@ -127,9 +133,19 @@ class SQLConnectionManager(BaseConnectionManager):
                 rows = cursor.fetchmany(limit)
             else:
                 rows = cursor.fetchall()
+
+        return cls.table_from_cursor_rows(column_names, rows)
+
+    @classmethod
+    def table_from_cursor_rows(cls, column_names: List[str], rows: List[Any]) -> agate.Table:
+        # adapters that post-process rows in process_results get them as dicts
+        process_results = cls.process_results.__func__  # type: ignore[attr-defined]
+        if process_results is not SQLConnectionManager.process_results.__func__:  # type: ignore
             data = cls.process_results(column_names, rows)
+            return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
 
-        return dbt.clients.agate_helper.table_from_data_flat(data, column_names)
+        cls.deduplicate_column_names(column_names)
+        return dbt.clients.agate_helper.table_from_result(rows, column_names)
 
     def execute(
         self, sql: str, auto_begin: bool = False, fetch: bool = False, limit: Optional[int] = None
@@ -143,6 +159,44 @@ class SQLConnectionManager(BaseConnectionManager):
             table = dbt.clients.agate_helper.empty_table()
         return response, table
 
+    def add_streaming_query(self, sql: str, auto_begin: bool = False) -> Tuple[Connection, Any]:
+        """Run sql for execute_stream, which reads its results from the
+        returned cursor with fetchmany. Adapters whose drivers only send rows
+        as they are fetched with a server-side cursor should use one here.
+        """
+        return self.add_query(sql, auto_begin)
+
+    def fetch_batches(
+        self, sql: str, cursor: Any, limit: Optional[int], batch_size: int
+    ) -> Iterator[agate.Table]:
+        fetched = 0
+        try:
+            while True:
+                size = batch_size if limit is None else min(batch_size, limit - fetched)
+                with self.exception_handler(sql):
+                    rows = cursor.fetchmany(size) if size > 0 else []
+                # an empty batch is only worth yielding for its column names
+                if rows or not fetched:
+                    column_names = [col[0] for col in cursor.description or []]
+                    yield self.table_from_cursor_rows(column_names, rows)
+                fetched += len(rows)
+                if len(rows) < size or fetched == limit:
+                    break
+        finally:
+            cursor.close()
+
+    def execute_stream(
+        self,
+        sql: str,
+        auto_begin: bool = False,
+        limit: Optional[int] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+    ) -> Tuple[AdapterResponse, ResultStream]:
+        sql = self._add_query_comment(sql)
+        _, cursor = self.add_streaming_query(sql, auto_begin)
+        stream = ResultStream(self.fetch_batches(sql, cursor, limit, batch_size))
+        return self.get_response(cursor), stream
+
     def add_begin_query(self):
         return self.add_query("BEGIN", auto_begin=False)
 
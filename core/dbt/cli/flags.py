@@ -381,6 +381,7 @@ def command_args(command: CliCommand) -> ArgsList:
         CliCommand.CLEAN: cli.clean,
         CliCommand.CLONE: cli.clone,
         CliCommand.COMPILE: cli.compile,
+        CliCommand.DAEMON: cli.daemon,
         CliCommand.DOCS_GENERATE: cli.docs_generate,
         CliCommand.DOCS_SERVE: cli.docs_serve,
         CliCommand.DEBUG: cli.debug,
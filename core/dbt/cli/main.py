@@ -1,8 +1,11 @@
 import functools
+import queue
+import threading
 from copy import copy
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+import agate
 import click
 from click.exceptions import (
     Exit as ClickExit,
@@ -17,15 +20,19 @@ from dbt.cli.exceptions import (
     DbtUsageException,
 )
 from dbt.contracts.graph.manifest import Manifest
+from dbt.contracts.graph.nodes import ResultNode
 from dbt.contracts.results import (
     CatalogArtifact,
+    NodeStatus,
     RunExecutionResult,
 )
 from dbt.events.base_types import EventMsg
+from dbt.exceptions import DbtRuntimeError
 from dbt.task.build import BuildTask
 from dbt.task.clean import CleanTask
 from dbt.task.clone import CloneTask
 from dbt.task.compile import CompileTask
+from dbt.task.daemon import DaemonTask
 from dbt.task.debug import DebugTask
 from dbt.task.deps import DepsTask
 from dbt.task.freshness import FreshnessTask
@@ -71,11 +78,15 @@ class dbtRunner:
         if callbacks is None:
             callbacks = []
         self.callbacks = callbacks
+        # Anything else to set on the click context, e.g. the saved manifest and
+        # file diff a long-lived process hands to partial parsing
+        self.context_obj: Dict[str, Any] = {}
 
     def invoke(self, args: List[str], **kwargs) -> dbtRunnerResult:
         try:
             dbt_ctx = cli.make_context(cli.name, args)
             dbt_ctx.obj = {
+                **self.context_obj,
                 "manifest": self.manifest,
                 "callbacks": self.callbacks,
             }
@@ -118,9 +129,68 @@ class dbtRunner:
                 success=False,
             )
 
+    def stream_show(self, args: List[str], **kwargs) -> Iterator[Tuple[ResultNode, agate.Table]]:
+        """Run `dbt show --stream` with args, yielding each node and each
+        batch of its results as they are fetched. dbt runs in a background
+        thread that waits for each batch to be taken before fetching the next,
+        and closing the iterator early makes the rest of the command fail.
+
+        Raises the command's exception, or a DbtRuntimeError for the nodes
+        that errored, if it doesn't succeed.
+        """
+        batches: "queue.Queue[Tuple[ResultNode, agate.Table]]" = queue.Queue(maxsize=1)
+        closed = threading.Event()
+        finished = threading.Event()
+        results: List[dbtRunnerResult] = []
+
+        def put(node: ResultNode, batch: agate.Table) -> None:
+            while not closed.is_set():
+                try:
+                    batches.put((node, batch), timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise DbtRuntimeError("Stopped streaming the results of dbt show")
+
+        runner = copy(self)
+        runner.context_obj = {**self.context_obj, "show_batch_callback": put}
+
+        def run() -> None:
+            try:
+                results.append(runner.invoke(["show", "--stream", *args], **kwargs))
+            finally:
+                finished.set()
+
+        thread = threading.Thread(target=run, name="dbt-show-stream", daemon=True)
+        thread.start()
+        try:
+            while True:
+                try:
+                    yield batches.get(timeout=0.1)
+                except queue.Empty:
+                    if finished.is_set() and batches.empty():
+                        break
+        finally:
+            closed.set()
+            thread.join()
+
+        result = results[0]
+        if result.exception is not None:
+            raise result.exception
+        if not result.success:
+            errors = []
+            if isinstance(result.result, RunExecutionResult):
+                errors = [
+                    f"{r.node.unique_id}: {r.message}"
+                    for r in result.result.results
+                    if r.status == NodeStatus.Error
+                ]
+            raise DbtRuntimeError("dbt show failed: " + "; ".join(errors))
+
 
 # approach from https://github.com/pallets/click/issues/108#issuecomment-280489786
 def global_flags(func):
+    @p.cache_compiled_templates
     @p.cache_selected_only
     @p.debug
     @p.deprecated_print
@@ -133,6 +203,7 @@ def global_flags(func):
     @p.log_level_file
     @p.log_path
     @p.macro_debugging
+    @p.parse_workers
     @p.partial_parse
     @p.partial_parse_file_path
     @p.partial_parse_file_diff
@@ -140,13 +211,16 @@ def global_flags(func):
     @p.print
     @p.printer_width
     @p.quiet
+    @p.read_files_threads
     @p.record_timing_info
+    @p.scheduler
     @p.send_anonymous_usage_stats
     @p.single_threaded
     @p.static_parser
     @p.use_colors
     @p.use_colors_file
     @p.use_experimental_parser
+    @p.verify_skipped_files
     @p.version
     @p.version_check
     @p.write_json
@@ -245,6 +319,34 @@ def clean(ctx, **kwargs):
     return results, success
 
 
+# dbt daemon
+@cli.command("daemon")
+@click.pass_context
+@global_flags
+@p.profile
+@p.profiles_dir
+@p.project_dir
+@p.socket_path
+@p.target
+@p.target_path
+@p.vars
+@requires.postflight
+@requires.preflight
+@requires.profile
+@requires.project
+@requires.runtime_config
+def daemon(ctx, **kwargs):
+    """Keep the project parsed in a long-lived process and run commands sent to it over a unix socket"""
+    task = DaemonTask(
+        ctx.obj["flags"],
+        ctx.obj["runtime_config"],
+    )
+
+    results = task.run()
+    success = task.interpret_results(results)
+    return results, success
+
+
 # dbt docs
 @cli.group()
 @click.pass_context
@@ -335,7 +437,7 @@ def docs_serve(ctx, **kwargs):
 @p.favor_state
 @p.deprecated_favor_state
 @p.full_refresh
-@p.show_output_format
+@p.compile_output_format
 @p.indirect_selection
 @p.introspect
 @p.profile
@@ -384,6 +486,7 @@ def compile(ctx, **kwargs):
 @p.full_refresh
 @p.show_output_format
 @p.show_limit
+@p.show_stream
 @p.indirect_selection
 @p.introspect
 @p.profile
@@ -412,6 +515,7 @@ def show(ctx, **kwargs):
         ctx.obj["flags"],
         ctx.obj["runtime_config"],
         ctx.obj["manifest"],
+        batch_callback=ctx.obj.get("show_batch_callback"),
     )
 
     results = task.run()
@@ -814,6 +918,7 @@ def source(ctx, **kwargs):
 @source.command("freshness")
 @click.pass_context
 @global_flags
+@p.freshness_batch
 @p.exclude
 @p.output_path  # TODO: Is this ok to re-use?  We have three different output params, how much can we consolidate?
 @p.profile
@@ -26,6 +26,13 @@ browser = click.option(
     default=True,
 )
 
+cache_compiled_templates = click.option(
+    "--cache-compiled-templates/--no-cache-compiled-templates",
+    envvar="DBT_CACHE_COMPILED_TEMPLATES",
+    help="Store the compiled python code of Jinja templates in the target directory, so that later invocations can skip Jinja compilation. This saves only a few percent of parse time once the cache is warm, and filling the cache makes the first invocation slower.",
+    default=False,
+)
+
 cache_selected_only = click.option(
     "--cache-selected-only/--no-cache-selected-only",
     envvar="DBT_CACHE_SELECTED_ONLY",
@@ -125,6 +132,13 @@ deprecated_favor_state = click.option(
     help="Internal flag for deprecating old env var.",
 )
 
+freshness_batch = click.option(
+    "--batch",
+    envvar=None,
+    help="Check the freshness of sources that share a schema together, with one query per batch of sources, instead of one query per source. Uses the collect_freshness_batch macro in place of collect_freshness.",
+    is_flag=True,
+)
+
 full_refresh = click.option(
     "--full-refresh",
     "-f",
@@ -232,14 +246,22 @@ output = click.option(
     default="selector",
 )
 
-show_output_format = click.option(
+compile_output_format = click.option(
     "--output",
     envvar=None,
-    help="Output format for dbt compile and dbt show",
+    help="Output format for dbt compile",
     type=click.Choice(["json", "text"], case_sensitive=False),
     default="text",
 )
 
+show_output_format = click.option(
+    "--output",
+    envvar=None,
+    help="Output format for dbt show",
+    type=click.Choice(["json", "text", "csv"], case_sensitive=False),
+    default="text",
+)
+
 show_limit = click.option(
     "--limit",
     envvar=None,
@@ -248,6 +270,13 @@ show_limit = click.option(
     default=5,
 )
 
+show_stream = click.option(
+    "--stream",
+    envvar=None,
+    help="Fetch the results of dbt show in batches, printing each batch as it arrives, instead of fetching them all before printing. Use with --limit -1 to show large results without holding them in memory.",
+    is_flag=True,
+)
+
 output_keys = click.option(
     "--output-keys",
     envvar=None,
@@ -270,6 +299,14 @@ output_path = click.option(
     default=None,
 )
 
+parse_workers = click.option(
+    "--parse-workers",
+    envvar="DBT_PARSE_WORKERS",
+    help="Specify the number of processes used to parse model files. The manifest is the same for any number of processes. Only used on platforms that can fork processes.",
+    default=1,
+    type=click.IntRange(min=1),
+)
+
 partial_parse = click.option(
     "--partial-parse/--no-partial-parse",
     envvar="DBT_PARTIAL_PARSE",
@@ -373,6 +410,14 @@ quiet = click.option(
     help="Suppress all non-error logging to stdout. Does not affect {{ print() }} macro calls.",
 )
 
+read_files_threads = click.option(
+    "--read-files-threads",
+    envvar="DBT_READ_FILES_THREADS",
+    help="Specify the number of threads used to read project files while parsing. More threads can make parsing faster on slow file systems.",
+    default=1,
+    type=click.IntRange(min=1),
+)
+
 record_timing_info = click.option(
     "--record-timing-info",
     "-r",
@@ -437,6 +482,14 @@ selector = click.option(
     help="The selector name to use, as defined in selectors.yml",
 )
 
+scheduler = click.option(
+    "--scheduler",
+    envvar="DBT_SCHEDULER",
+    help="Specify the order in which to run nodes that are ready. 'depth' runs the nodes closest to the roots of the DAG first. 'critical-path' runs the nodes with the longest chain of work left below them first, using execution times from the run_results.json in the target path.",
+    type=click.Choice(["depth", "critical-path"], case_sensitive=False),
+    default="depth",
+)
+
 send_anonymous_usage_stats = click.option(
     "--send-anonymous-usage-stats/--no-send-anonymous-usage-stats",
     envvar="DBT_SEND_ANONYMOUS_USAGE_STATS",
@@ -486,6 +539,13 @@ empty_catalog = click.option(
     is_flag=True,
 )
 
+socket_path = click.option(
+    "--socket-path",
+    envvar="DBT_SOCKET_PATH",
+    help="The unix socket `dbt daemon` listens on. Defaults to dbt-daemon.sock in the target path.",
+    type=click.Path(dir_okay=False),
+)
+
 source = click.option(
     "--source",
     envvar=None,
@@ -615,6 +675,13 @@ def _version_callback(ctx, _param, value):
     ctx.exit()
 
 
+verify_skipped_files = click.option(
+    "--verify-skipped-files/--no-verify-skipped-files",
+    envvar="DBT_VERIFY_SKIPPED_FILES",
+    help="When partial parsing, project files whose modification time, size and inode are unchanged are not read again. If set, these files are hashed in the background while the other files are read, and any that have changed are read again.",
+    default=False,
+)
+
 version = click.option(
     "--version",
     "-V",
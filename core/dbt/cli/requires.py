@@ -1,5 +1,7 @@
 import dbt.tracking
 from dbt.version import installed as installed_version
+from dbt.clients.jinja import set_bytecode_cache_dir
+from dbt.constants import JINJA_BYTECODE_CACHE_DIR
 from dbt.adapters.factory import adapter_management, register_adapter
 from dbt.flags import set_flags, get_flag_dict
 from dbt.cli.exceptions import (
@@ -30,8 +32,11 @@ from dbt.plugins import set_up_plugin_manager, get_plugin_manager
 from click import Context
 from functools import update_wrapper
 import importlib.util
+import json
+import os
 import time
 import traceback
+from typing import Any, Callable, Tuple
 
 
 def preflight(func):
@@ -153,6 +158,26 @@ def unset_profile(func):
     return update_wrapper(wrapper, func)
 
 
+def _config_key(flags) -> Tuple:
+    threads = getattr(flags, "THREADS", None)
+    vars = json.dumps(flags.VARS, sort_keys=True, default=str)
+    return (flags.PROJECT_DIR, vars, flags.PROFILE, flags.TARGET, threads)
+
+
+def _cached(ctx: Context, key: Tuple, load: Callable[[], Any]) -> Any:
+    """Return load(), or the result it returned for the same key before if the
+    context has a config_cache. A long-lived process, like `dbt daemon`, sets
+    one to keep profiles and projects between invocations, and clears it when
+    their files change.
+    """
+    cache = ctx.obj.get("config_cache")
+    if cache is None:
+        return load()
+    if key not in cache:
+        cache[key] = load()
+    return cache[key]
+
+
 def profile(func):
     def wrapper(*args, **kwargs):
         ctx = args[0]
@@ -162,7 +187,13 @@ def profile(func):
         # TODO: Generalize safe access to flags.THREADS:
         # https://github.com/dbt-labs/dbt-core/issues/6259
         threads = getattr(flags, "THREADS", None)
-        profile = load_profile(flags.PROJECT_DIR, flags.VARS, flags.PROFILE, flags.TARGET, threads)
+        profile = _cached(
+            ctx,
+            ("profile", *_config_key(flags)),
+            lambda: load_profile(
+                flags.PROJECT_DIR, flags.VARS, flags.PROFILE, flags.TARGET, threads
+            ),
+        )
         ctx.obj["profile"] = profile
 
         return func(*args, **kwargs)
@@ -181,8 +212,18 @@ def project(func):
             raise DbtProjectError("profile required for project")
 
         flags = ctx.obj["flags"]
-        project = load_project(
-            flags.PROJECT_DIR, flags.VERSION_CHECK, ctx.obj["profile"], flags.VARS
+        profile = ctx.obj["profile"]
+        # The project renders with the profile's target, which depends on the
+        # same options, unless the command runs without a profile
+        project = _cached(
+            ctx,
+            (
+                "project",
+                isinstance(profile, UnsetProfile),
+                flags.VERSION_CHECK,
+                *_config_key(flags),
+            ),
+            lambda: load_project(flags.PROJECT_DIR, flags.VERSION_CHECK, profile, flags.VARS),
         )
         ctx.obj["project"] = project
 
@@ -222,6 +263,15 @@ def runtime_config(func):
 
         ctx.obj["runtime_config"] = config
 
+        # Compiled jinja templates are stored in the target directory when
+        # opted into. Always set, since jinja environments outlive invocations.
+        flags = ctx.obj["flags"]
+        set_bytecode_cache_dir(
+            os.path.join(config.project_target_path, JINJA_BYTECODE_CACHE_DIR)
+            if flags.CACHE_COMPILED_TEMPLATES and not flags.MACRO_DEBUGGING
+            else None
+        )
+
         if dbt.tracking.active_user is not None:
             adapter_type = (
                 getattr(config.credentials, "type", None)
@@ -270,6 +320,8 @@ def manifest(*args0, write=True, write_perf_info=False):
             if ctx.obj.get("manifest") is None:
                 manifest = ManifestLoader.get_full_manifest(
                     runtime_config,
+                    file_diff=ctx.obj.get("file_diff"),
+                    saved_manifest=ctx.obj.get("saved_manifest"),
                     write_perf_info=write_perf_info,
                 )
 
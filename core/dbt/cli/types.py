@@ -9,6 +9,7 @@ class Command(Enum):
     CLEAN = "clean"
     COMPILE = "compile"
     CLONE = "clone"
+    DAEMON = "daemon"
     DOCS_GENERATE = "generate"
     DOCS_SERVE = "serve"
     DEBUG = "debug"
@@ -1,11 +1,15 @@
 from codecs import BOM_UTF8
+from contextlib import contextmanager
 
 import agate
 import datetime
+import decimal
 import isodate
+import itertools
 import json
 import dbt.utils
-from typing import Iterable, List, Dict, Union, Optional, Any
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Dict, Sequence, Tuple, Union, Optional, Any
 
 from dbt.exceptions import DbtRuntimeError
 
@@ -137,6 +141,116 @@ def table_from_data_flat(data, column_names: Iterable[str]) -> agate.Table:
     )
 
 
+# the column types table_from_data_flat infers for values that aren't strings
+_RESULT_TYPE_TESTER = build_type_tester((), string_null_values=())
+_RESULT_TEXT_TYPE = agate.data_types.Text(null_values=())
+
+
+def _result_column(values: List[Any]) -> Tuple[List[Any], agate.data_types.DataType]:
+    kinds = set(map(type, values))
+    kinds.discard(type(None))
+    if kinds == {str}:
+        return values, _RESULT_TEXT_TYPE
+    if kinds <= {int, float, decimal.Decimal} or (
+        len(kinds) == 1 and kinds <= {bool, datetime.date, datetime.datetime}
+    ):
+        # values of these types pass or fail each type's test whatever their
+        # value, so one value of each type decides the column's type
+        samples = [(next(v for v in values if type(v) is kind),) for kind in kinds]
+        column_type = _RESULT_TYPE_TESTER.run(samples, ["column"])[0]
+        if kinds <= {int}:
+            return values, column_type
+        return list(map(column_type.cast, values)), column_type
+
+    if any(isinstance(v, (dict, list, tuple, str)) for v in values):
+        values = [
+            json.dumps(v, cls=dbt.utils.JSONEncoder) if isinstance(v, (dict, list, tuple)) else v
+            for v in values
+        ]
+        column_type = _RESULT_TEXT_TYPE
+    else:
+        column_type = _RESULT_TYPE_TESTER.run([(v,) for v in values], ["column"])[0]
+    return [column_type.cast(v) for v in values], column_type
+
+
+class ResultTable(agate.Table):
+    """An agate.Table of query results, held as columns of already cast values.
+
+    Its agate rows and columns are only built the first time they are used.
+    Column names and types, len() and as_matrix() don't need them.
+    """
+
+    def __init__(
+        self,
+        columns: List[List[Any]],
+        column_names: Sequence[str],
+        column_types: Sequence[agate.data_types.DataType],
+    ) -> None:
+        self._data = columns
+        self._column_names = tuple(column_names)
+        self._column_types = tuple(column_types)
+
+    def __len__(self) -> int:
+        return len(self._data[0]) if self._data else 0
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in ("_rows", "_columns", "_row_names"):
+            raise AttributeError(name)
+        rows = [agate.Row(values, self._column_names) for values in self.matrix()]
+        agate.Table.__init__(
+            self, rows, self._column_names, self._column_types, _is_fork=True  # type: ignore
+        )
+        return getattr(self, name)
+
+    def matrix(self) -> List[Tuple[Any, ...]]:
+        return list(zip(*self._data))
+
+
+def table_from_result(rows: Sequence[Sequence[Any]], column_names: Sequence[str]) -> agate.Table:
+    """Build a ResultTable from the rows of a query result, as returned by a
+    cursor. Column types and values are the same as table_from_data_flat
+    would give for the same rows, without building a dict per row.
+    """
+    columns = [
+        _result_column(list(map(itemgetter(idx), rows))) for idx in range(len(column_names))
+    ]
+    return ResultTable(
+        [values for values, _ in columns],
+        agate.utils.deduplicate(column_names, column_names=True),  # type: ignore[attr-defined]
+        [column_type for _, column_type in columns],
+    )
+
+
+class ResultStream:
+    """The rows of a query result, fetched in batches as they are iterated
+    over. Each batch is an agate.Table whose column types are inferred from
+    its own rows. The first batch is fetched up front, for column_names.
+
+    A stream can only be iterated over once.
+    """
+
+    def __init__(self, batches: Iterator[agate.Table]) -> None:
+        self._first: Optional[agate.Table] = next(batches, None)
+        self._batches = batches
+        self._consumed = False
+        self.column_names: Tuple[str, ...] = (
+            tuple(self._first.column_names) if self._first is not None else ()
+        )
+
+    def batches(self) -> Iterator[agate.Table]:
+        if self._consumed:
+            raise DbtRuntimeError("The rows of a query result can only be streamed once")
+        self._consumed = True
+        first, self._first = self._first, None
+        if first is not None:
+            yield first
+        yield from self._batches
+
+    def __iter__(self) -> Iterator[agate.Row]:
+        for batch in self.batches():
+            yield from batch.rows
+
+
 def empty_table():
     "Returns an empty Agate table. To be used in place of None"
 
@@ -146,7 +260,11 @@ def empty_table():
 def as_matrix(table):
     "Return an agate table as a matrix of data sans columns"
 
-    return [r.values() for r in table.rows.values()]
+    if isinstance(table, ResultTable):
+        return table.matrix()
+    # only the sampled rows of a streamed csv are held in memory
+    rows = table.sample_rows if isinstance(table, CsvTable) else table.rows
+    return [r.values() for r in rows.values()]
 
 
 def from_csv(abspath, text_columns, delimiter=","):
@@ -157,6 +275,254 @@ def from_csv(abspath, text_columns, delimiter=","):
         return agate.Table.from_csv(fp, column_types=type_tester, delimiter=delimiter)
 
 
+# Larger seeds infer their column types from this many rows (unless asked to
+# scan the whole file), and are read and cast this many rows at a time.
+SEED_SAMPLE_SIZE = 10000
+SEED_CHUNK_SIZE = 10000
+
+
+@contextmanager
+def _open_csv(abspath: str, delimiter: str) -> Iterator[Iterator[List[str]]]:
+    with open(abspath, encoding="utf-8") as fp:
+        if fp.read(1) != BOM:
+            fp.seek(0)
+        yield agate.csv.reader(fp, delimiter=delimiter)  # type: ignore[attr-defined]
+
+
+class CsvRows:
+    """The rows of a csv file, read and cast to the given column types
+    `chunk_size` rows at a time each time they are iterated over.
+
+    `integer_columns` are Number columns that held no decimals when the column
+    types were inferred. A decimal in one of them stops the load, as adapters
+    would have created an integer column for it. Likewise `max_lengths` holds
+    the longest text in the sample for Text columns whose agate.MaxLength has
+    been read, and a longer value stops the load. `sample_size` is the number
+    of rows the column types were inferred from, if not every row.
+
+    Indexing the rows reads all of them into memory, once.
+    """
+
+    def __init__(
+        self,
+        abspath: str,
+        delimiter: str,
+        column_names: Sequence[str],
+        column_types: Sequence[agate.data_types.DataType],
+        chunk_size: int = SEED_CHUNK_SIZE,
+        sample_size: Optional[int] = None,
+    ) -> None:
+        self.abspath = abspath
+        self.delimiter = delimiter
+        self.column_names = column_names
+        self.column_types = column_types
+        self.chunk_size = chunk_size
+        self.integer_columns: Sequence[int] = ()
+        self.max_lengths: Dict[int, decimal.Decimal] = {}
+        self.sample_size = sample_size
+        self._length: Optional[int] = None
+        self._loaded: Optional[agate.MappedSequence] = None
+
+    def __iter__(self) -> Iterator[agate.Row]:
+        if self._loaded is not None:
+            yield from self._loaded
+            return
+        count = 0
+        with _open_csv(self.abspath, self.delimiter) as reader:
+            next(reader, None)
+            while True:
+                rows = list(itertools.islice(reader, self.chunk_size))
+                if not rows:
+                    break
+                yield from self._cast(rows, count).rows
+                count += len(rows)
+        self._length = count
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.load()[key]
+
+    def __len__(self) -> int:
+        if self._loaded is not None:
+            return len(self._loaded)
+        if self._length is None:
+            with _open_csv(self.abspath, self.delimiter) as reader:
+                self._length = max(sum(1 for _ in reader) - 1, 0)
+        return self._length
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded is not None
+
+    def load(self) -> agate.MappedSequence:
+        """Read every row into memory, for the agate APIs that need them all"""
+        if self._loaded is None:
+            self._loaded = agate.MappedSequence(list(self))
+        return self._loaded
+
+    def _cast(self, rows: List[List[str]], offset: int) -> agate.Table:
+        try:
+            chunk = agate.Table(rows, self.column_names, self.column_types)
+            for idx in self.integer_columns:
+                if chunk.aggregate(agate.MaxPrecision(idx)) > 0:  # type: ignore[attr-defined]
+                    raise ValueError(
+                        f"Column {self.column_names[idx]} has decimals, but had none "
+                        "when its type was inferred."
+                    )
+            for idx, max_length in self.max_lengths.items():
+                if chunk.aggregate(agate.MaxLength(idx)) > max_length:  # type: ignore[attr-defined]
+                    raise ValueError(
+                        f"Column {self.column_names[idx]} has values longer than "
+                        f"{max_length} characters, the longest when its type was inferred."
+                    )
+        except (agate.exceptions.CastError, ValueError) as exc:  # type: ignore[attr-defined]
+            msg = f"Could not load rows {offset + 1}-{offset + len(rows)} of {self.abspath}: {exc}"
+            if self.sample_size is not None:
+                msg += (
+                    f"\nColumn types were inferred from the first {self.sample_size} rows. "
+                    "Set `infer_types_from_all_rows: true` or `column_types` in this "
+                    "seed's config to account for every row."
+                )
+            raise DbtRuntimeError(msg)
+        return chunk
+
+
+class CsvTable(agate.Table):
+    """An agate.Table over every row of a csv file, whose column types were
+    inferred from a sample of its rows.
+
+    Its `rows` stream from disk each time they are iterated over, and so do
+    len() and iterating over the table. The agate.MaxPrecision and
+    agate.MaxLength aggregates that adapters use to pick column types are
+    computed over the sample, and the rows are checked against them as they
+    stream. Any other agate API reads every row into memory first, after
+    which aggregates are computed over every row too.
+    """
+
+    def __init__(self, sample: Sequence[Sequence[Any]], csv_rows: CsvRows) -> None:
+        self.sample = agate.Table(sample, csv_rows.column_names, csv_rows.column_types)
+        self.csv_rows = csv_rows
+        self._column_names = self.sample.column_names
+        self._column_types = self.sample.column_types
+        self._row_names = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in ("_rows", "_columns"):
+            raise AttributeError(name)
+        agate.Table.__init__(
+            self,
+            self.csv_rows.load(),
+            self._column_names,
+            self._column_types,
+            _is_fork=True,  # type: ignore
+        )
+        return getattr(self, name)
+
+    def __len__(self) -> int:
+        return len(self.csv_rows)
+
+    def __iter__(self) -> Iterator[agate.Row]:
+        return iter(self.csv_rows)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.csv_rows[key]
+
+    @property
+    def rows(self) -> CsvRows:  # type: ignore[override]
+        return self.csv_rows
+
+    @property
+    def sample_rows(self) -> agate.MappedSequence:
+        return self.sample.rows
+
+    def aggregate(self, aggregations: Any) -> Any:
+        if self.csv_rows.loaded:
+            return super().aggregate(aggregations)  # type: ignore[misc]
+        if isinstance(aggregations, agate.MaxPrecision):  # type: ignore[attr-defined]
+            return self.sample.aggregate(aggregations)  # type: ignore[attr-defined]
+        if isinstance(aggregations, agate.MaxLength):  # type: ignore[attr-defined]
+            max_length = self.sample.aggregate(aggregations)  # type: ignore[attr-defined]
+            column = self.sample.columns[aggregations._column_name]
+            self.csv_rows.max_lengths[column.index] = max_length
+            return max_length
+        return super().aggregate(aggregations)  # type: ignore[misc]
+
+
+def _widest_rows(
+    rows: Iterable[agate.Row], column_types: Sequence[agate.data_types.DataType]
+) -> List[agate.Row]:
+    """Return the rows holding the most precise number or the longest text in
+    each column, so that aggregates over a sample including them agree with
+    the whole table.
+    """
+    widest: Dict[int, Tuple[Any, int, agate.Row]] = {}
+    for row_idx, row in enumerate(rows):
+        for idx, column_type in enumerate(column_types):
+            value = row[idx]
+            if value is None:
+                continue
+            if isinstance(column_type, agate.data_types.Number):
+                width = agate.utils.max_precision([value])  # type: ignore[attr-defined]
+            elif isinstance(column_type, agate.data_types.Text):
+                width = len(value)
+            else:
+                continue
+            if idx not in widest or width > widest[idx][0]:
+                widest[idx] = (width, row_idx, row)
+    by_position = {row_idx: row for _, row_idx, row in widest.values()}
+    return [by_position[row_idx] for row_idx in sorted(by_position)]
+
+
+def seed_from_csv(
+    abspath,
+    text_columns,
+    delimiter=",",
+    full_scan: bool = False,
+    sample_size: int = SEED_SAMPLE_SIZE,
+    chunk_size: int = SEED_CHUNK_SIZE,
+) -> agate.Table:
+    """Load a seed's csv file without holding all of its rows in memory.
+
+    Files of up to `sample_size` rows are loaded as by `from_csv`. Larger
+    files return a CsvTable, with column types inferred from their first
+    `sample_size` rows, or from every row if `full_scan` is set.
+    """
+    with _open_csv(abspath, delimiter) as reader:
+        header: List[str] = next(reader, [])
+        sample = list(itertools.islice(reader, sample_size + 1))
+    if len(sample) <= sample_size:
+        return from_csv(abspath, text_columns, delimiter=delimiter)
+    sample.pop()
+
+    type_tester = build_type_tester(text_columns=text_columns)
+    column_names = agate.utils.deduplicate(header, column_names=True)  # type: ignore[attr-defined]
+    if full_scan:
+        with _open_csv(abspath, delimiter) as reader:
+            next(reader, None)
+            column_types = type_tester.run(reader, column_names)
+    else:
+        column_types = type_tester.run(sample, column_names)
+
+    csv_rows = CsvRows(
+        abspath,
+        delimiter,
+        column_names,
+        column_types,
+        chunk_size=chunk_size,
+        sample_size=None if full_scan else sample_size,
+    )
+    if full_scan:
+        # casting every row also counts them, for len(csv_rows)
+        sample.extend(row.values() for row in _widest_rows(csv_rows, column_types))
+    table = CsvTable(sample, csv_rows)
+    csv_rows.integer_columns = [
+        idx
+        for idx, column_type in enumerate(column_types)
+        if isinstance(column_type, agate.data_types.Number)
+        and table.aggregate(agate.MaxPrecision(idx)) == 0  # type: ignore[attr-defined]
+    ]
+    return table
+
+
 class _NullMarker:
     pass
 
@@ -11,7 +11,7 @@ import subprocess
 import sys
 import tarfile
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, List, NoReturn, Optional, Tuple, Type, Union
 
 import dbt.exceptions
 import requests
@@ -34,11 +34,100 @@ else:
     c_bool = None
 
 
+def _walk_files(
+    root_path: str,
+    relative_path_to_search: str,
+    ignore_spec: Optional[PathSpec] = None,
+) -> List[os.DirEntry]:
+    """Return the directory entries of the files under `relative_path_to_search`,
+    in the same order as os.walk. Directories matched by `ignore_spec` are not
+    walked, unless it has negated patterns, which could re-include files in them.
+    """
+    absolute_path_to_search = os.path.join(root_path, relative_path_to_search)
+    prune = ignore_spec is not None and not any(
+        pattern.include is False for pattern in ignore_spec.patterns
+    )
+    files: List[os.DirEntry] = []
+    # depth first, so the files are in the same order as os.walk
+    paths_to_walk = [absolute_path_to_search]
+    while paths_to_walk:
+        current_path = paths_to_walk.pop()
+        try:
+            with os.scandir(current_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if not is_dir:
+                files.append(entry)
+            elif not entry.is_symlink():
+                if prune and ignore_spec is not None:
+                    relative_dir = os.path.join(
+                        relative_path_to_search,
+                        os.path.relpath(entry.path, absolute_path_to_search),
+                        "",
+                    )
+                    if ignore_spec.match_file(relative_dir):
+                        continue
+                subdirectories.append(entry.path)
+        paths_to_walk.extend(reversed(subdirectories))
+    return files
+
+
+def walk_search_paths(
+    root_path: str,
+    relative_paths_to_search: Iterable[str],
+    ignore_spec: Optional[PathSpec] = None,
+) -> Dict[str, List[os.DirEntry]]:
+    """
+    Find the files under each of `relative_paths_to_search`, walking each
+    directory only once. Paths inside another path are taken from the walk
+    of the outer path. The result can be passed to `find_matching` as
+    `walked_files` to search it for different file patterns.
+    """
+    root_path = os.path.normpath(root_path)
+    normalized = {path: os.path.normpath(path) for path in relative_paths_to_search}
+    walked_files: Dict[str, List[os.DirEntry]] = {}
+    walked_normalized: Dict[str, str] = {}
+    # outer paths first
+    for path in sorted(normalized, key=lambda path: len(normalized[path])):
+        normalized_path = normalized[path]
+        outer = None
+        for walked_path, normalized_walked_path in walked_normalized.items():
+            if normalized_walked_path in (
+                os.curdir,
+                normalized_path,
+            ) or normalized_path.startswith(normalized_walked_path + os.sep):
+                outer = walked_path
+                break
+
+        if outer is None:
+            walked_files[path] = _walk_files(root_path, path, ignore_spec)
+        elif normalized[outer] == normalized_path:
+            walked_files[path] = walked_files[outer]
+        else:
+            prefix = os.path.join(root_path, normalized_path, "")
+            walked_files[path] = [
+                entry
+                for entry in walked_files[outer]
+                if os.path.normpath(entry.path).startswith(prefix)
+            ]
+        walked_normalized[path] = normalized_path
+    return walked_files
+
+
 def find_matching(
     root_path: str,
     relative_paths_to_search: List[str],
     file_pattern: str,
     ignore_spec: Optional[PathSpec] = None,
+    walked_files: Optional[Dict[str, List[os.DirEntry]]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Given an absolute `root_path`, a list of relative paths to that
@@ -53,6 +142,9 @@ def find_matching(
         { 'absolute_path': '/root/path/models/subdirectory/model_two.sql',
           'relative_path': 'subdirectory/model_two.sql',
           'searched_path': 'models' } ]
+
+    If `walked_files` is passed in (see `walk_search_paths`), the paths in
+    it are not walked again.
     """
     matching = []
     root_path = os.path.normpath(root_path)
@@ -60,34 +152,32 @@ def find_matching(
     reobj = re.compile(regex, re.IGNORECASE)
 
     for relative_path_to_search in relative_paths_to_search:
-        # potential speedup for ignore_spec
-        # if ignore_spec.matches(relative_path_to_search):
-        #     continue
         absolute_path_to_search = os.path.join(root_path, relative_path_to_search)
-        walk_results = os.walk(absolute_path_to_search)
-
-        for current_path, subdirectories, local_files in walk_results:
-            # potential speedup for ignore_spec
-            # relative_dir = os.path.relpath(current_path, root_path) + os.sep
-            # if ignore_spec.match(relative_dir):
-            #     continue
-            for local_file in local_files:
-                absolute_path = os.path.join(current_path, local_file)
-                relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
-                relative_path_to_root = os.path.join(relative_path_to_search, relative_path)
-
-                modification_time = os.path.getmtime(absolute_path)
-                if reobj.match(local_file) and (
-                    not ignore_spec or not ignore_spec.match_file(relative_path_to_root)
-                ):
-                    matching.append(
-                        {
-                            "searched_path": relative_path_to_search,
-                            "absolute_path": absolute_path,
-                            "relative_path": relative_path,
-                            "modification_time": modification_time,
-                        }
-                    )
+        if walked_files is not None and relative_path_to_search in walked_files:
+            files = walked_files[relative_path_to_search]
+        else:
+            files = _walk_files(root_path, relative_path_to_search, ignore_spec)
+
+        for entry in files:
+            if not reobj.match(entry.name):
+                continue
+            absolute_path = entry.path
+            relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
+            relative_path_to_root = os.path.join(relative_path_to_search, relative_path)
+            if ignore_spec and ignore_spec.match_file(relative_path_to_root):
+                continue
+
+            file_stat = entry.stat()
+            matching.append(
+                {
+                    "searched_path": relative_path_to_search,
+                    "absolute_path": absolute_path,
+                    "relative_path": relative_path,
+                    "modification_time": file_stat.st_mtime,
+                    "file_size": file_stat.st_size,
+                    "inode": file_stat.st_ino,
+                }
+            )
 
     return matching
 
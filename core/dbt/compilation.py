@@ -217,37 +217,90 @@ class Linker:
         #  \/       |  test2 ----|  |
         # test1 ----|---------------|
 
+        # Rather than walking the upstream nodes of every node, walk the graph
+        # once in topological order, and track as bitsets for each node:
+        #  - the upstream nodes that tests depend on
+        #  - the upstream tests whose dependencies are all upstream
+        #  - the other upstream tests, which are still pending
+        # A pending test can only have all of its dependencies upstream of a
+        # node if it depends on one of the node's parents, or if the node has
+        # several parents that bring its dependencies together.
+        tests: List[UniqueID] = []
+        test_index: Dict[UniqueID, int] = {}
+        node_tests: Dict[UniqueID, int] = {}
         for node_id in self.graph:
+            mask = 0
+            for test_id in _get_tests_for_node(manifest, node_id):
+                if test_id not in test_index:
+                    test_index[test_id] = len(tests)
+                    tests.append(test_id)
+                mask |= 1 << test_index[test_id]
+            if mask:
+                node_tests[node_id] = mask
+
+        if not tests:
+            return
+
+        dependency_index: Dict[UniqueID, int] = {}
+        test_dependencies: List[int] = []
+        for test_id in tests:
+            # Tests can depend on multiple nodes (ex: relationship tests).
+            # Test nodes do not distinguish between what node the test is
+            # "testing" and what node(s) it depends on.
+            mask = 0
+            for dependency in manifest.nodes[test_id].depends_on_nodes:
+                if dependency not in dependency_index:
+                    dependency_index[dependency] = len(dependency_index)
+                mask |= 1 << dependency_index[dependency]
+            test_dependencies.append(mask)
+
+        order = list(nx.topological_sort(self.graph))
+        children_left = {node_id: self.graph.out_degree(node_id) for node_id in order}
+        upstream: Dict[UniqueID, int] = {}
+        satisfied: Dict[UniqueID, int] = {}
+        pending: Dict[UniqueID, int] = {}
+
+        for node_id in order:
+            parents = list(self.graph.predecessors(node_id))
+            node_upstream = node_satisfied = node_pending = candidates = 0
+            for parent in parents:
+                node_upstream |= upstream[parent]
+                if parent in dependency_index:
+                    node_upstream |= 1 << dependency_index[parent]
+                node_satisfied |= satisfied[parent]
+                node_pending |= pending[parent]
+                candidates |= node_tests.get(parent, 0)
+                children_left[parent] -= 1
+                if not children_left[parent]:
+                    del upstream[parent], satisfied[parent], pending[parent]
+
+            node_pending |= candidates
+            if len(parents) > 1:
+                candidates = node_pending
+            candidates &= ~node_satisfied
+            while candidates:
+                test_bit = candidates & -candidates
+                candidates ^= test_bit
+                if not test_dependencies[test_bit.bit_length() - 1] & ~node_upstream:
+                    node_satisfied |= test_bit
+
+            if children_left[node_id]:
+                upstream[node_id] = node_upstream
+                satisfied[node_id] = node_satisfied
+                pending[node_id] = node_pending & ~node_satisfied
+
             # If node is executable (in manifest.nodes) and does _not_
-            # represent a test, continue.
+            # represent a test, add an edge from each upstream test whose
+            # dependencies are all upstream of it.
             if (
                 node_id in manifest.nodes
                 and manifest.nodes[node_id].resource_type != NodeType.Test
             ):
-                # Get *everything* upstream of the node
-                all_upstream_nodes = nx.traversal.bfs_tree(self.graph, node_id, reverse=True)
-                # Get the set of upstream nodes not including the current node.
-                upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
-
-                # Get all tests that depend on any upstream nodes.
-                upstream_tests = []
-                for upstream_node in upstream_nodes:
-                    upstream_tests += _get_tests_for_node(manifest, upstream_node)
-
-                for upstream_test in upstream_tests:
-                    # Get the set of all nodes that the test depends on
-                    # including the upstream_node itself. This is necessary
-                    # because tests can depend on multiple nodes (ex:
-                    # relationship tests). Test nodes do not distinguish
-                    # between what node the test is "testing" and what
-                    # node(s) it depends on.
-                    test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
-
-                    # If the set of nodes that an upstream test depends on
-                    # is a subset of all upstream nodes of the current node,
-                    # add an edge from the upstream test to the current node.
-                    if test_depends_on.issubset(upstream_nodes):
-                        self.graph.add_edge(upstream_test, node_id, edge_type="parent_test")
+                while node_satisfied:
+                    test_bit = node_satisfied & -node_satisfied
+                    node_satisfied ^= test_bit
+                    upstream_test = tests[test_bit.bit_length() - 1]
+                    self.graph.add_edge(upstream_test, node_id, edge_type="parent_test")
 
     def get_graph(self, manifest: Manifest) -> Graph:
         self.link_graph(manifest)
@@ -366,11 +419,13 @@ class Compiler:
             else:
                 # This is an ephemeral parsed model that we can compile.
                 # Render the raw_code and set compiled to True
+                cte_model = manifest.writable_node(cte_model)
                 cte_model = self._compile_code(cte_model, manifest, extra_context)
                 # recursively call this method, sets extra_ctes_injected to True
                 cte_model, new_prepended_ctes = self._recursively_prepend_ctes(
                     cte_model, manifest, extra_context
                 )
+                manifest.invalidate_flat_graph_entry(cte_model.unique_id)
                 # Write compiled SQL file
                 self._write_node(cte_model)
 
@@ -533,9 +588,11 @@ class Compiler:
         if hasattr(Lexer, "get_default_instance"):
             Lexer.get_default_instance()
 
+        node = manifest.writable_node(node)
         node = self._compile_code(node, manifest, extra_context)
 
         node, _ = self._recursively_prepend_ctes(node, manifest, extra_context)
+        manifest.invalidate_flat_graph_entry(node.unique_id)
         if write:
             self._write_node(node)
         return node
@@ -6,6 +6,7 @@ from typing import (
     Dict,
     Any,
     Optional,
+    Set,
     TypeVar,
     Union,
     Mapping,
@@ -457,6 +458,7 @@ class PartialProject(RenderComponents):
         vars_value = VarProvider(vars_dict)
         # There will never be any project_env_vars when it's first created
         project_env_vars: Dict[str, Any] = {}
+        project_var_names: Set[str] = set()
         on_run_start: List[str] = value_or(cfg.on_run_start, [])
         on_run_end: List[str] = value_or(cfg.on_run_end, [])
 
@@ -513,6 +515,7 @@ class PartialProject(RenderComponents):
             config_version=cfg.config_version,
             unrendered=unrendered,
             project_env_vars=project_env_vars,
+            project_var_names=project_var_names,
             restrict_access=cfg.restrict_access,
             dbt_cloud=dbt_cloud,
         )
@@ -628,6 +631,7 @@ class Project:
     config_version: int
     unrendered: RenderComponents
     project_env_vars: Dict[str, Any]
+    project_var_names: Set[str]
     restrict_access: bool
     dbt_cloud: Dict[str, Any]
 
@@ -51,8 +51,9 @@ def load_project(
         project_root, project_renderer, verify_version=version_check
     )
 
-    # Save env_vars encountered in rendering for partial parsing
+    # Save env_vars and vars encountered in rendering for partial parsing
     project.project_env_vars = project_renderer.ctx_obj.env_vars
+    project.project_var_names = project_renderer.context["var"].used_vars
     return project
 
 
@@ -70,8 +71,9 @@ def load_profile(
     profile = Profile.render(
         profile_renderer, profile_name, profile_name_override, target_override, threads_override
     )
-    # Save env_vars encountered in rendering for partial parsing
+    # Save env_vars and vars encountered in rendering for partial parsing
     profile.profile_env_vars = profile_renderer.ctx_obj.env_vars
+    profile.profile_var_names = profile_renderer.context["var"].used_vars
     return profile
 
 
@@ -174,8 +176,10 @@ class RuntimeConfig(Project, Profile, AdapterRequiredConfig):
             config_version=project.config_version,
             unrendered=project.unrendered,
             project_env_vars=project.project_env_vars,
+            project_var_names=project.project_var_names,
             restrict_access=project.restrict_access,
             profile_env_vars=profile.profile_env_vars,
+            profile_var_names=profile.profile_var_names,
             profile_name=profile.profile_name,
             target_name=profile.target_name,
             user_config=profile.user_config,
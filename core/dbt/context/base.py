@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import os
+import pprint
 from typing import Any, Callable, Dict, NoReturn, Optional, Mapping, Iterable, Set, List
 import threading
 
@@ -12,6 +13,7 @@ from dbt import utils
 from dbt.clients.jinja import get_rendered
 from dbt.clients.yaml_helper import yaml, safe_load, SafeLoader, Loader, Dumper  # noqa: F401
 from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER
+from dbt.contracts.files import FileHash
 from dbt.contracts.graph.nodes import Resource
 from dbt.exceptions import (
     SecretEnvVarLocationError,
@@ -128,6 +130,16 @@ class ContextMeta(type):
         return type.__new__(mcls, name, bases, new_dct)
 
 
+# What is saved for partial parsing about a var that was used: a checksum
+# of the value given with --vars, or a placeholder if the var wasn't given
+# on the command line. Values from dbt_project.yml or a default are in files
+# whose own changes are detected, so they don't need to be saved.
+def get_cli_var_checksum(cli_vars: Mapping[str, Any], var_name: str) -> str:
+    if var_name not in cli_vars:
+        return DEFAULT_ENV_PLACEHOLDER
+    return FileHash.from_contents(pprint.pformat(cli_vars[var_name])).checksum
+
+
 class Var:
     _VAR_NOTSET = object()
 
@@ -141,6 +153,8 @@ class Var:
         self._cli_vars: Mapping[str, Any] = cli_vars
         self._node: Optional[Resource] = node
         self._merged: Mapping[str, Any] = self._generate_merged()
+        # names of the vars looked up, for partial parsing
+        self.used_vars: Set[str] = set()
 
     def _generate_merged(self) -> Mapping[str, Any]:
         return self._cli_vars
@@ -168,6 +182,7 @@ class Var:
         return get_rendered(raw, dict(self._context))
 
     def __call__(self, var_name: str, default: Any = _VAR_NOTSET) -> Any:
+        self.used_vars.add(var_name)
         if self.has_var(var_name):
             return self.get_rendered_var(var_name)
         elif default is not self._VAR_NOTSET:
@@ -1,12 +1,12 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, MutableMapping, Optional
 
 from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER
 from dbt.contracts.connection import AdapterRequiredConfig
 from dbt.node_types import NodeType
 from dbt.utils import MultiDict
 
-from dbt.context.base import contextproperty, contextmember, Var
+from dbt.context.base import contextproperty, contextmember, get_cli_var_checksum, Var
 from dbt.context.target import TargetContext
 from dbt.exceptions import EnvVarMissingError, SecretEnvVarLocationError
 
@@ -37,12 +37,19 @@ class ConfiguredVar(Var):
         context: Dict[str, Any],
         config: AdapterRequiredConfig,
         project_name: str,
+        saved_vars: Optional[MutableMapping[str, str]] = None,
     ):
         super().__init__(context, config.cli_vars)
         self._config = config
         self._project_name = project_name
+        # If given, the checksums of the vars used are saved here for partial parsing
+        self._saved_vars = saved_vars
 
     def __call__(self, var_name, default=Var._VAR_NOTSET):
+        self.used_vars.add(var_name)
+        if self._saved_vars is not None:
+            self._saved_vars[var_name] = get_cli_var_checksum(self._config.cli_vars, var_name)
+
         my_config = self._config.load_dependencies()[self._project_name]
 
         # cli vars > active project > local project
@@ -82,7 +89,8 @@ class SchemaYamlContext(ConfiguredContext):
 
     @contextproperty()
     def var(self) -> ConfiguredVar:
-        return ConfiguredVar(self._ctx, self.config, self._project_name)
+        saved_vars = self.schema_yaml_vars.vars if self.schema_yaml_vars else None
+        return ConfiguredVar(self._ctx, self.config, self._project_name, saved_vars)
 
     @contextmember()
     def env_var(self, var: str, default: Optional[str] = None) -> str:
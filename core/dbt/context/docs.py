@@ -5,11 +5,32 @@ from dbt.exceptions import (
     DocArgsError,
 )
 from dbt.config.runtime import RuntimeConfig
+from dbt.contracts.connection import AdapterRequiredConfig
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import Macro, ResultNode
 
-from dbt.context.base import contextmember
-from dbt.context.configured import SchemaYamlContext
+from dbt.context.base import contextmember, contextproperty, get_cli_var_checksum
+from dbt.context.configured import ConfiguredVar, SchemaYamlContext
+
+
+# Descriptions are only rendered for new nodes, so a var used in one is
+# saved in the state check, where a change forces a full reparse.
+class DocsVar(ConfiguredVar):
+    def __init__(
+        self,
+        context: Dict[str, Any],
+        config: AdapterRequiredConfig,
+        project_name: str,
+        manifest: Manifest,
+    ) -> None:
+        super().__init__(context, config, project_name)
+        self._manifest = manifest
+
+    def __call__(self, var_name, default=ConfiguredVar._VAR_NOTSET):
+        self._manifest.state_check.vars[var_name] = get_cli_var_checksum(
+            self._config.cli_vars, var_name
+        )
+        return super().__call__(var_name, default)
 
 
 class DocsRuntimeContext(SchemaYamlContext):
@@ -24,6 +45,10 @@ class DocsRuntimeContext(SchemaYamlContext):
         self.node = node
         self.manifest = manifest
 
+    @contextproperty()
+    def var(self) -> ConfiguredVar:
+        return DocsVar(self._ctx, self.config, self._project_name, self.manifest)
+
     @contextmember()
     def doc(self, *args: str) -> str:
         """The `doc` function is used to reference docs blocks in schema.yml
@@ -1,4 +1,18 @@
-from typing import Any, Dict, Iterable, Union, Optional, List, Iterator, Mapping, Set
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Union,
+    Optional,
+    List,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Set,
+    Tuple,
+)
 
 from dbt.clients.jinja import MacroGenerator, MacroStack
 from dbt.contracts.graph.nodes import Macro
@@ -6,9 +20,46 @@ from dbt.include.global_project import PROJECT_NAME as GLOBAL_PROJECT_NAME
 from dbt.exceptions import DuplicateMacroNameError, PackageNotFoundForMacroError
 
 
-FlatNamespace = Dict[str, MacroGenerator]
+FlatNamespace = Mapping[str, MacroGenerator]
 NamespaceMember = Union[FlatNamespace, MacroGenerator]
-FullNamespace = Dict[str, NamespaceMember]
+FullNamespace = Mapping[str, NamespaceMember]
+
+MacroMap = Dict[str, Macro]
+LayoutKey = Tuple[str, str, Tuple[str, ...]]
+
+
+# The placement of macros into the various namespaces only depends on
+# the root package, the package of the node and the internal packages,
+# so it's computed once by the MacroNamespaceBuilder and shared between
+# all of the contexts built for the same packages.
+@dataclass
+class MacroNamespaceLayout:
+    global_namespace: MacroMap = field(default_factory=dict)  # root package macros
+    local_namespace: MacroMap = field(default_factory=dict)  # packages for *this* node
+    global_project_namespace: MacroMap = field(default_factory=dict)  # internal packages
+    packages: Dict[str, MacroMap] = field(default_factory=dict)  # non-internal packages
+
+
+# A read-only view of a dictionary of macros which returns MacroGenerators,
+# so that generators are only created for the macros that are used.
+# Attributes are private so that they don't shadow macro names when
+# jinja resolves 'package_name.macro_name'.
+class LazyFlatNamespace(Mapping):
+    def __init__(self, macros: MacroMap, bind: Callable[[Macro], MacroGenerator]):
+        self._macros = macros
+        self._bind = bind
+
+    def __getitem__(self, key: str) -> MacroGenerator:
+        return self._bind(self._macros[key])
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._macros
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._macros)
+
+    def __len__(self):
+        return len(self._macros)
 
 
 # The point of this class is to collect the various macros
@@ -22,15 +73,40 @@ FullNamespace = Dict[str, NamespaceMember]
 class MacroNamespace(Mapping):
     def __init__(
         self,
-        global_namespace: FlatNamespace,  # root package macros
-        local_namespace: FlatNamespace,  # packages for *this* node
-        global_project_namespace: FlatNamespace,  # internal packages
-        packages: Dict[str, FlatNamespace],  # non-internal packages
+        layout: MacroNamespaceLayout,
+        ctx: Dict[str, Any],
+        node: Optional[Any] = None,
+        thread_ctx: Optional[MacroStack] = None,
     ):
-        self.global_namespace: FlatNamespace = global_namespace
-        self.local_namespace: FlatNamespace = local_namespace
-        self.packages: Dict[str, FlatNamespace] = packages
-        self.global_project_namespace: FlatNamespace = global_project_namespace
+        self.ctx = ctx
+        self.node = node
+        self.thread_ctx = thread_ctx
+        # MacroGenerators are created on first access and shared between
+        # the namespaces, keyed by macro unique_id
+        self._generators: Dict[str, MacroGenerator] = {}
+        self.global_namespace: FlatNamespace = LazyFlatNamespace(
+            layout.global_namespace, self._get_generator
+        )
+        self.local_namespace: FlatNamespace = LazyFlatNamespace(
+            layout.local_namespace, self._get_generator
+        )
+        self.packages: Dict[str, FlatNamespace] = {
+            package_name: LazyFlatNamespace(macros, self._get_generator)
+            for package_name, macros in layout.packages.items()
+        }
+        self.global_project_namespace: FlatNamespace = LazyFlatNamespace(
+            layout.global_project_namespace, self._get_generator
+        )
+
+    def _get_generator(self, macro: Macro) -> MacroGenerator:
+        macro_func = self._generators.get(macro.unique_id)
+        if macro_func is None:
+            # MacroGenerator is in clients/jinja.py
+            # a MacroGenerator object is a callable object that will
+            # execute the MacroGenerator.__call__ function
+            macro_func = MacroGenerator(macro, self.ctx, self.node, self.thread_ctx)
+            self._generators[macro.unique_id] = macro_func
+        return macro_func
 
     def _search_order(self) -> Iterable[Union[FullNamespace, FlatNamespace]]:
         yield self.local_namespace  # local package
@@ -60,6 +136,10 @@ class MacroNamespace(Mapping):
     def __len__(self):
         return len(self._keys())
 
+    def __contains__(self, key: object) -> bool:
+        # without building a MacroGenerator, unlike Mapping.__contains__
+        return any(key in dct for dct in self._search_order())
+
     def __getitem__(self, key: str) -> NamespaceMember:
         for dct in self._search_order():
             if key in dct:
@@ -96,24 +176,30 @@ class MacroNamespaceBuilder:
         # internal packages comes from get_adapter_package_names
         self.internal_package_names = set(internal_packages)
         self.internal_package_names_order = internal_packages
-        # macro_func is added here if in root package, since
+        # macro is added here if in root package, since
         # the root package acts as a "global" namespace, overriding
         # everything else except local external package macro calls
-        self.globals: FlatNamespace = {}
-        # macro_func is added here if it's the package for this node
-        self.locals: FlatNamespace = {}
-        # Create a dictionary of [package name][macro name] =
-        #     MacroGenerator object which acts like a function
-        self.internal_packages: Dict[str, FlatNamespace] = {}
-        self.packages: Dict[str, FlatNamespace] = {}
+        self.globals: MacroMap = {}
+        # macro is added here if it's the package for this node
+        self.locals: MacroMap = {}
+        # Create a dictionary of [package name][macro name] = Macro
+        self.internal_packages: Dict[str, MacroMap] = {}
+        self.packages: Dict[str, MacroMap] = {}
         self.thread_ctx = thread_ctx
         self.node = node
 
+    @property
+    def layout_key(self) -> LayoutKey:
+        return (
+            self.root_package,
+            self.search_package,
+            tuple(self.internal_package_names_order),
+        )
+
     def _add_macro_to(
         self,
-        hierarchy: Dict[str, FlatNamespace],
+        hierarchy: Dict[str, MacroMap],
         macro: Macro,
-        macro_func: MacroGenerator,
     ):
         if macro.package_name in hierarchy:
             namespace = hierarchy[macro.package_name]
@@ -122,49 +208,64 @@ class MacroNamespaceBuilder:
             hierarchy[macro.package_name] = namespace
 
         if macro.name in namespace:
-            raise DuplicateMacroNameError(macro_func.macro, macro, macro.package_name)
-        hierarchy[macro.package_name][macro.name] = macro_func
+            raise DuplicateMacroNameError(namespace[macro.name], macro, macro.package_name)
+        hierarchy[macro.package_name][macro.name] = macro
 
-    def add_macro(self, macro: Macro, ctx: Dict[str, Any]):
+    def add_macro(self, macro: Macro):
         macro_name: str = macro.name
 
-        # MacroGenerator is in clients/jinja.py
-        # a MacroGenerator object is a callable object that will
-        # execute the MacroGenerator.__call__ function
-        macro_func: MacroGenerator = MacroGenerator(macro, ctx, self.node, self.thread_ctx)
-
         # internal macros (from plugins) will be processed separately from
         # project macros, so store them in a different place
         if macro.package_name in self.internal_package_names:
-            self._add_macro_to(self.internal_packages, macro, macro_func)
+            self._add_macro_to(self.internal_packages, macro)
         else:
             # if it's not an internal package
-            self._add_macro_to(self.packages, macro, macro_func)
+            self._add_macro_to(self.packages, macro)
             # add to locals if it's the package this node is in
             if macro.package_name == self.search_package:
-                self.locals[macro_name] = macro_func
+                self.locals[macro_name] = macro
             # add to globals if it's in the root package
             elif macro.package_name == self.root_package:
-                self.globals[macro_name] = macro_func
+                self.globals[macro_name] = macro
 
-    def add_macros(self, macros: Iterable[Macro], ctx: Dict[str, Any]):
+    def add_macros(self, macros: Iterable[Macro]):
         for macro in macros:
-            self.add_macro(macro, ctx)
+            self.add_macro(macro)
 
-    def build_namespace(self, macros: Iterable[Macro], ctx: Dict[str, Any]) -> MacroNamespace:
-        self.add_macros(macros, ctx)
+    def build_layout(self, macros: Iterable[Macro]) -> MacroNamespaceLayout:
+        self.add_macros(macros)
 
         # Iterate in reverse-order and overwrite: the packages that are first
         # in the list are the ones we want to "win".
-        global_project_namespace: FlatNamespace = {}
+        global_project_namespace: MacroMap = {}
         for pkg in reversed(self.internal_package_names_order):
             if pkg in self.internal_packages:
                 # add the macros pointed to by this package name
                 global_project_namespace.update(self.internal_packages[pkg])
 
-        return MacroNamespace(
+        return MacroNamespaceLayout(
             global_namespace=self.globals,  # root package macros
             local_namespace=self.locals,  # packages for *this* node
             global_project_namespace=global_project_namespace,  # internal packages
             packages=self.packages,  # non internal_packages
         )
+
+    def build_namespace(
+        self,
+        macros: Iterable[Macro],
+        ctx: Dict[str, Any],
+        layouts: Optional[MutableMapping[LayoutKey, MacroNamespaceLayout]] = None,
+    ) -> MacroNamespace:
+        """Build the MacroNamespace for a context. If a 'layouts' cache is
+        provided, the macros are only sorted into namespaces the first time
+        a given set of packages is seen.
+        """
+        if layouts is None:
+            layout = self.build_layout(macros)
+        elif self.layout_key in layouts:
+            layout = layouts[self.layout_key]
+        else:
+            layout = self.build_layout(macros)
+            layouts[self.layout_key] = layout
+
+        return MacroNamespace(layout, ctx, self.node, self.thread_ctx)
@@ -1,6 +1,6 @@
 from typing import List
 
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import LazyContext, MacroStack
 from dbt.contracts.connection import AdapterRequiredConfig
 from dbt.contracts.graph.manifest import Manifest
 from dbt.context.macro_resolver import TestMacroNamespace
@@ -27,6 +27,8 @@ class ManifestContext(ConfiguredContext):
         search_package: str,
     ) -> None:
         super().__init__(config)
+        # the macros are only looked up in the namespace when they're used
+        self._ctx = LazyContext(self._ctx)
         self.manifest = manifest
         # this is the package of the node for which this context was built
         self.search_package = search_package
@@ -38,9 +40,15 @@ class ManifestContext(ConfiguredContext):
 
     def _build_namespace(self):
         # this takes all the macros in the manifest and adds them
-        # to the MacroNamespaceBuilder stored in self.namespace
+        # to the MacroNamespaceBuilder stored in self.namespace.
+        # The placement of the macros is cached on the manifest's
+        # macro lookup, so it's only done once per package.
         builder = self._get_namespace_builder()
-        return builder.build_namespace(self.manifest.macros.values(), self._ctx)
+        return builder.build_namespace(
+            self.manifest.macros.values(),
+            self._ctx,
+            layouts=self.manifest.macro_lookup.namespace_layouts,
+        )
 
     def _get_namespace_builder(self) -> MacroNamespaceBuilder:
         # avoid an import loop
@@ -58,13 +66,18 @@ class ManifestContext(ConfiguredContext):
     # This does not use the Mashumaro code
     def to_dict(self):
         dct = super().to_dict()
-        # This moves all of the macros in the 'namespace' into top level
-        # keys in the manifest dictionary
+        # This makes all of the macros in the 'namespace' available as top
+        # level keys in the manifest dictionary
         if isinstance(self.namespace, TestMacroNamespace):
             dct.update(self.namespace.local_namespace)
             dct.update(self.namespace.project_namespace)
         else:
-            dct.update(self.namespace)
+            # Binding every macro to the context for every node is slow, so
+            # they're looked up in the namespace when used instead. They
+            # still override the context's own values with the same name.
+            for key in [key for key in dct if key in self.namespace]:
+                del dct[key]
+            dct.lazy = self.namespace
         return dct
 
     @contextproperty()
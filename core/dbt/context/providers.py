@@ -20,7 +20,7 @@ from dbt.clients import agate_helper
 from dbt.clients.jinja import get_rendered, MacroGenerator, MacroStack
 from dbt.config import RuntimeConfig, Project
 from dbt.constants import SECRET_ENV_PREFIX, DEFAULT_ENV_PLACEHOLDER
-from dbt.context.base import contextmember, contextproperty, Var
+from dbt.context.base import contextmember, contextproperty, get_cli_var_checksum, Var
 from dbt.context.configured import FQNLookup
 from dbt.context.context_config import ContextConfig
 from dbt.context.exceptions_jinja import wrapped_exports
@@ -28,6 +28,7 @@ from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.macros import MacroNamespaceBuilder, MacroNamespace
 from dbt.context.manifest import ManifestContext
 from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.files import SchemaSourceFile, SourceFile
 from dbt.contracts.graph.manifest import Manifest, Disabled
 from dbt.contracts.graph.nodes import (
     Macro,
@@ -628,11 +629,41 @@ class ModelConfiguredVar(Var):
         context: Dict[str, Any],
         config: RuntimeConfig,
         node: Resource,
+        manifest: Optional[Manifest] = None,
     ) -> None:
         self._node: Resource
         self._config: RuntimeConfig = config
+        # If given, the vars used are saved in the manifest for partial parsing
+        self._manifest: Optional[Manifest] = manifest
         super().__init__(context, config.cli_vars, node=node)
 
+    def __call__(self, var_name: str, default: Any = Var._VAR_NOTSET) -> Any:
+        if self._manifest is not None:
+            self.save_var(self._manifest, var_name)
+        return super().__call__(var_name, default)
+
+    # Save the var checksum in the manifest and the var name in the file
+    # that used it, so that partial parsing can reparse the file if the
+    # var changes. Vars used outside of a file that can be reparsed on its
+    # own (hooks, macros like generate_schema_name) go in the state check,
+    # where a change forces a full reparse.
+    def save_var(self, manifest: Manifest, var_name: str) -> None:
+        checksum = get_cli_var_checksum(self._cli_vars, var_name)
+        source_file = None
+        if self._node.resource_type != NodeType.Macro:
+            source_file = manifest.files.get(self._node.file_id)
+        file_key_name = getattr(self._node, "file_key_name", None)
+        if isinstance(source_file, SchemaSourceFile) and file_key_name:
+            (yaml_key, name) = file_key_name.split(".")
+            source_file.add_var(var_name, yaml_key, name)
+        elif isinstance(source_file, SourceFile):
+            if var_name not in source_file.vars:
+                source_file.vars.append(var_name)
+        else:
+            manifest.state_check.vars[var_name] = checksum
+            return
+        manifest.vars[var_name] = checksum
+
     def packages_for_node(self) -> Iterable[Project]:
         dependencies = self._config.load_dependencies()
         package_name = self._node.package_name
@@ -877,10 +908,15 @@ class ProviderContext(ManifestContext):
         column_types = self.model.config.column_types
         delimiter = self.model.config.delimiter
         try:
-            table = agate_helper.from_csv(path, text_columns=column_types, delimiter=delimiter)
+            table = agate_helper.seed_from_csv(
+                path,
+                text_columns=column_types,
+                delimiter=delimiter,
+                full_scan=self.model.config.infer_types_from_all_rows,
+            )
         except ValueError as e:
             raise LoadAgateTableValueError(e, node=self.model)
-        table.original_abspath = os.path.abspath(path)
+        table.original_abspath = os.path.abspath(path)  # type: ignore[attr-defined]
         return table
 
     @contextproperty()
@@ -1102,6 +1138,7 @@ class ProviderContext(ManifestContext):
             context=self._ctx,
             config=self.config,
             node=self.model,
+            manifest=None if self.provider.execute else self.manifest,
         )
 
     @contextproperty("adapter")
@@ -1129,7 +1166,7 @@ class ProviderContext(ManifestContext):
         return self.target
 
     @contextproperty()
-    def graph(self) -> Dict[str, Any]:
+    def graph(self) -> Mapping[str, Any]:
         """The `graph` context variable contains information about the nodes in
         your dbt project. Models, sources, tests, and snapshots are all
         examples of nodes in dbt projects.
@@ -44,6 +44,9 @@ class FilePath(dbtClassMixin):
     relative_path: str
     modification_time: float
     project_root: str
+    # used with modification_time to tell whether the file has changed
+    file_size: int = 0
+    inode: int = 0
 
     @property
     def search_key(self) -> str:
@@ -192,6 +195,7 @@ class SourceFile(BaseSourceFile):
     docs: List[str] = field(default_factory=list)
     macros: List[str] = field(default_factory=list)
     env_vars: List[str] = field(default_factory=list)
+    vars: List[str] = field(default_factory=list)
 
     @classmethod
     def big_seed(cls, path: FilePath) -> "SourceFile":
@@ -239,6 +243,7 @@ class SchemaSourceFile(BaseSourceFile):
     # created too, but those are in 'sources'
     sop: List[SourceKey] = field(default_factory=list)
     env_vars: Dict[str, Any] = field(default_factory=dict)
+    vars: Dict[str, Any] = field(default_factory=dict)
     pp_dict: Optional[Dict[str, Any]] = None
     pp_test_index: Optional[Dict[str, Any]] = None
 
@@ -326,5 +331,21 @@ class SchemaSourceFile(BaseSourceFile):
             if not self.env_vars[yaml_key]:
                 del self.env_vars[yaml_key]
 
+    def add_var(self, var, yaml_key, name):
+        if yaml_key not in self.vars:
+            self.vars[yaml_key] = {}
+        if name not in self.vars[yaml_key]:
+            self.vars[yaml_key][name] = []
+        if var not in self.vars[yaml_key][name]:
+            self.vars[yaml_key][name].append(var)
+
+    def delete_from_vars(self, yaml_key, name):
+        # Like env_vars, all vars for this yaml_key/name are deleted
+        # because the entry has been scheduled for reparsing.
+        if yaml_key in self.vars and name in self.vars[yaml_key]:
+            del self.vars[yaml_key][name]
+            if not self.vars[yaml_key]:
+                del self.vars[yaml_key]
+
 
 AnySourceFile = Union[SchemaSourceFile, SourceFile]
@@ -20,6 +20,11 @@ from typing import (
     Generic,
     AbstractSet,
     ClassVar,
+    Iterator,
+    ItemsView,
+    KeysView,
+    NoReturn,
+    ValuesView,
 )
 from typing_extensions import Protocol
 from uuid import UUID
@@ -616,15 +621,93 @@ class CandidateList(List[M]):
         return self[-1].macro
 
 
-def _get_locality(macro: Macro, root_project_name: str, internal_packages: Set[str]) -> Locality:
-    if macro.package_name == root_project_name:
+def _get_locality(
+    package_name: str, root_project_name: str, internal_packages: Set[str]
+) -> Locality:
+    if package_name == root_project_name:
         return Locality.Root
-    elif macro.package_name in internal_packages:
+    elif package_name in internal_packages:
         return Locality.Core
     else:
         return Locality.Imported
 
 
+class MacroLookup:
+    """An index of macros by name, so that macro dispatch doesn't need to
+    scan every macro in the manifest. The locality of each package is
+    computed once per root project and adapter type.
+    """
+
+    def __init__(self, macros: Mapping[UniqueID, Macro]) -> None:
+        self.storage: Dict[str, Dict[UniqueID, PackageName]] = {}
+        self._localities: Dict[Tuple[str, Optional[str]], Dict[PackageName, Locality]] = {}
+        # The macro namespace layouts built by dbt.context.macros depend on
+        # every macro, so they're cached here and dropped on any change.
+        self.namespace_layouts: Dict[Any, Any] = {}
+        self.populate(macros)
+
+    def populate(self, macros: Mapping[UniqueID, Macro]):
+        for macro in macros.values():
+            self.add_macro(macro)
+
+    def add_macro(self, macro: Macro):
+        if macro.name not in self.storage:
+            self.storage[macro.name] = {}
+        self.storage[macro.name][macro.unique_id] = macro.package_name
+        self.namespace_layouts = {}
+        # a new package invalidates the precomputed localities
+        if any(macro.package_name not in loc for loc in self._localities.values()):
+            self._localities = {}
+
+    def remove_macro(self, macro: Macro):
+        unique_ids = self.storage.get(macro.name)
+        if unique_ids is None:
+            return
+        unique_ids.pop(macro.unique_id, None)
+        self.namespace_layouts = {}
+        if not unique_ids:
+            del self.storage[macro.name]
+
+    def _get_localities(
+        self, root_project_name: str, adapter_type: Optional[str]
+    ) -> Dict[PackageName, Locality]:
+        key = (root_project_name, adapter_type)
+        if key not in self._localities:
+            # avoid an import cycle
+            from dbt.adapters.factory import get_adapter_package_names
+
+            internal_packages = set(get_adapter_package_names(adapter_type))
+            localities: Dict[PackageName, Locality] = {}
+            for package_names in self.storage.values():
+                for package_name in package_names.values():
+                    if package_name not in localities:
+                        localities[package_name] = _get_locality(
+                            package_name, root_project_name, internal_packages
+                        )
+            self._localities[key] = localities
+        return self._localities[key]
+
+    def find_candidates(
+        self,
+        name: str,
+        root_project_name: str,
+        adapter_type: Optional[str],
+        macros: Mapping[UniqueID, Macro],
+    ) -> CandidateList:
+        candidates: CandidateList = CandidateList()
+        unique_ids = self.storage.get(name)
+        if not unique_ids:
+            return candidates
+
+        localities = self._get_localities(root_project_name, adapter_type)
+        for unique_id, package_name in unique_ids.items():
+            macro = macros.get(unique_id)
+            if macro is None:
+                continue
+            candidates.append(MacroCandidate(locality=localities[package_name], macro=macro))
+        return candidates
+
+
 class Searchable(Protocol):
     resource_type: NodeType
     package_name: str
@@ -672,6 +755,13 @@ class MacroMethods:
     def __init__(self):
         self.macros = []
         self.metadata = {}
+        self._macro_lookup: Optional[MacroLookup] = None
+
+    @property
+    def macro_lookup(self) -> MacroLookup:
+        if self._macro_lookup is None:
+            self._macro_lookup = MacroLookup(self.macros)
+        return self._macro_lookup
 
     def find_macro_by_name(
         self, name: str, root_project_name: str, package: Optional[str]
@@ -736,22 +826,110 @@ class MacroMethods:
         filter: Optional[Callable[[MacroCandidate], bool]] = None,
     ) -> CandidateList:
         """Find macros by their name."""
-        # avoid an import cycle
-        from dbt.adapters.factory import get_adapter_package_names
+        candidates: CandidateList = self.macro_lookup.find_candidates(
+            name=name,
+            root_project_name=root_project_name,
+            adapter_type=self.metadata.adapter_type,
+            macros=self.macros,
+        )
+        if filter is None:
+            return candidates
+        return CandidateList(candidate for candidate in candidates if filter(candidate))
 
-        candidates: CandidateList = CandidateList()
-        packages = set(get_adapter_package_names(self.metadata.adapter_type))
-        for unique_id, macro in self.macros.items():
-            if macro.name != name:
-                continue
-            candidate = MacroCandidate(
-                locality=_get_locality(macro, root_project_name, packages),
-                macro=macro,
-            )
-            if filter is None or filter(candidate):
-                candidates.append(candidate)
 
-        return candidates
+class FlatGraphSection(Dict[str, Dict[str, Any]]):
+    """A read-only view of one of the manifest's resource dicts, which
+    serializes each resource the first time it's looked up.
+
+    Entries are keyed on the resource object, so a resource that is
+    replaced in the manifest gets serialized again. Resources that are
+    patched in place must be invalidated.
+
+    This is a dict, so json and msgpack serialize it like the plain dicts
+    the graph used to be made of. They go through items(), which fills in
+    every entry. The dict itself only holds placeholders for the resources
+    it was built with, as the C json encoder checks it for emptiness.
+    """
+
+    def __init__(self, resources: Mapping[str, Any]) -> None:
+        placeholder: Dict[str, Any] = {}
+        super().__init__(dict.fromkeys(resources, placeholder))
+        self._resources = resources
+        self._entries: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+
+    def __getitem__(self, unique_id: str) -> Dict[str, Any]:
+        resource = self._resources[unique_id]
+        entry = self._entries.get(unique_id)
+        if entry is None or entry[0] is not resource:
+            entry = (resource, resource.to_dict(omit_none=False))
+            self._entries[unique_id] = entry
+        return entry[1]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._resources)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._resources
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)!r})"
+
+    def __reduce__(self):
+        return self.__class__, (self._resources,)
+
+    def get(self, unique_id: str, default: Any = None) -> Any:  # type: ignore[override]
+        return self[unique_id] if unique_id in self else default
+
+    def keys(self) -> KeysView[str]:  # type: ignore[override]
+        return KeysView(self)
+
+    def values(self) -> ValuesView[Dict[str, Any]]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def items(self) -> ItemsView[str, Dict[str, Any]]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def copy(self) -> Dict[str, Dict[str, Any]]:
+        return dict(self.items())
+
+    def __or__(self, other):
+        return self.copy() | other
+
+    def __ror__(self, other):
+        return other | self.copy()
+
+    def __reversed__(self) -> Iterator[str]:
+        return reversed(list(self))
+
+    def _read_only(self, *args, **kwargs) -> NoReturn:
+        raise TypeError(f"{self.__class__.__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def invalidate(self, unique_id: str) -> None:
+        self._entries.pop(unique_id, None)
+
+
+class FlatGraph(Dict[str, FlatGraphSection]):
+    """The 'graph' context variable: the manifest's resources by type, as
+    dictionaries. Resources are only serialized when a template reads them.
+    """
+
+    def invalidate(self, unique_id: str) -> None:
+        for section in self.values():
+            section.invalidate(unique_id)
 
 
 @dataclass
@@ -767,6 +945,9 @@ class ManifestStateCheck(dbtClassMixin):
     profile_env_vars_hash: FileHash = field(default_factory=FileHash.empty)
     profile_hash: FileHash = field(default_factory=FileHash.empty)
     project_hashes: MutableMapping[str, FileHash] = field(default_factory=dict)
+    # checksums of the vars used outside of files that can be reparsed on
+    # their own, such as in dbt_project.yml, profiles.yml and hooks
+    vars: MutableMapping[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -786,13 +967,14 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     selectors: MutableMapping[str, Any] = field(default_factory=dict)
     files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
     metadata: ManifestMetadata = field(default_factory=ManifestMetadata)
-    flat_graph: Dict[str, Any] = field(default_factory=dict)
+    flat_graph: Mapping[str, Any] = field(default_factory=dict)
     state_check: ManifestStateCheck = field(default_factory=ManifestStateCheck)
     source_patches: MutableMapping[SourceKey, SourcePatch] = field(default_factory=dict)
     disabled: MutableMapping[str, List[GraphMemberNode]] = field(default_factory=dict)
     env_vars: MutableMapping[str, str] = field(default_factory=dict)
     semantic_models: MutableMapping[str, SemanticModel] = field(default_factory=dict)
     saved_queries: MutableMapping[str, SavedQuery] = field(default_factory=dict)
+    vars: MutableMapping[str, str] = field(default_factory=dict)
 
     _doc_lookup: Optional[DocLookup] = field(
         default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
@@ -818,6 +1000,9 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
     _analysis_lookup: Optional[AnalysisLookup] = field(
         default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
     )
+    _macro_lookup: Optional[MacroLookup] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
     _parsing_info: ParsingInfo = field(
         default_factory=ParsingInfo,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
@@ -826,6 +1011,11 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         default_factory=MP_CONTEXT.Lock,
         metadata={"serialize": lambda x: None, "deserialize": lambda x: None},
     )
+    # None if this manifest owns all of its resources. For a copy made with
+    # deepcopy, the resources it has stopped sharing with the original.
+    _private_ids: Optional[Set[str]] = field(
+        default=None, metadata={"serialize": lambda x: None, "deserialize": lambda x: None}
+    )
 
     def __pre_serialize__(self):
         # serialization won't work with anything except an empty source_patches because
@@ -843,20 +1033,27 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         only build it once and avoid any concurrency issues around it.
         Make sure you don't call this until you're done with building your
         manifest!
+
+        Each resource is only serialized when it's first read from the graph.
+        """
+        self.flat_graph = FlatGraph(
+            {
+                "exposures": FlatGraphSection(self.exposures),
+                "groups": FlatGraphSection(self.groups),
+                "metrics": FlatGraphSection(self.metrics),
+                "nodes": FlatGraphSection(self.nodes),
+                "sources": FlatGraphSection(self.sources),
+                "semantic_models": FlatGraphSection(self.semantic_models),
+                "saved_queries": FlatGraphSection(self.saved_queries),
+            }
+        )
+
+    def invalidate_flat_graph_entry(self, unique_id: str) -> None:
+        """Make the flat graph serialize this resource again the next time
+        it's read, after the resource was changed in place.
         """
-        self.flat_graph = {
-            "exposures": {k: v.to_dict(omit_none=False) for k, v in self.exposures.items()},
-            "groups": {k: v.to_dict(omit_none=False) for k, v in self.groups.items()},
-            "metrics": {k: v.to_dict(omit_none=False) for k, v in self.metrics.items()},
-            "nodes": {k: v.to_dict(omit_none=False) for k, v in self.nodes.items()},
-            "sources": {k: v.to_dict(omit_none=False) for k, v in self.sources.items()},
-            "semantic_models": {
-                k: v.to_dict(omit_none=False) for k, v in self.semantic_models.items()
-            },
-            "saved_queries": {
-                k: v.to_dict(omit_none=False) for k, v in self.saved_queries.items()
-            },
-        }
+        if isinstance(self.flat_graph, FlatGraph):
+            self.flat_graph.invalidate(unique_id)
 
     def build_disabled_by_file_id(self):
         disabled_by_file_id = {}
@@ -939,22 +1136,31 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         return frozenset(x.database for x in chain(self.nodes.values(), self.sources.values()))
 
     def deepcopy(self):
+        """Return a copy that can be changed without changing this manifest.
+
+        The copy has its own containers, but shares the resources in them with
+        this manifest until it changes them: code that changes a node in place
+        gets the copy's own version of it from writable_node first. Resources
+        aren't copied on write in this manifest, so it shouldn't be changed in
+        place while its copies are in use.
+        """
         copy = Manifest(
-            nodes={k: _deepcopy(v) for k, v in self.nodes.items()},
-            sources={k: _deepcopy(v) for k, v in self.sources.items()},
-            macros={k: _deepcopy(v) for k, v in self.macros.items()},
-            docs={k: _deepcopy(v) for k, v in self.docs.items()},
-            exposures={k: _deepcopy(v) for k, v in self.exposures.items()},
-            metrics={k: _deepcopy(v) for k, v in self.metrics.items()},
-            groups={k: _deepcopy(v) for k, v in self.groups.items()},
-            selectors={k: _deepcopy(v) for k, v in self.selectors.items()},
+            nodes=dict(self.nodes),
+            sources=dict(self.sources),
+            macros=dict(self.macros),
+            docs=dict(self.docs),
+            exposures=dict(self.exposures),
+            metrics=dict(self.metrics),
+            groups=dict(self.groups),
+            selectors=dict(self.selectors),
             metadata=self.metadata,
-            disabled={k: _deepcopy(v) for k, v in self.disabled.items()},
-            files={k: _deepcopy(v) for k, v in self.files.items()},
+            disabled={k: list(v) for k, v in self.disabled.items()},
+            files=dict(self.files),
             state_check=_deepcopy(self.state_check),
-            semantic_models={k: _deepcopy(v) for k, v in self.semantic_models.items()},
-            saved_queries={k: _deepcopy(v) for k, v in self.saved_queries.items()},
+            semantic_models=dict(self.semantic_models),
+            saved_queries=dict(self.saved_queries),
         )
+        copy._private_ids = set()
         copy.build_flat_graph()
         return copy
 
@@ -1050,6 +1256,33 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
                 "Expected node {} not found in manifest".format(unique_id)
             )
 
+    def writable_node(self, node: T) -> T:
+        """Return this manifest's version of the node that can be changed in
+        place. In a copy made with deepcopy, the node is copied the first time
+        it's asked for, so the manifest it was copied from doesn't see changes.
+        """
+        if self._private_ids is None:
+            return node
+        unique_id = node.unique_id
+        all_resources: Tuple[MutableMapping[str, Any], ...] = (
+            self.nodes,
+            self.sources,
+            self.exposures,
+            self.metrics,
+            self.semantic_models,
+            self.saved_queries,
+        )
+        for resources in all_resources:
+            if unique_id not in resources:
+                continue
+            with self._lock:
+                if unique_id not in self._private_ids:
+                    resources[unique_id] = _deepcopy(resources[unique_id])
+                    self._private_ids.add(unique_id)
+                    self.invalidate_flat_graph_entry(unique_id)
+                return resources[unique_id]
+        return node
+
     @property
     def doc_lookup(self) -> DocLookup:
         if self._doc_lookup is None:
@@ -1145,7 +1378,6 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         current_project: str,
         node_package: str,
     ) -> MaybeNonSource:
-
         node: Optional[ManifestNode] = None
         disabled: Optional[List[ManifestNode]] = None
 
@@ -1202,7 +1434,6 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
         current_project: str,
         node_package: str,
     ) -> MaybeMetricNode:
-
         metric: Optional[Metric] = None
         disabled: Optional[List[Metric]] = None
 
@@ -1397,8 +1628,16 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             raise DuplicateMacroInPackageError(macro=macro, macro_mapping=self.macros)
 
         self.macros[macro.unique_id] = macro
+        if self._macro_lookup is not None:
+            self._macro_lookup.add_macro(macro)
         source_file.macros.append(macro.unique_id)
 
+    def remove_macro(self, unique_id: str) -> Macro:
+        macro = self.macros.pop(unique_id)
+        if self._macro_lookup is not None:
+            self._macro_lookup.remove_macro(macro)
+        return macro
+
     def has_file(self, source_file: SourceFile) -> bool:
         key = source_file.file_id
         if key is None:
@@ -1519,6 +1758,7 @@ class Manifest(MacroMethods, DataClassMessagePackMixin, dbtClassMixin):
             self.env_vars,
             self.semantic_models,
             self.saved_queries,
+            self.vars,
             self._doc_lookup,
             self._source_lookup,
             self._ref_lookup,
@@ -1534,9 +1774,10 @@ class MacroManifest(MacroMethods):
     def __init__(self, macros) -> None:
         self.macros = macros
         self.metadata = ManifestMetadata()
+        self._macro_lookup: Optional[MacroLookup] = None
         # This is returned by the 'graph' context property
         # in the ProviderContext class.
-        self.flat_graph: Dict[str, Any] = {}
+        self.flat_graph: Mapping[str, Any] = {}
 
 
 AnyManifest = Union[Manifest, MacroManifest]
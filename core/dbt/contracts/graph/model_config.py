@@ -556,6 +556,7 @@ class SeedConfig(NodeConfig):
     materialized: str = "seed"
     delimiter: str = ","
     quote_columns: Optional[bool] = None
+    infer_types_from_all_rows: bool = False
 
     @classmethod
     def validate(cls, data):
@@ -0,0 +1,56 @@
+"""Send a command to a running `dbt daemon` and print its output, e.g.
+
+    python -m dbt.daemon_client run --select my_model
+
+This module only uses the standard library, so it starts faster than dbt
+itself. The daemon's socket is found from --socket-path, DBT_SOCKET_PATH, or
+target/dbt-daemon.sock in the current directory, and the process exits with
+dbt's exit codes.
+"""
+import json
+import os
+import socket
+import sys
+from typing import List, Optional
+
+DEFAULT_SOCKET_PATH = os.path.join("target", "dbt-daemon.sock")
+
+# The same as dbt.utils.ExitCodes
+SUCCESS = 0
+MODEL_ERROR = 1
+UNHANDLED_ERROR = 2
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = sys.argv[1:] if argv is None else list(argv)
+    socket_path = os.environ.get("DBT_SOCKET_PATH", DEFAULT_SOCKET_PATH)
+    if args[:1] == ["--socket-path"] and len(args) > 1:
+        socket_path, args = args[1], args[2:]
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError as exc:
+            print(f"Could not connect to a dbt daemon at {socket_path}: {exc}", file=sys.stderr)
+            return UNHANDLED_ERROR
+        sock.sendall(json.dumps({"args": args}).encode("utf-8") + b"\n")
+
+        with sock.makefile("r", encoding="utf-8") as responses:
+            for line in responses:
+                response = json.loads(line)
+                if "msg" in response:
+                    print(response["msg"], flush=True)
+                    continue
+                for result in response.get("result", []):
+                    print(result)
+                if response["exception"]:
+                    print(response["exception"], file=sys.stderr)
+                    return UNHANDLED_ERROR
+                return SUCCESS if response["success"] else MODEL_ERROR
+
+    print("The dbt daemon closed the connection without a result", file=sys.stderr)
+    return UNHANDLED_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
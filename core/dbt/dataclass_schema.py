@@ -1,5 +1,17 @@
-from typing import ClassVar, cast, get_type_hints, List, Tuple, Dict, Any, Optional
+from typing import (
+    ClassVar,
+    cast,
+    get_type_hints,
+    List,
+    Tuple,
+    Dict,
+    Any,
+    Optional,
+    Callable,
+    Type,
+)
 import re
+import threading
 import jsonschema
 from dataclasses import fields, Field
 from enum import Enum
@@ -14,11 +26,64 @@ from mashumaro.jsonschema import build_json_schema
 
 import functools
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
+
 
 class ValidationError(jsonschema.ValidationError):
     pass
 
 
+# jsonschema validators keep state while resolving references, so each
+# thread gets its own validator for each class.
+_thread_validators = threading.local()
+
+# If fastjsonschema is installed, classes that are validated this many times
+# get a compiled validator, which is much faster once it has paid for its
+# compilation. Data that it rejects is validated again by jsonschema, so
+# errors are the same either way.
+FAST_VALIDATOR_THRESHOLD = 100
+
+_fast_validators: Dict[Type, Optional[Callable[[Any], Any]]] = {}
+_validation_counts: Dict[Type, int] = {}
+_fast_validators_lock = threading.Lock()
+
+
+def _get_validator(cls) -> jsonschema.Draft7Validator:
+    validators = getattr(_thread_validators, "validators", None)
+    if validators is None:
+        validators = _thread_validators.validators = {}
+    validator = validators.get(cls)
+    if validator is None:
+        validator = validators[cls] = jsonschema.Draft7Validator(cls.json_schema())
+    return validator
+
+
+def _get_fast_validator(cls) -> Optional[Callable[[Any], Any]]:
+    if fastjsonschema is None:
+        return None
+    if cls in _fast_validators:
+        return _fast_validators[cls]
+
+    count = _validation_counts.get(cls, 0) + 1
+    _validation_counts[cls] = count
+    if count < FAST_VALIDATOR_THRESHOLD:
+        return None
+
+    with _fast_validators_lock:
+        if cls not in _fast_validators:
+            try:
+                # don't fill in defaults, validation must not change the data
+                _fast_validators[cls] = fastjsonschema.compile(
+                    cls.json_schema(), use_default=False
+                )
+            except Exception:
+                _fast_validators[cls] = None
+    return _fast_validators[cls]
+
+
 class DateTimeSerialization(SerializationStrategy):
     def serialize(self, value) -> str:
         out = value.isoformat()
@@ -82,9 +147,16 @@ class dbtClassMixin(DataClassDictMixin):
 
     @classmethod
     def validate(cls, data):
-        json_schema = cls.json_schema()
-        validator = jsonschema.Draft7Validator(json_schema)
-        error = next(iter(validator.iter_errors(data)), None)
+        fast_validator = _get_fast_validator(cls)
+        if fast_validator is not None:
+            try:
+                fast_validator(data)
+                return
+            except Exception:
+                # let jsonschema find the error, so the message doesn't change
+                pass
+
+        error = next(iter(_get_validator(cls).iter_errors(data)), None)
         if error is not None:
             raise ValidationError.create_from(error) from error
 
@@ -14,9 +14,17 @@ class EventManager:
         self.invocation_id: str = str(uuid4())
 
     def fire_event(self, e: BaseEvent, level: Optional[EventLevel] = None) -> None:
+        # Building the message is most of the cost of an event, so check that
+        # something will consume it first.
+        event_level = level or e.level_tag()
+        loggers = [logger for logger in self.loggers if logger.enabled_for(event_level)]
+        test_binary_serialization = os.environ.get("DBT_TEST_BINARY_SERIALIZATION")
+        if not (loggers or self.callbacks or test_binary_serialization):
+            return
+
         msg = msg_from_base_event(e, level=level)
 
-        if os.environ.get("DBT_TEST_BINARY_SERIALIZATION"):
+        if test_binary_serialization:
             print(f"--- {msg.info.name}")
             try:
                 msg.SerializeToString()
@@ -25,7 +33,7 @@ class EventManager:
                     f"{msg.info.name} is not serializable to binary. Originating exception: {exc}, {traceback.format_exc()}"
                 )
 
-        for logger in self.loggers:
+        for logger in loggers:
             if logger.filter(msg):  # type: ignore
                 logger.write_line(msg)
 
@@ -114,6 +114,17 @@ class _Logger:
         log.addHandler(handler)
         return log
 
+    def enabled_for(self, level: EventLevel) -> bool:
+        """Whether a line at the given level would be written, so that events
+        nobody writes can be skipped before their message is built.
+        """
+        if self._python_logger is None:
+            return False
+        if isinstance(self._python_logger, logging.Logger):
+            return self._python_logger.isEnabledFor(_log_level_map[level])
+        # the legacy logbook logger does its own level filtering
+        return True
+
     def create_line(self, msg: EventMsg) -> str:
         raise NotImplementedError()
 
@@ -1,5 +1,4 @@
 from typing import Set, Iterable, Iterator, Optional, NewType
-from itertools import product
 import networkx as nx  # type: ignore
 from functools import partial
 
@@ -83,49 +82,41 @@ class Graph:
         removed nodes are preserved as explicit new edges.
         """
 
-        new_graph = self.graph.copy()
         include_nodes = set(selected)
-
-        still_removing = True
-        while still_removing:
-            nodes_to_remove = list(
-                node
-                for node in new_graph
-                if node not in include_nodes
-                and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
-            )
-            if len(nodes_to_remove) == 0:
-                still_removing = False
-            else:
-                new_graph.remove_nodes_from(nodes_to_remove)
-
-        # sort remaining nodes by degree
-        remaining_nodes = list(new_graph.nodes())
-        remaining_nodes.sort(
-            key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node)
-        )
-
-        for node in remaining_nodes:
-            if node not in include_nodes:
-                source_nodes = [x for x, _ in new_graph.in_edges(node)]
-                target_nodes = [x for _, x in new_graph.out_edges(node)]
-
-                new_edges = product(source_nodes, target_nodes)
-                non_cyclic_new_edges = [
-                    (source, target)
-                    for source, target in new_edges
-                    if source != target and not new_graph.has_edge(source, target)
-                ]  # removes cyclic refs and edges already existing in new graph
-
-                new_graph.add_edges_from(non_cyclic_new_edges)
-                new_graph.remove_node(node)
-
         for node in include_nodes:
-            if node not in new_graph:
+            if node not in self.graph:
                 raise ValueError(
                     "Couldn't find model '{}' -- does it exist or is it disabled?".format(node)
                 )
 
+        new_graph = self.graph.__class__()
+        new_graph.graph.update(self.graph.graph)
+        new_graph.add_nodes_from(
+            (node, data) for node, data in self.graph.nodes(data=True) if node in include_nodes
+        )
+
+        for source in new_graph:
+            # keep the edges between included nodes as they are
+            removed_nodes = []
+            for target, data in self.graph.adj[source].items():
+                if target in include_nodes:
+                    new_graph.add_edge(source, target, **data)
+                else:
+                    removed_nodes.append(target)
+
+            # then walk through the removed nodes downstream of this node, to
+            # find the included nodes it has a path to
+            visited = set(removed_nodes)
+            while removed_nodes:
+                node = removed_nodes.pop()
+                for target in self.graph.successors(node):
+                    if target in include_nodes:
+                        if target != source and not new_graph.has_edge(source, target):
+                            new_graph.add_edge(source, target)
+                    elif target not in visited:
+                        visited.add(target)
+                        removed_nodes.append(target)
+
         return Graph(new_graph)
 
     def subgraph(self, nodes: Iterable[UniqueId]) -> "Graph":
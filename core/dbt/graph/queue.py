@@ -2,7 +2,7 @@ import networkx as nx  # type: ignore
 import threading
 
 from queue import PriorityQueue
-from typing import Dict, Set, List, Generator, Optional
+from typing import Dict, Set, List, Mapping, Optional, Tuple
 
 from .graph import UniqueId
 from dbt.contracts.graph.nodes import (
@@ -24,7 +24,13 @@ class GraphQueue:
     the same time, as there is an unlocked race!
     """
 
-    def __init__(self, graph: nx.DiGraph, manifest: Manifest, selected: Set[UniqueId]) -> None:
+    def __init__(
+        self,
+        graph: nx.DiGraph,
+        manifest: Manifest,
+        selected: Set[UniqueId],
+        execution_times: Optional[Mapping[str, float]] = None,
+    ) -> None:
         self.graph = graph
         self.manifest = manifest
         self._selected = selected
@@ -38,7 +44,11 @@ class GraphQueue:
         # this lock controls most things
         self.lock = threading.Lock()
         # store the 'score' of each node as a number. Lower is higher priority.
-        self._scores = self._get_scores(self.graph)
+        self._scores: Mapping[str, float]
+        if execution_times is None:
+            self._scores = self._get_scores(self.graph)
+        else:
+            self._scores = self._get_critical_path_scores(self.graph, execution_times)
         # populate the initial queue
         self._find_new_additions(list(self.graph.nodes()))
         # awaits after task end
@@ -58,33 +68,33 @@ class GraphQueue:
         return True
 
     @staticmethod
-    def _grouped_topological_sort(
-        graph: nx.DiGraph,
-    ) -> Generator[List[str], None, None]:
-        """Topological sort of given graph that groups ties.
-
-        Adapted from `nx.topological_sort`, this function returns a topo sort of a graph however
-        instead of arbitrarily ordering ties in the sort order, ties are grouped together in
-        lists.
+    def _topological_order(graph: nx.DiGraph) -> Tuple[List[str], List[List[int]], List[int]]:
+        """Number the nodes of the graph, once.
 
         Args:
             graph: The graph to be sorted.
 
         Returns:
-            A generator that yields lists of nodes, one list per graph depth level.
+            The nodes, the indexes of each node's children, and the node indexes
+            in topological order.
         """
-        indegree_map = {v: d for v, d in graph.in_degree() if d > 0}
-        zero_indegree = [v for v, d in graph.in_degree() if d == 0]
-
-        while zero_indegree:
-            yield zero_indegree
-            new_zero_indegree = []
-            for v in zero_indegree:
-                for _, child in graph.edges(v):
-                    indegree_map[child] -= 1
-                    if not indegree_map[child]:
-                        new_zero_indegree.append(child)
-            zero_indegree = new_zero_indegree
+        nodes = list(graph.nodes())
+        index = {node: i for i, node in enumerate(nodes)}
+        children = [[index[child] for child in graph.successors(node)] for node in nodes]
+
+        indegree = [0] * len(nodes)
+        for node_children in children:
+            for child in node_children:
+                indegree[child] += 1
+
+        order = [i for i, degree in enumerate(indegree) if degree == 0]
+        # order grows while we walk it
+        for i in order:
+            for child in children[i]:
+                indegree[child] -= 1
+                if not indegree[child]:
+                    order.append(child)
+        return nodes, children, order
 
     def _get_scores(self, graph: nx.DiGraph) -> Dict[str, int]:
         """Scoring nodes for processing order.
@@ -97,18 +107,49 @@ class GraphQueue:
         Returns:
             A dictionary consisting of `node name`:`score` pairs.
         """
-        # split graph by connected subgraphs
-        subgraphs = (graph.subgraph(x) for x in nx.connected_components(nx.Graph(graph)))
-
-        # score all nodes in all subgraphs
-        scores = {}
-        for subgraph in subgraphs:
-            grouped_nodes = self._grouped_topological_sort(subgraph)
-            for level, group in enumerate(grouped_nodes):
-                for node in group:
-                    scores[node] = level
-
-        return scores
+        nodes, children, order = self._topological_order(graph)
+
+        # the depth of a node is the longest path to it from a node without parents
+        levels = [0] * len(nodes)
+        for i in order:
+            for child in children[i]:
+                if levels[child] <= levels[i]:
+                    levels[child] = levels[i] + 1
+
+        return {node: level for node, level in zip(nodes, levels)}
+
+    def _get_critical_path_scores(
+        self, graph: nx.DiGraph, execution_times: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Scoring nodes for processing order by their critical path.
+
+        The score of a node is the negated execution time of the longest path
+        from that node to the end of the graph, so nodes at the head of long
+        chains of work are processed first. Nodes without a known execution
+        time are assumed to take the average of the known times.
+
+        Args:
+            graph: The graph to be scored.
+            execution_times: The execution time in seconds of nodes, by unique id.
+
+        Returns:
+            A dictionary consisting of `node name`:`score` pairs.
+        """
+        nodes, children, order = self._topological_order(graph)
+
+        known = [execution_times[node] for node in nodes if node in execution_times]
+        default = sum(known) / len(known) if known else 1.0
+        weights = [execution_times.get(node, default) for node in nodes]
+
+        remaining = [0.0] * len(nodes)
+        for i in reversed(order):
+            longest = 0.0
+            for child in children[i]:
+                if remaining[child] > longest:
+                    longest = remaining[child]
+            remaining[i] = weights[i] + longest
+
+        return {node: -path for node, path in zip(nodes, remaining)}
 
     def get(self, block: bool = True, timeout: Optional[float] = None) -> GraphMemberNode:
         """Get a node off the inner priority queue. By default, this blocks.
@@ -14,3 +14,26 @@
   {% endcall %}
   {{ return(load_result('collect_freshness')) }}
 {% endmacro %}
+
+{% macro collect_freshness_batch(sources) %}
+  {{ return(adapter.dispatch('collect_freshness_batch', 'dbt')(sources)) }}
+{% endmacro %}
+
+{#-- one row with a max_loaded_at column for each source, so each keeps its own
+     type, and then snapshotted_at --#}
+{% macro default__collect_freshness_batch(sources) %}
+  {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+    select
+    {%- for source in sources %}
+      (
+        select max({{ source.loaded_at_field }})
+        from {{ source.source }}
+        {% if source.filter %}
+        where {{ source.filter }}
+        {% endif %}
+      ) as max_loaded_at_{{ loop.index0 }},
+    {%- endfor %}
+      {{ current_timestamp() }} as snapshotted_at
+  {% endcall %}
+  {{ return(load_result('collect_freshness_batch')) }}
+{% endmacro %}
@@ -50,3 +50,10 @@ The macro override naming method (spark__statement) only works for macros which
 
   {% do return(load_result("run_query_statement").table) %}
 {% endmacro %}
+
+
+{# like run_query, but the rows are fetched in batches as they are iterated over #}
+{% macro stream_query(sql, batch_size=1000) %}
+  {%- set res, stream = adapter.execute_stream(sql, auto_begin=false, batch_size=batch_size) -%}
+  {% do return(stream) %}
+{% endmacro %}
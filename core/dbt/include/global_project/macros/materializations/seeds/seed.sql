@@ -30,8 +30,9 @@
   {% endif %}
 
   {% set code = 'CREATE' if full_refresh_mode else 'INSERT' %}
-  {% set rows_affected = (agate_table.rows | length) %}
   {% set sql = load_csv_rows(model, agate_table) %}
+  {#-- counted after loading, as large seeds count their rows as they stream them --#}
+  {% set rows_affected = (agate_table.rows | length) %}
 
   {% call noop_statement('main', code ~ ' ' ~ rows_affected, code, rows_affected) %}
     {{ get_csv_sql(create_table_sql, sql) }};
@@ -1,8 +1,16 @@
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
 from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from dataclasses import fields
 import datetime
+import gc
+import math
+import multiprocessing
+import mmap
 import os
+import struct
+import threading
 import traceback
 from typing import (
     Dict,
@@ -69,14 +77,16 @@ from dbt.clients.system import (
     write_file,
 )
 from dbt.config import Project, RuntimeConfig
+from dbt.context.base import get_cli_var_checksum
 from dbt.context.docs import generate_runtime_docs_context
 from dbt.context.macro_resolver import MacroResolver, TestMacroNamespace
 from dbt.context.configured import generate_macro_context
 from dbt.context.providers import ParseProvider
-from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile
+from dbt.contracts.files import FileHash, ParseFileType, SchemaSourceFile, SourceFile
 from dbt.parser.read_files import (
     ReadFilesFromFileSystem,
     load_source_file,
+    load_skipped_contents,
     FileDiff,
     ReadFilesFromDiff,
     ReadFiles,
@@ -164,6 +174,84 @@ def extended_msgpack_decoder(code, data):
         return msgpack.ExtType(code, data)
 
 
+# partial_parse.msgpack starts with a fixed-size prefix (magic bytes, format
+# version, header length), then a msgpack header with the manifest metadata,
+# the state check and an index of the other sections, then one section for
+# each of the other manifest fields. The header is enough to tell whether the
+# saved manifest can be used, so the sections are only decoded when it can.
+PARTIAL_PARSE_FILE_MAGIC = b"dbtpp"
+PARTIAL_PARSE_FILE_FORMAT_VERSION = 1
+PARTIAL_PARSE_FILE_PREFIX = struct.Struct(">5sHQ")
+PARTIAL_PARSE_HEADER_FIELDS = ("metadata", "state_check")
+# These are set for each invocation when the file is read, so they're left
+# out, and an unchanged manifest is always written out the same way.
+PARTIAL_PARSE_SKIPPED_METADATA = ("generated_at", "invocation_id")
+
+
+def encode_partial_parse_file(data: Dict[str, Any]) -> bytes:
+    header = {name: data.pop(name) for name in PARTIAL_PARSE_HEADER_FIELDS}
+    for name in PARTIAL_PARSE_SKIPPED_METADATA:
+        header["metadata"].pop(name, None)
+    sections = []
+    index = {}
+    offset = 0
+    for name, value in data.items():
+        section = extended_mashumaro_encoder(value)
+        index[name] = [offset, len(section)]
+        offset += len(section)
+        sections.append(section)
+    header["sections"] = index
+    header_bytes = extended_mashumaro_encoder(header)
+    prefix = PARTIAL_PARSE_FILE_PREFIX.pack(
+        PARTIAL_PARSE_FILE_MAGIC, PARTIAL_PARSE_FILE_FORMAT_VERSION, len(header_bytes)
+    )
+    return b"".join([prefix, header_bytes, *sections])
+
+
+# A partial_parse.msgpack file that has been opened (usually memory-mapped).
+# Decoding the header only gives a Manifest with the metadata and state
+# check, which is enough for is_partial_parsable. The other sections are
+# decoded by 'read_manifest'.
+class PartialParseFile:
+    def __init__(self, data) -> None:
+        self.data = data
+        self.magic, self.format_version, header_length = PARTIAL_PARSE_FILE_PREFIX.unpack_from(
+            data
+        )
+        self.header: Dict[str, Any] = {}
+        self.sections: Dict[str, List[int]] = {}
+        self.sections_start = PARTIAL_PARSE_FILE_PREFIX.size + header_length
+        if self.is_current_format:
+            self.header = extended_mashumuro_decoder(
+                data[PARTIAL_PARSE_FILE_PREFIX.size : self.sections_start]
+            )
+            self.sections = self.header.pop("sections")
+
+    @property
+    def is_current_format(self) -> bool:
+        return (
+            self.magic == PARTIAL_PARSE_FILE_MAGIC
+            and self.format_version == PARTIAL_PARSE_FILE_FORMAT_VERSION
+        )
+
+    def read_header(self) -> Manifest:
+        return Manifest.from_msgpack(self.data, decoder=lambda data: dict(self.header))
+
+    def read_section(self, name: str) -> Any:
+        offset, length = self.sections[name]
+        start = self.sections_start + offset
+        return extended_mashumuro_decoder(self.data[start : start + length])
+
+    def read_manifest(self) -> Manifest:
+        def decoder(data) -> Dict[str, Any]:
+            dct = dict(self.header)
+            for name in self.sections:
+                dct[name] = self.read_section(name)
+            return dct
+
+        return Manifest.from_msgpack(self.data, decoder=decoder)
+
+
 def version_to_str(version: Optional[Union[str, int]]) -> str:
     if isinstance(version, int):
         return str(version)
@@ -213,6 +301,9 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
     is_partial_parse_enabled: Optional[bool] = None
     is_static_analysis_enabled: Optional[bool] = None
     read_files_elapsed: Optional[float] = None
+    read_files_threads: Optional[int] = None
+    read_skipped_path_count: int = 0
+    parse_workers: Optional[int] = None
     load_macros_elapsed: Optional[float] = None
     parse_project_elapsed: Optional[float] = None
     patch_sources_elapsed: Optional[float] = None
@@ -226,6 +317,103 @@ class ManifestLoaderInfo(dbtClassMixin, Writable):
         return dct
 
 
+# What a worker process found when parsing one model file. The main
+# process adds the nodes, env vars and vars to its manifest in file order.
+@dataclass
+class WorkerParseResult:
+    nodes: List[ManifestNode]
+    env_vars: List[Tuple[str, str]]
+    vars: List[Tuple[str, str]]
+    # vars used by e.g. generate_schema_name, which go in the state check
+    state_check_vars: Dict[str, str]
+    static_analysis_path_count: int
+    static_analysis_parsed_path_count: int
+
+
+# A ModelParser that keeps the parsed nodes instead of adding them to the
+# manifest, for use in worker processes.
+class WorkerModelParser(ModelParser):
+    def __init__(self, project, manifest, root_project) -> None:
+        super().__init__(project, manifest, root_project)
+        self.parsed_nodes: List[ManifestNode] = []
+
+    def add_result_node(self, block: FileBlock, node: ManifestNode):
+        self.parsed_nodes.append(node)
+
+
+# The ManifestLoader that started the worker processes. They are forked,
+# so they get a copy of it with all of the macros loaded.
+_worker_parse_state: Optional["ManifestLoader"] = None
+
+
+# How long to wait for a chunk of files from a worker before giving up on
+# the workers and parsing the rest of the files serially.
+PARSE_WORKER_TIMEOUT = 300
+
+
+def process_is_single_threaded() -> bool:
+    # Only a process with no other threads can be forked safely. The child
+    # only gets the forking thread, so a lock held by any other thread (e.g.
+    # a logging lock, or one of dbtRunner.stream_show's threads) is never
+    # released there. Threads started by extension modules (e.g. the static
+    # parser's thread pool) don't show up in threading, but do in /proc.
+    # Without /proc (e.g. on macOS) there's no way to know, so don't fork.
+    if threading.active_count() != 1:
+        return False
+    try:
+        return len(os.listdir("/proc/self/task")) == 1
+    except OSError:
+        return False
+
+
+def parse_model_files_in_worker(
+    project_name: str, file_ids: List[str]
+) -> List[Optional[WorkerParseResult]]:
+    loader = _worker_parse_state
+    assert loader is not None
+    # only the main process sends tracking events
+    dbt.tracking.active_user = None
+    manifest = loader.manifest
+    parsing_info = manifest._parsing_info
+    parser = WorkerModelParser(loader.all_projects[project_name], manifest, loader.root_project)
+
+    results: List[Optional[WorkerParseResult]] = []
+    for file_id in file_ids:
+        source_file = manifest.files[file_id]
+        assert isinstance(source_file, SourceFile)
+        env_var_count = len(source_file.env_vars)
+        var_count = len(source_file.vars)
+        state_check_vars = dict(manifest.state_check.vars)
+        path_count = parsing_info.static_analysis_path_count
+        parsed_path_count = parsing_info.static_analysis_parsed_path_count
+        parser.parsed_nodes = []
+        try:
+            parser.parse_file(FileBlock(load_skipped_contents(source_file)))
+        except Exception:
+            # The main process parses this file again to raise the error
+            results.append(None)
+            continue
+        results.append(
+            WorkerParseResult(
+                nodes=parser.parsed_nodes,
+                env_vars=[
+                    (var, manifest.env_vars[var]) for var in source_file.env_vars[env_var_count:]
+                ],
+                vars=[(var, manifest.vars[var]) for var in source_file.vars[var_count:]],
+                state_check_vars={
+                    var: checksum
+                    for var, checksum in manifest.state_check.vars.items()
+                    if var not in state_check_vars
+                },
+                static_analysis_path_count=parsing_info.static_analysis_path_count - path_count,
+                static_analysis_parsed_path_count=(
+                    parsing_info.static_analysis_parsed_path_count - parsed_path_count
+                ),
+            )
+        )
+    return results
+
+
 # The ManifestLoader loads the manifest. The standard way to use the
 # ManifestLoader is using the 'get_full_manifest' class method, but
 # many tests use abbreviated processes.
@@ -236,6 +424,7 @@ class ManifestLoader:
         all_projects: Mapping[str, Project],
         macro_hook: Optional[Callable[[Manifest], Any]] = None,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
     ) -> None:
         self.root_project: RuntimeConfig = root_project
         self.all_projects: Mapping[str, Project] = all_projects
@@ -255,6 +444,9 @@ class ManifestLoader:
             self.macro_hook = macro_hook
 
         self._perf_info = self.build_perf_info()
+        self._parse_workers: int = getattr(get_flags(), "PARSE_WORKERS", None) or 1
+        self._perf_info.parse_workers = self._parse_workers
+        self._parse_executor: Optional[ProcessPoolExecutor] = None
 
         # State check determines whether the saved_manifest and the current
         # manifest match well enough to do partial parsing
@@ -264,8 +456,12 @@ class ManifestLoader:
         self.partially_parsing = False
         self.partial_parser: Optional[PartialParsing] = None
 
-        # This is a saved manifest from a previous run that's used for partial parsing
-        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse()
+        # This is a saved manifest from a previous run that's used for partial parsing.
+        # A long-lived process can pass in the manifest it parsed last instead of
+        # having it read back from partial_parse.msgpack.
+        self.saved_manifest: Optional[Manifest] = self.read_manifest_for_partial_parse(
+            saved_manifest
+        )
 
     # This is the method that builds a complete manifest. We sometimes
     # use an abbreviated process in tests.
@@ -275,6 +471,7 @@ class ManifestLoader:
         config: RuntimeConfig,
         *,
         file_diff: Optional[FileDiff] = None,
+        saved_manifest: Optional[Manifest] = None,
         reset: bool = False,
         write_perf_info=False,
     ) -> Manifest:
@@ -313,6 +510,7 @@ class ManifestLoader:
                 projects,
                 macro_hook=macro_hook,
                 file_diff=file_diff,
+                saved_manifest=saved_manifest,
             )
 
             manifest = loader.load()
@@ -344,7 +542,9 @@ class ManifestLoader:
         # used to get the SourceFiles from the manifest files.
         saved_files = self.saved_manifest.files if self.saved_manifest else {}
         file_reader: Optional[ReadFiles] = None
-        if self.file_diff:
+        # A file diff only describes changes to the saved files, so it's no use
+        # without a saved manifest
+        if self.file_diff and self.saved_manifest is not None:
             # We're getting files from a file diff
             file_reader = ReadFilesFromDiff(
                 all_projects=self.all_projects,
@@ -355,22 +555,31 @@ class ManifestLoader:
             )
         else:
             # We're getting files from the file system
+            flags = get_flags()
+            read_files_threads = getattr(flags, "READ_FILES_THREADS", None) or 1
             file_reader = ReadFilesFromFileSystem(
                 all_projects=self.all_projects,
                 files=self.manifest.files,
                 saved_files=saved_files,
+                threads=read_files_threads,
+                verify_skipped_files=bool(getattr(flags, "VERIFY_SKIPPED_FILES", False)),
             )
+            self._perf_info.read_files_threads = read_files_threads
 
         # Set the files in the manifest and save the project_parser_files
         file_reader.read_files()
         self.manifest.files = file_reader.files
+        if isinstance(file_reader, ReadFilesFromFileSystem):
+            self._perf_info.read_skipped_path_count = file_reader.skipped_file_count
         project_parser_files = orig_project_parser_files = file_reader.project_parser_files
         self._perf_info.path_count = len(self.manifest.files)
         self._perf_info.read_files_elapsed = time.perf_counter() - start_read_files
 
         skip_parsing = False
         if self.saved_manifest is not None:
-            self.partial_parser = PartialParsing(self.saved_manifest, self.manifest.files)
+            self.partial_parser = PartialParsing(
+                self.saved_manifest, self.manifest.files, self.root_project.cli_vars
+            )
             skip_parsing = self.partial_parser.skip_parsing()
             if skip_parsing:
                 # nothing changed, so we don't need to generate project_parser_files
@@ -472,12 +681,15 @@ class ManifestLoader:
                 DocumentationParser,
                 HookParser,
             ]
-            for project in self.all_projects.values():
-                if project.project_name not in project_parser_files:
-                    continue
-                self.parse_project(
-                    project, project_parser_files[project.project_name], parser_types
-                )
+            try:
+                for project in self.all_projects.values():
+                    if project.project_name not in project_parser_files:
+                        continue
+                    self.parse_project(
+                        project, project_parser_files[project.project_name], parser_types
+                    )
+            finally:
+                self.stop_parse_workers()
 
             # Now that we've loaded most of the nodes (except for schema tests, sources, metrics)
             # load up the Lookup objects to resolve them by name, so the SourceFiles store
@@ -615,7 +827,7 @@ class ManifestLoader:
             if "MacroParser" in parser_files:
                 parser = MacroParser(project, self.manifest)
                 for file_id in parser_files["MacroParser"]:
-                    block = FileBlock(self.manifest.files[file_id])
+                    block = FileBlock(load_skipped_contents(self.manifest.files[file_id]))
                     parser.parse_file(block)
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
@@ -624,7 +836,7 @@ class ManifestLoader:
             if "GenericTestParser" in parser_files:
                 parser = GenericTestParser(project, self.manifest)
                 for file_id in parser_files["GenericTestParser"]:
-                    block = FileBlock(self.manifest.files[file_id])
+                    block = FileBlock(load_skipped_contents(self.manifest.files[file_id]))
                     parser.parse_file(block)
                     # increment parsed path count for performance tracking
                     self._perf_info.parsed_path_count += 1
@@ -659,21 +871,27 @@ class ManifestLoader:
 
             # Parse the project files for this parser
             parser: Parser = parser_cls(project, self.manifest, self.root_project)
-            for file_id in parser_files[parser_name]:
-                block = FileBlock(self.manifest.files[file_id])
-                if isinstance(parser, SchemaParser):
-                    assert isinstance(block.file, SchemaSourceFile)
-                    if self.partially_parsing:
-                        dct = block.file.pp_dict
+            if isinstance(parser, ModelParser) and self.can_parse_in_workers(
+                parser_files[parser_name]
+            ):
+                self.parse_model_files_in_workers(project, parser, parser_files[parser_name])
+                project_parsed_path_count = len(parser_files[parser_name])
+            else:
+                for file_id in parser_files[parser_name]:
+                    block = FileBlock(load_skipped_contents(self.manifest.files[file_id]))
+                    if isinstance(parser, SchemaParser):
+                        assert isinstance(block.file, SchemaSourceFile)
+                        if self.partially_parsing:
+                            dct = block.file.pp_dict
+                        else:
+                            dct = block.file.dict_from_yaml
+                        # this is where the schema file gets parsed
+                        parser.parse_file(block, dct=dct)
+                        # Came out of here with UnpatchedSourceDefinition containing configs at the source level
+                        # and not configs at the table level (as expected)
                     else:
-                        dct = block.file.dict_from_yaml
-                    # this is where the schema file gets parsed
-                    parser.parse_file(block, dct=dct)
-                    # Came out of here with UnpatchedSourceDefinition containing configs at the source level
-                    # and not configs at the table level (as expected)
-                else:
-                    parser.parse_file(block)
-                project_parsed_path_count += 1
+                        parser.parse_file(block)
+                    project_parsed_path_count += 1
 
             # Save timing info
             project_loader_info.parsers.append(
@@ -708,6 +926,102 @@ class ManifestLoader:
             self._perf_info.parsed_path_count + total_parsed_path_count
         )
 
+    # Model files are parsed in worker processes when there are enough of
+    # them. The workers are forked the first time they're needed, so that
+    # they have the loaded macros without having to serialize them.
+    def can_parse_in_workers(self, file_ids: List[str]) -> bool:
+        if self._parse_workers <= 1 or len(file_ids) <= 1:
+            return False
+        if self._parse_executor is not None:
+            return True
+        if (
+            "fork" not in multiprocessing.get_all_start_methods()
+            or not process_is_single_threaded()
+        ):
+            fire_event(
+                Note(msg="Unable to fork parse workers safely, parsing model files serially"),
+                level=EventLevel.DEBUG,
+            )
+            self._parse_workers = 1
+            return False
+
+        global _worker_parse_state
+        _worker_parse_state = self
+        # Keep the garbage collector in the workers away from the objects
+        # they inherit, so it doesn't copy all of their memory pages.
+        gc.freeze()
+        self._parse_executor = ProcessPoolExecutor(
+            max_workers=self._parse_workers, mp_context=multiprocessing.get_context("fork")
+        )
+        return True
+
+    def stop_parse_workers(self, terminate: bool = False) -> None:
+        global _worker_parse_state
+        if self._parse_executor is None:
+            return
+        if terminate:
+            # a hung worker would otherwise keep shutdown, and dbt's exit,
+            # waiting forever
+            for process in list(self._parse_executor._processes.values()):  # type: ignore[attr-defined]
+                process.terminate()
+        self._parse_executor.shutdown(cancel_futures=True)
+        self._parse_executor = None
+        gc.unfreeze()
+        _worker_parse_state = None
+
+    # Parse model files in the worker processes. The workers send back the
+    # nodes they parsed, which are added to the manifest in the same order
+    # as a serial parse, so the manifest is the same either way. A file
+    # that fails in a worker is parsed again here, so errors are raised the
+    # same way too.
+    def parse_model_files_in_workers(
+        self, project: Project, parser: ModelParser, file_ids: List[str]
+    ) -> None:
+        assert self._parse_executor is not None
+        # several chunks per worker, so one slow chunk doesn't hold up the rest
+        chunk_size = math.ceil(len(file_ids) / (self._parse_workers * 4))
+        chunks = [file_ids[i : i + chunk_size] for i in range(0, len(file_ids), chunk_size)]
+        futures = [
+            self._parse_executor.submit(parse_model_files_in_worker, project.project_name, chunk)
+            for chunk in chunks
+        ]
+        parsing_info = self.manifest._parsing_info
+
+        for chunk, future in zip(chunks, futures):
+            results: List[Optional[WorkerParseResult]] = [None] * len(chunk)
+            if self._parse_executor is not None:
+                try:
+                    results = future.result(timeout=PARSE_WORKER_TIMEOUT)
+                except TimeoutError:
+                    fire_event(
+                        Note(msg="Parse workers stopped responding, parsing model files serially"),
+                        level=EventLevel.WARN,
+                    )
+                    self.stop_parse_workers(terminate=True)
+                    self._parse_workers = 1
+                except Exception:
+                    # e.g. a worker died or a result couldn't be pickled
+                    pass
+            for file_id, result in zip(chunk, results):
+                block = FileBlock(self.manifest.files[file_id])
+                if result is None:
+                    load_skipped_contents(block.file)
+                    parser.parse_file(block)
+                    continue
+                for var, value in result.env_vars:
+                    self.manifest.env_vars[var] = value
+                    block.file.env_vars.append(var)  # type: ignore[union-attr]
+                for var, checksum in result.vars:
+                    self.manifest.vars[var] = checksum
+                    block.file.vars.append(var)  # type: ignore[union-attr]
+                self.manifest.state_check.vars.update(result.state_check_vars)
+                for node in result.nodes:
+                    parser.add_result_node(block, node)
+                parsing_info.static_analysis_path_count += result.static_analysis_path_count
+                parsing_info.static_analysis_parsed_path_count += (
+                    result.static_analysis_parsed_path_count
+                )
+
     # This should only be called after the macros have been loaded
     def build_macro_resolver(self):
         internal_package_names = get_adapter_package_names(self.root_project.credentials.type)
@@ -750,7 +1064,7 @@ class ManifestLoader:
                     UnableToPartialParse(reason="saved manifest contained the wrong version")
                 )
                 self.manifest.metadata.dbt_version = __version__
-            manifest_msgpack = self.manifest.to_msgpack(extended_mashumaro_encoder)
+            manifest_msgpack = self.manifest.to_msgpack(encode_partial_parse_file)
             make_directory(os.path.dirname(path))
             with open(path, "wb") as fp:
                 fp.write(manifest_msgpack)
@@ -758,6 +1072,16 @@ class ManifestLoader:
             raise
 
     def inject_external_nodes(self) -> bool:
+        pm = plugins.get_plugin_manager(self.root_project.project_name)
+        plugin_model_nodes = pm.get_nodes().models
+        external_nodes = [
+            ModelNode.from_args(node_arg) for node_arg in plugin_model_nodes.values()
+        ]
+        # If the plugins return the same nodes as last time, leave the manifest
+        # alone, so that it doesn't need to be written out again.
+        if self.external_nodes_unchanged(external_nodes):
+            return False
+
         # Remove previously existing external nodes since we are regenerating them
         manifest_nodes_modified = False
         # Remove all dependent nodes before removing referencing nodes
@@ -769,10 +1093,7 @@ class ManifestLoader:
             self.manifest.nodes.pop(unique_id)
 
         # Inject any newly-available external nodes
-        pm = plugins.get_plugin_manager(self.root_project.project_name)
-        plugin_model_nodes = pm.get_nodes().models
-        for node_arg in plugin_model_nodes.values():
-            node = ModelNode.from_args(node_arg)
+        for node in external_nodes:
             # node may already exist from package or running project - in which case we should avoid clobbering it with an external node
             if node.unique_id not in self.manifest.nodes:
                 self.manifest.add_node_nofile(node)
@@ -780,6 +1101,29 @@ class ManifestLoader:
 
         return manifest_nodes_modified
 
+    def external_nodes_unchanged(self, external_nodes: List[ModelNode]) -> bool:
+        def without_created_at(node: ManifestNode) -> Dict[str, Any]:
+            dct = node.to_dict()
+            del dct["created_at"]
+            return dct
+
+        existing_nodes = {
+            unique_id: self.manifest.nodes[unique_id]
+            for unique_id in self.manifest.external_node_unique_ids
+        }
+        # nodes that a project already defines are not injected
+        new_nodes = {
+            node.unique_id: node
+            for node in external_nodes
+            if node.unique_id not in self.manifest.nodes or node.unique_id in existing_nodes
+        }
+        if new_nodes.keys() != existing_nodes.keys():
+            return False
+        return all(
+            without_created_at(node) == without_created_at(existing_nodes[unique_id])
+            for unique_id, node in new_nodes.items()
+        )
+
     def is_partial_parsable(self, manifest: Manifest) -> Tuple[bool, Optional[str]]:
         """Compare the global hashes of the read-in parse results' values to
         the known ones, and return if it is ok to re-use the results.
@@ -793,15 +1137,28 @@ class ManifestLoader:
             # If the version is wrong, the other checks might not work
             return False, ReparseReason.version_mismatch
         if self.manifest.state_check.vars_hash != manifest.state_check.vars_hash:
+            fire_event(UnableToPartialParse(reason="config profile or config target have changed"))
+            fire_event(
+                Note(
+                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {manifest.state_check.vars_hash.checksum}"
+                ),
+                level=EventLevel.DEBUG,
+            )
+            valid = False
+            reparse_reason = ReparseReason.vars_changed
+        changed_vars = [
+            var
+            for var, checksum in manifest.state_check.vars.items()
+            if get_cli_var_checksum(self.root_project.cli_vars, var) != checksum
+        ]
+        if changed_vars:
             fire_event(
                 UnableToPartialParse(
-                    reason="config vars, config profile, or config target have changed"
+                    reason="vars used in project config, profiles, hooks or docs have changed"
                 )
             )
             fire_event(
-                Note(
-                    msg=f"previous checksum: {self.manifest.state_check.vars_hash.checksum}, current checksum: {manifest.state_check.vars_hash.checksum}"
-                ),
+                Note(msg=f"changed vars: {', '.join(sorted(changed_vars))}"),
                 level=EventLevel.DEBUG,
             )
             valid = False
@@ -865,7 +1222,9 @@ class ManifestLoader:
                     return True
         return False
 
-    def read_manifest_for_partial_parse(self) -> Optional[Manifest]:
+    def read_manifest_for_partial_parse(
+        self, saved_manifest: Optional[Manifest] = None
+    ) -> Optional[Manifest]:
         flags = get_flags()
         if not flags.PARTIAL_PARSE:
             fire_event(PartialParsingNotEnabled())
@@ -874,23 +1233,43 @@ class ManifestLoader:
             self.root_project.project_target_path, PARTIAL_PARSE_FILE_NAME
         )
 
-        reparse_reason = None
+        reparse_reason: Optional[str] = None
 
-        if os.path.exists(path):
+        if saved_manifest is not None:
+            is_partial_parsable, reparse_reason = self.is_partial_parsable(saved_manifest)
+            if is_partial_parsable:
+                _reset_unsaved_fields(saved_manifest)
+                saved_manifest.metadata.generated_at = datetime.datetime.utcnow()
+                saved_manifest.metadata.invocation_id = get_invocation_id()
+                return saved_manifest
+        elif os.path.exists(path):
             try:
-                with open(path, "rb") as fp:
-                    manifest_mp = fp.read()
-                manifest: Manifest = Manifest.from_msgpack(manifest_mp, decoder=extended_mashumuro_decoder)  # type: ignore
-                # keep this check inside the try/except in case something about
-                # the file has changed in weird ways, perhaps due to being a
-                # different version of dbt
-                is_partial_parsable, reparse_reason = self.is_partial_parsable(manifest)
-                if is_partial_parsable:
-                    # We don't want to have stale generated_at dates
-                    manifest.metadata.generated_at = datetime.datetime.utcnow()
-                    # or invocation_ids
-                    manifest.metadata.invocation_id = get_invocation_id()
-                    return manifest
+                with open(path, "rb") as fp, mmap.mmap(
+                    fp.fileno(), 0, access=mmap.ACCESS_READ
+                ) as manifest_mp:
+                    saved_file = PartialParseFile(manifest_mp)
+                    is_partial_parsable = False
+                    if not saved_file.is_current_format:
+                        fire_event(
+                            UnableToPartialParse(
+                                reason="saved manifest was written in a different format"
+                            )
+                        )
+                        reparse_reason = ReparseReason.version_mismatch
+                    else:
+                        # keep this check inside the try/except in case something about
+                        # the file has changed in weird ways, perhaps due to being a
+                        # different version of dbt
+                        is_partial_parsable, reparse_reason = self.is_partial_parsable(
+                            saved_file.read_header()
+                        )
+                    if is_partial_parsable:
+                        manifest = saved_file.read_manifest()
+                        # We don't want to have stale generated_at dates
+                        manifest.metadata.generated_at = datetime.datetime.utcnow()
+                        # or invocation_ids
+                        manifest.metadata.invocation_id = get_invocation_id()
+                        return manifest
             except Exception as exc:
                 fire_event(
                     ParsedFileLoadFailed(path=path, exc=str(exc), exc_info=traceback.format_exc())
@@ -930,18 +1309,15 @@ class ManifestLoader:
         all_projects = self.all_projects
         # if any of these change, we need to reject the parser
 
-        # Create a FileHash of vars string, profile name and target name
-        # This does not capture vars in dbt_project, just the command line
-        # arg vars, but since any changes to that file will cause state_check
-        # to not pass, it doesn't matter.  If we move to more granular checking
-        # of env_vars, that would need to change.
-        # We are using the parsed cli_vars instead of config.args.vars, in order
-        # to sort them and avoid reparsing because of ordering issues.
+        # Create a FileHash of the profile name and target name. The command
+        # line vars are not included: the files that use them are reparsed
+        # when they change. The vars used in dbt_project.yml and profiles.yml
+        # are saved in the state check, and a change to them is checked in
+        # 'is_partial_parsable'.
         stringified_cli_vars = pprint.pformat(config.cli_vars)
         vars_hash = FileHash.from_contents(
             "\x00".join(
                 [
-                    stringified_cli_vars,
                     getattr(config.args, "profile", "") or "",
                     getattr(config.args, "target", "") or "",
                     __version__,
@@ -986,6 +1362,14 @@ class ManifestLoader:
             with open(path) as fp:
                 project_hashes[name] = FileHash.from_contents(fp.read())
 
+        # Save checksums of the command line vars used in dbt_project.yml
+        # and profiles.yml. Vars used in hooks and some macros are added
+        # during parsing.
+        state_check_vars = {
+            var: get_cli_var_checksum(config.cli_vars, var)
+            for var in sorted(config.project_var_names | config.profile_var_names)
+        }
+
         # Create the ManifestStateCheck object
         state_check = ManifestStateCheck(
             project_env_vars_hash=project_env_vars_hash,
@@ -993,6 +1377,7 @@ class ManifestLoader:
             vars_hash=vars_hash,
             profile_hash=profile_hash,
             project_hashes=project_hashes,
+            vars=state_check_vars,
         )
         return state_check
 
@@ -1387,6 +1772,20 @@ def _warn_for_unused_resource_config_paths(manifest: Manifest, config: RuntimeCo
     config.warn_for_unused_resource_config_paths(resource_fqns, disabled_fqns)
 
 
+def _reset_unsaved_fields(manifest: Manifest) -> None:
+    """Reset the fields that aren't written to partial_parse.msgpack, so that a
+    manifest kept in memory starts partial parsing in the same state as one read
+    back from the file. The lookups and flat graph would otherwise point at
+    nodes that partial parsing replaces.
+    """
+    manifest.source_patches = {}
+    manifest.flat_graph = {}
+    for manifest_field in fields(Manifest):
+        if "serialize" in manifest_field.metadata and manifest_field.default is None:
+            setattr(manifest, manifest_field.name, None)
+    manifest._parsing_info = ParsingInfo()
+
+
 def _check_manifest(manifest: Manifest, config: RuntimeConfig) -> None:
     _check_resource_uniqueness(manifest, config)
     _warn_for_unused_resource_config_paths(manifest, config)
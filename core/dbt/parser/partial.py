@@ -1,6 +1,6 @@
 import os
 from copy import deepcopy
-from typing import MutableMapping, Dict, List, Callable
+from typing import Any, MutableMapping, Dict, List, Callable, Optional
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.files import (
     AnySourceFile,
@@ -15,6 +15,7 @@ from dbt.events.types import (
     PartialParsingFile,
 )
 from dbt.constants import DEFAULT_ENV_PLACEHOLDER
+from dbt.context.base import get_cli_var_checksum
 from dbt.node_types import NodeType
 
 
@@ -69,10 +70,14 @@ special_override_macros = [
 # a full parse (such as for certain macro changes)
 class PartialParsing:
     def __init__(
-        self, saved_manifest: Manifest, new_files: MutableMapping[str, AnySourceFile]
+        self,
+        saved_manifest: Manifest,
+        new_files: MutableMapping[str, AnySourceFile],
+        cli_vars: Optional[Dict[str, Any]] = None,
     ) -> None:
         self.saved_manifest = saved_manifest
         self.new_files = new_files
+        self.cli_vars = cli_vars or {}
         self.project_parser_files: Dict = {}
         self.saved_files = self.saved_manifest.files
         self.project_parser_files = {}
@@ -81,6 +86,7 @@ class PartialParsing:
             self.env_vars_changed_source_files,
             self.env_vars_changed_schema_files,
         ) = self.build_env_vars_to_files()
+        self.build_vars_to_files()
         self.build_file_diff()
         self.processing_file = None
         self.deleted_special_override_macro = False
@@ -134,13 +140,13 @@ class PartialParsing:
                         changed_or_deleted_macro_file = True
                     changed.append(file_id)
 
-        # handle changed env_vars for non-schema-files
+        # handle changed env_vars and vars for non-schema-files
         for file_id in self.env_vars_changed_source_files:
             if file_id in deleted or file_id in changed:
                 continue
             changed.append(file_id)
 
-        # handle changed env_vars for schema files
+        # handle changed env_vars and vars for schema files
         for file_id in self.env_vars_changed_schema_files.keys():
             if file_id in deleted_schema_files or file_id in changed_schema_files:
                 continue
@@ -493,7 +499,7 @@ class PartialParsing:
                     source_file.macros.remove(unique_id)
                 continue
 
-            base_macro = self.saved_manifest.macros.pop(unique_id)
+            base_macro = self.saved_manifest.remove_macro(unique_id)
 
             # Recursively check children of this macro
             # The macro_child_map might not exist if a macro is removed by
@@ -771,6 +777,7 @@ class PartialParsing:
                 pp_dict[key].append(patch)
 
         schema_file.delete_from_env_vars(key, patch["name"])
+        schema_file.delete_from_vars(key, patch["name"])
         self.add_to_pp_files(schema_file)
 
     # For model, seed, snapshot, analysis schema dictionary keys,
@@ -853,7 +860,7 @@ class PartialParsing:
             macro_unique_id = schema_file.macro_patches[macro["name"]]
             del schema_file.macro_patches[macro["name"]]
         if macro_unique_id and macro_unique_id in self.saved_manifest.macros:
-            macro = self.saved_manifest.macros.pop(macro_unique_id)
+            macro = self.saved_manifest.remove_macro(macro_unique_id)
             macro_file_id = macro.file_id
             if macro_file_id in self.new_files:
                 self.saved_files[macro_file_id] = deepcopy(self.new_files[macro_file_id])
@@ -1001,34 +1008,61 @@ class PartialParsing:
         for env_var in delete_vars:
             del self.saved_manifest.env_vars[env_var]
 
-        env_vars_changed_source_files = []
-        env_vars_changed_schema_files = {}
-        # The SourceFiles contain a list of env_vars that were used in the file.
-        # The SchemaSourceFiles contain a dictionary of yaml_key to schema entry names to
-        # a list of vars.
-        # Create a list of file_ids for source_files that need to be reparsed, and
-        # a dictionary of file_ids to yaml_keys to names.
+        env_vars_changed_source_files: List[str] = []
+        env_vars_changed_schema_files: Dict[str, Dict[str, List[str]]] = {}
+        self.add_changed_files(
+            "env_vars", changed_vars, env_vars_changed_source_files, env_vars_changed_schema_files
+        )
+        return (env_vars_changed_source_files, env_vars_changed_schema_files)
+
+    # Add the files using --vars that have changed to the files that
+    # 'build_env_vars_to_files' found, so that they're reparsed the same way.
+    # The manifest saves a checksum of each var given with --vars.
+    def build_vars_to_files(self):
+        changed_vars = []
+        for var, prev_checksum in self.saved_manifest.vars.items():
+            current_checksum = get_cli_var_checksum(self.cli_vars, var)
+            if prev_checksum != current_checksum:
+                changed_vars.append(var)
+                # the files using it will save it again when they're reparsed
+                self.saved_manifest.vars[var] = current_checksum
+        self.add_changed_files(
+            "vars",
+            changed_vars,
+            self.env_vars_changed_source_files,
+            self.env_vars_changed_schema_files,
+        )
+
+    # The SourceFiles contain a list of vars that were used in the file.
+    # The SchemaSourceFiles contain a dictionary of yaml_key to schema entry names to
+    # a list of vars. 'attr' is the name of these ("env_vars" or "vars").
+    # Add to the list of file_ids for source_files that need to be reparsed, and
+    # the dictionary of file_ids to yaml_keys to names.
+    def add_changed_files(self, attr, changed_vars, changed_source_files, changed_schema_files):
+        if not changed_vars:
+            return
         for source_file in self.saved_files.values():
             file_id = source_file.file_id
-            if not source_file.env_vars:
+            file_vars = getattr(source_file, attr)
+            if not file_vars:
                 continue
             if source_file.parse_file_type == ParseFileType.Schema:
-                for yaml_key in source_file.env_vars.keys():
-                    for name in source_file.env_vars[yaml_key].keys():
-                        for env_var in source_file.env_vars[yaml_key][name]:
-                            if env_var in changed_vars:
-                                if file_id not in env_vars_changed_schema_files:
-                                    env_vars_changed_schema_files[file_id] = {}
-                                if yaml_key not in env_vars_changed_schema_files[file_id]:
-                                    env_vars_changed_schema_files[file_id][yaml_key] = []
-                                if name not in env_vars_changed_schema_files[file_id][yaml_key]:
-                                    env_vars_changed_schema_files[file_id][yaml_key].append(name)
-                                break  # if one env_var is changed we can stop
+                for yaml_key in file_vars.keys():
+                    for name in file_vars[yaml_key].keys():
+                        for var in file_vars[yaml_key][name]:
+                            if var in changed_vars:
+                                if file_id not in changed_schema_files:
+                                    changed_schema_files[file_id] = {}
+                                if yaml_key not in changed_schema_files[file_id]:
+                                    changed_schema_files[file_id][yaml_key] = []
+                                if name not in changed_schema_files[file_id][yaml_key]:
+                                    changed_schema_files[file_id][yaml_key].append(name)
+                                break  # if one var is changed we can stop
 
             else:
-                for env_var in source_file.env_vars:
-                    if env_var in changed_vars:
-                        env_vars_changed_source_files.append(file_id)
-                        break  # if one env_var is changed we can stop
-
-        return (env_vars_changed_source_files, env_vars_changed_schema_files)
+                if file_id in changed_source_files:
+                    continue
+                for var in file_vars:
+                    if var in changed_vars:
+                        changed_source_files.append(file_id)
+                        break  # if one var is changed we can stop
@@ -1,8 +1,9 @@
 import os
 import pathspec  # type: ignore
 import pathlib
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from dbt.clients.system import load_file_contents
+from dbt.clients.system import load_file_contents, walk_search_paths
 from dbt.contracts.files import (
     FilePath,
     ParseFileType,
@@ -16,8 +17,9 @@ from dbt.dataclass_schema import dbtClassMixin
 from dbt.parser.schemas import yaml_from_file, schema_file_keys
 from dbt.exceptions import ParsingError
 from dbt.parser.search import filesystem_search
-from typing import Optional, Dict, List, Mapping, MutableMapping
-from dbt.events.types import InputFileDiffError
+from typing import Optional, Dict, Iterable, List, Mapping, MutableMapping, Tuple
+from dbt.events.base_types import EventLevel
+from dbt.events.types import InputFileDiffError, Note
 from dbt.events.functions import fire_event
 from typing import Protocol
 
@@ -38,6 +40,28 @@ class FileDiff(dbtClassMixin):
     added: List[InputFile]
 
 
+# If the file's modification time, size and inode all match the file in
+# the saved manifest, return the saved file. Its checksum can be used without
+# reading the file.
+def get_unchanged_saved_file(source_file: AnySourceFile, saved_files) -> Optional[AnySourceFile]:
+    if not saved_files or source_file.file_id not in saved_files:
+        return None
+    old_source_file = saved_files[source_file.file_id]
+    if old_source_file.parse_file_type != source_file.parse_file_type:
+        return None
+    path, old_path = source_file.path, old_source_file.path
+    if not isinstance(path, FilePath) or not isinstance(old_path, FilePath):
+        return None
+    if (
+        path.modification_time != 0.0
+        and old_path.modification_time == path.modification_time
+        and old_path.file_size == path.file_size
+        and old_path.inode == path.inode
+    ):
+        return old_source_file
+    return None
+
+
 # This loads the files contents and creates the SourceFile object
 def load_source_file(
     path: FilePath,
@@ -54,22 +78,15 @@ def load_source_file(
         project_name=project_name,
     )
 
-    skip_loading_schema_file = False
-    if (
-        parse_file_type == ParseFileType.Schema
-        and saved_files
-        and source_file.file_id in saved_files
-    ):
-        old_source_file = saved_files[source_file.file_id]
-        if (
-            source_file.path.modification_time != 0.0
-            and old_source_file.path.modification_time == source_file.path.modification_time
-        ):
-            source_file.checksum = old_source_file.checksum
+    # Files that haven't changed are not read. Schema files get the saved yaml
+    # dictionary, other files are read by load_skipped_contents if they are parsed.
+    old_source_file = get_unchanged_saved_file(source_file, saved_files)
+    if old_source_file is not None:
+        source_file.checksum = old_source_file.checksum
+        if isinstance(source_file, SchemaSourceFile):
+            assert isinstance(old_source_file, SchemaSourceFile)
             source_file.dfy = old_source_file.dfy
-            skip_loading_schema_file = True
-
-    if not skip_loading_schema_file:
+    else:
         # We strip the file_contents before generating the checksum because we want
         # the checksum to match the stored file contents
         file_contents = load_file_contents(path.absolute_path, strip=True)
@@ -84,6 +101,28 @@ def load_source_file(
     return source_file
 
 
+# Read the contents of a file that load_source_file skipped because it
+# hadn't changed. This is called before a file is parsed.
+def load_skipped_contents(source_file: AnySourceFile) -> AnySourceFile:
+    if (
+        source_file.contents is None
+        and source_file.parse_file_type not in (ParseFileType.Schema, ParseFileType.Seed)
+        and isinstance(source_file.path, FilePath)
+    ):
+        source_file.contents = load_file_contents(source_file.path.absolute_path, strip=True)
+    return source_file
+
+
+# Check that a file skipped by load_source_file or load_seed_source_file
+# still has the checksum from the saved manifest.
+def verify_skipped_file(source_file: AnySourceFile) -> bool:
+    if source_file.checksum.name == "path":
+        # big seeds are not hashed
+        return True
+    file_contents = load_file_contents(source_file.path.absolute_path, strip=True)
+    return FileHash.from_contents(file_contents) == source_file.checksum
+
+
 # Do some minimal validation of the yaml in a schema file.
 # Check version, that key values are lists and that each element in
 # the lists has a 'name' key
@@ -113,8 +152,18 @@ def validate_yaml(file_path, dct):
 
 
 # Special processing for big seed files
-def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
-    if match.seed_too_large():
+def load_seed_source_file(match: FilePath, project_name, saved_files=None) -> SourceFile:
+    source_file = SourceFile(
+        path=match,
+        checksum=FileHash.empty(),
+        parse_file_type=ParseFileType.Seed,
+        project_name=project_name,
+    )
+    old_source_file = get_unchanged_saved_file(source_file, saved_files)
+    if old_source_file is not None:
+        source_file.checksum = old_source_file.checksum
+        source_file.contents = ""
+    elif match.seed_too_large():
         # We don't want to calculate a hash of this file. Use the path.
         source_file = SourceFile.big_seed(match)
     else:
@@ -128,35 +177,54 @@ def load_seed_source_file(match: FilePath, project_name) -> SourceFile:
 
 
 # Use the FilesystemSearcher to get a bunch of FilePaths, then turn
-# them into a bunch of FileSource objects
-def get_source_files(project, paths, extension, parse_file_type, saved_files, ignore_spec):
+# them into a bunch of FileSource objects. If an executor is passed in,
+# the files are loaded in parallel, but the results keep the search order.
+def get_source_files(
+    project,
+    paths,
+    extension,
+    parse_file_type,
+    saved_files,
+    ignore_spec,
+    executor: Optional[Executor] = None,
+    walked_files: Optional[Dict[str, List[os.DirEntry]]] = None,
+):
     # file path list
-    fp_list = filesystem_search(project, paths, extension, ignore_spec)
-    # file block list
-    fb_list = []
-    for fp in fp_list:
+    fp_list = filesystem_search(project, paths, extension, ignore_spec, walked_files)
+    # singular tests live in /tests but only generic tests live
+    # in /tests/generic so we want to skip those
+    if parse_file_type == ParseFileType.SingularTest:
+        fp_list = [fp for fp in fp_list if pathlib.Path(fp.relative_path).parts[0] != "generic"]
+
+    def load(fp):
         if parse_file_type == ParseFileType.Seed:
-            fb_list.append(load_seed_source_file(fp, project.project_name))
-        # singular tests live in /tests but only generic tests live
-        # in /tests/generic so we want to skip those
-        else:
-            if parse_file_type == ParseFileType.SingularTest:
-                path = pathlib.Path(fp.relative_path)
-                if path.parts[0] == "generic":
-                    continue
-            file = load_source_file(fp, parse_file_type, project.project_name, saved_files)
-            # only append the list if it has contents. added to fix #3568
-            if file:
-                fb_list.append(file)
-    return fb_list
+            return load_seed_source_file(fp, project.project_name, saved_files)
+        return load_source_file(fp, parse_file_type, project.project_name, saved_files)
+
+    loaded: Iterable[Optional[AnySourceFile]]
+    if executor is None or len(fp_list) < 2:
+        loaded = map(load, fp_list)
+    else:
+        loaded = executor.map(load, fp_list)
+    # only append the list if it has contents. added to fix #3568
+    return [file for file in loaded if file]
 
 
-def read_files_for_parser(project, files, parse_ft, file_type_info, saved_files, ignore_spec):
+def read_files_for_parser(
+    project,
+    files,
+    parse_ft,
+    file_type_info,
+    saved_files,
+    ignore_spec,
+    executor: Optional[Executor] = None,
+    walked_files: Optional[Dict[str, List[os.DirEntry]]] = None,
+):
     dirs = file_type_info["paths"]
     parser_files = []
     for extension in file_type_info["extensions"]:
         source_files = get_source_files(
-            project, dirs, extension, parse_ft, saved_files, ignore_spec
+            project, dirs, extension, parse_ft, saved_files, ignore_spec, executor, walked_files
         )
         for sf in source_files:
             files[sf.file_id] = sf
@@ -187,7 +255,7 @@ class ReadFiles(Protocol):
 class ReadFilesFromFileSystem:
     all_projects: Mapping[str, Project]
     files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
-    # saved_files is only used to compare schema files
+    # saved_files is used to skip reading files that haven't changed
     saved_files: MutableMapping[str, AnySourceFile] = field(default_factory=dict)
     # project_parser_files = {
     #   "my_project": {
@@ -196,25 +264,90 @@ class ReadFilesFromFileSystem:
     # }
     #
     project_parser_files: Dict = field(default_factory=dict)
+    # Number of threads used to read, hash and yaml-load files. Reading
+    # is mostly waiting on the file system, so this helps most on slow
+    # (e.g. network) file systems. The results don't depend on it.
+    threads: int = 1
+    # If True, the files that weren't read because their modification time,
+    # size and inode were unchanged are hashed anyway, while the other files
+    # are read. Any that turn out to have changed are read again.
+    verify_skipped_files: bool = False
+    skipped_file_count: int = 0
+    _verify_executor: Optional[Executor] = None
+    _verifications: List[Tuple[AnySourceFile, Future]] = field(default_factory=list)
 
     def read_files(self):
+        if self.threads > 1 or self.verify_skipped_files:
+            with ThreadPoolExecutor(
+                max_workers=self.threads, thread_name_prefix="read_files"
+            ) as executor:
+                self._read_files(executor)
+        else:
+            self._read_files(None)
+
+    def _read_files(self, executor: Optional[Executor]):
+        self._verifications = []
+        read_executor = executor if self.threads > 1 else None
+        self._verify_executor = executor if self.verify_skipped_files else None
         for project in self.all_projects.values():
             file_types = get_file_types_for_project(project)
-            self.read_files_for_project(project, file_types)
+            self.read_files_for_project(project, file_types, read_executor)
+        self._verify_executor = None
+
+        for source_file, verification in self._verifications:
+            if not verification.result():
+                fire_event(
+                    Note(
+                        msg=f"File {source_file.path.original_file_path} changed without "
+                        "changing its modification time, size or inode. Reading it again."
+                    ),
+                    level=EventLevel.DEBUG,
+                )
+                self.files[source_file.file_id] = self._reload_file(source_file)
 
-    def read_files_for_project(self, project, file_types):
+    def read_files_for_project(self, project, file_types, executor: Optional[Executor] = None):
         dbt_ignore_spec = generate_dbt_ignore_spec(project.project_root)
         project_files = self.project_parser_files[project.project_name] = {}
+        # Walk the project's directories once, instead of once per parser
+        # and extension.
+        search_paths = {path for info in file_types.values() for path in info["paths"]}
+        walked_files = walk_search_paths(project.project_root, search_paths, dbt_ignore_spec)
 
         for parse_ft, file_type_info in file_types.items():
-            project_files[file_type_info["parser"]] = read_files_for_parser(
+            parser_files = read_files_for_parser(
                 project,
                 self.files,
                 parse_ft,
                 file_type_info,
                 self.saved_files,
                 dbt_ignore_spec,
+                executor,
+                walked_files,
             )
+            project_files[file_type_info["parser"]] = parser_files
+            self._check_skipped_files(parser_files)
+
+    def _check_skipped_files(self, file_ids):
+        if not self.saved_files:
+            return
+        for file_id in file_ids:
+            source_file = self.files[file_id]
+            if get_unchanged_saved_file(source_file, self.saved_files) is None:
+                continue
+            self.skipped_file_count += 1
+            if self._verify_executor is not None:
+                self._verifications.append(
+                    (source_file, self._verify_executor.submit(verify_skipped_file, source_file))
+                )
+
+    def _reload_file(self, source_file: AnySourceFile) -> AnySourceFile:
+        path, parse_file_type = source_file.path, source_file.parse_file_type
+        assert isinstance(path, FilePath) and parse_file_type and source_file.project_name
+        if parse_file_type == ParseFileType.Seed:
+            return load_seed_source_file(path, source_file.project_name)
+        new_source_file = load_source_file(path, parse_file_type, source_file.project_name, None)
+        assert new_source_file is not None
+        return new_source_file
 
 
 @dataclass
@@ -2,7 +2,7 @@ import pathlib
 import itertools
 import os
 
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Tuple, Union, Any
 from dbt.parser.base import SimpleParser
 from dbt.parser.generic_test_builders import TestBuilder
 from dbt.parser.search import FileBlock
@@ -166,6 +166,9 @@ class SchemaGenericTestParser(SimpleParser):
             if self.schema_yaml_vars.env_vars:
                 self.store_env_vars(target, schema_file_id, self.schema_yaml_vars.env_vars)
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                self.store_vars(target, schema_file_id, self.schema_yaml_vars.vars)
+                self.schema_yaml_vars.vars = {}
 
         except ParsingError as exc:
             context = trimmed(str(target))
@@ -249,17 +252,30 @@ class SchemaGenericTestParser(SimpleParser):
         self.manifest.env_vars.update(env_vars)
         if schema_file_id in self.manifest.files:
             schema_file = self.manifest.files[schema_file_id]
-            if isinstance(target, UnpatchedSourceDefinition):
-                search_name = target.source.name
-                yaml_key = target.source.yaml_key
-                if "." in search_name:  # source file definitions
-                    (search_name, _) = search_name.split(".")
-            else:
-                search_name = target.name
-                yaml_key = target.yaml_key
+            (yaml_key, search_name) = self.get_target_yaml_key_and_name(target)
             for var in env_vars.keys():
                 schema_file.add_env_var(var, yaml_key, search_name)
 
+    def store_vars(self, target, schema_file_id, vars):
+        self.manifest.vars.update(vars)
+        if schema_file_id in self.manifest.files:
+            schema_file = self.manifest.files[schema_file_id]
+            (yaml_key, search_name) = self.get_target_yaml_key_and_name(target)
+            for var in vars.keys():
+                schema_file.add_var(var, yaml_key, search_name)
+
+    # The entry in the schema file that a test target was defined in
+    def get_target_yaml_key_and_name(self, target) -> Tuple[str, str]:
+        if isinstance(target, UnpatchedSourceDefinition):
+            search_name = target.source.name
+            yaml_key = target.source.yaml_key
+            if "." in search_name:  # source file definitions
+                (search_name, _) = search_name.split(".")
+        else:
+            search_name = target.name
+            yaml_key = target.yaml_key
+        return (yaml_key, search_name)
+
     # This does special shortcut processing for the two
     # most common internal macros, not_null and unique,
     # which avoids the jinja rendering to resolve config
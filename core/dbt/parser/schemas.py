@@ -317,6 +317,13 @@ class YamlReader(metaclass=ABCMeta):
                 for var in self.schema_yaml_vars.env_vars.keys():
                     schema_file.add_env_var(var, self.key, entry["name"])
                 self.schema_yaml_vars.env_vars = {}
+            if self.schema_yaml_vars.vars:
+                self.schema_parser.manifest.vars.update(self.schema_yaml_vars.vars)
+                schema_file = self.yaml.file
+                assert isinstance(schema_file, SchemaSourceFile)
+                for var in self.schema_yaml_vars.vars.keys():
+                    schema_file.add_var(var, self.key, entry["name"])
+                self.schema_yaml_vars.vars = {}
 
             yield entry
 
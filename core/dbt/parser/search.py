@@ -1,6 +1,17 @@
 import os
 from dataclasses import dataclass
-from typing import List, Callable, Iterable, Set, Union, Iterator, TypeVar, Generic, Optional
+from typing import (
+    List,
+    Callable,
+    Dict,
+    Iterable,
+    Set,
+    Union,
+    Iterator,
+    TypeVar,
+    Generic,
+    Optional,
+)
 from pathspec import PathSpec  # type: ignore
 
 from dbt.clients.jinja import extract_toplevel_blocks, BlockTag
@@ -67,11 +78,12 @@ def filesystem_search(
     relative_dirs: List[str],
     extension: str,
     ignore_spec: Optional[PathSpec] = None,
+    walked_files: Optional[Dict[str, List[os.DirEntry]]] = None,
 ):
     ext = "[!.#~]*" + extension
     root = project.project_root
     file_path_list = []
-    for result in find_matching(root, relative_dirs, ext, ignore_spec):
+    for result in find_matching(root, relative_dirs, ext, ignore_spec, walked_files):
         if "searched_path" not in result or "relative_path" not in result:
             raise DbtInternalError("Invalid result from find_matching: {}".format(result))
         file_match = FilePath(
@@ -79,6 +91,8 @@ def filesystem_search(
             relative_path=result["relative_path"],
             modification_time=result["modification_time"],
             project_root=root,
+            file_size=result["file_size"],
+            inode=result["inode"],
         )
         file_path_list.append(file_match)
 
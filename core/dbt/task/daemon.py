@@ -0,0 +1,415 @@
+import json
+import os
+import socket
+import socketserver
+from dataclasses import dataclass, field
+from pathlib import PurePath
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from dbt.clients.system import load_file_contents
+from dbt.contracts.files import ParseFileType
+from dbt.contracts.graph.manifest import Manifest
+from dbt.events.base_types import EventLevel, EventMsg
+from dbt.events.functions import fire_event
+from dbt.events.types import Note
+from dbt.exceptions import DbtRuntimeError
+from dbt.parser.read_files import FileDiff, InputFile, get_file_types_for_project
+from dbt.task.base import ConfiguredTask
+
+
+SOCKET_FILE_NAME = "dbt-daemon.sock"
+# How often serve_forever checks for a shutdown. Files are only polled when a
+# command comes in.
+POLL_INTERVAL = 0.5
+
+# Files outside the source paths that change how the project is loaded
+PROJECT_FILES = (
+    "dbt_project.yml",
+    "packages.yml",
+    "dependencies.yml",
+    "package-lock.yml",
+    "selectors.yml",
+    ".dbtignore",
+)
+
+# Options that change how the project parses. Commands sent to the daemon
+# use the daemon's values for any of these they don't set themselves.
+PARSE_OPTIONS = ("profile", "profiles_dir", "project_dir", "target", "target_path", "vars")
+# The daemon only watches its own project and profiles
+FIXED_OPTIONS = ("profiles_dir", "project_dir")
+# init and docs serve are interactive or never return, and clean would
+# delete the daemon's socket from the target directory
+UNSUPPORTED_COMMANDS = ("clean", "daemon", "init", "serve")
+# Commands that don't use a manifest, so they shouldn't wait on (or fail
+# with) a parse
+NO_MANIFEST_COMMANDS = ("debug", "deps")
+
+
+@dataclass
+class FileChanges:
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.deleted)
+
+    @property
+    def paths(self) -> List[str]:
+        return [*self.added, *self.changed, *self.deleted]
+
+
+class FileWatcher:
+    """Polls files and directories under a root for changes. Paths are
+    reported relative to the root, which is how a FileDiff names files.
+    Hidden files, like editor swap files, are ignored, and so are symlinked
+    directories, which dbt doesn't parse either. Only the entries directly
+    inside shallow_paths are watched, not what's under them.
+    """
+
+    def __init__(self, root: str, paths: Iterable[str], shallow_paths: Iterable[str] = ()) -> None:
+        self.root = root
+        self.paths = list(paths)
+        self.shallow_paths = list(shallow_paths)
+        self.files = self.scan()
+
+    def scan(self) -> Dict[str, Tuple[int, int]]:
+        files: Dict[str, Tuple[int, int]] = {}
+        for path in self.paths:
+            absolute_path = os.path.normpath(os.path.join(self.root, path))
+            if os.path.isdir(absolute_path):
+                for dirpath, dirnames, filenames in os.walk(absolute_path):
+                    dirnames[:] = [name for name in dirnames if not name.startswith(".")]
+                    for name in filenames:
+                        if not name.startswith("."):
+                            self._stat(os.path.join(dirpath, name), files)
+            else:
+                self._stat(absolute_path, files)
+        for path in self.shallow_paths:
+            absolute_path = os.path.normpath(os.path.join(self.root, path))
+            try:
+                entries = os.listdir(absolute_path)
+            except OSError:
+                continue
+            for name in entries:
+                if not name.startswith("."):
+                    self._stat(os.path.join(absolute_path, name), files)
+        return files
+
+    def _stat(self, path: str, files: Dict[str, Tuple[int, int]]) -> None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return
+        files[os.path.relpath(path, self.root)] = (stat.st_mtime_ns, stat.st_size)
+
+    def poll(self) -> FileChanges:
+        """Return the files that changed since the last poll"""
+        files = self.scan()
+        changes = FileChanges(
+            added=sorted(files.keys() - self.files.keys()),
+            changed=sorted(
+                path
+                for path in files.keys() & self.files.keys()
+                if files[path] != self.files[path]
+            ),
+            deleted=sorted(self.files.keys() - files.keys()),
+        )
+        self.files = files
+        return changes
+
+
+def option_args(options: Dict[str, Any]) -> List[str]:
+    args: List[str] = []
+    for name, value in options.items():
+        if value is None or value == {}:
+            continue
+        if name == "vars":
+            value = json.dumps(value)
+        args.extend([f"--{name.replace('_', '-')}", str(value)])
+    return args
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request, {"args": [...]}, and writes JSON lines back:
+    {"level": ..., "msg": ...} for each log message while the command runs,
+    then {"success": ..., "exception": ...} once it's done, with the "result"
+    of `dbt ls` as well.
+    """
+
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            args = request["args"]
+            if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+                raise ValueError("args must be a list of strings")
+        except (KeyError, TypeError, ValueError) as exc:
+            self.send({"success": False, "exception": f"Invalid request: {exc}"})
+            return
+        self.send(self.server.task.handle_request(args, self.send))
+
+    def send(self, message: Dict[str, Any]) -> None:
+        try:
+            self.wfile.write(json.dumps(message).encode("utf-8") + b"\n")
+        except (OSError, ValueError):
+            # The client went away. Whatever it started still runs to the end.
+            pass
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: str, task: "DaemonTask") -> None:
+        self.task = task
+        self.socket_path = socket_path
+        super().__init__(socket_path, DaemonRequestHandler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        # only the user running the daemon can send it commands
+        os.chmod(self.socket_path, 0o600)
+
+
+class DaemonTask(ConfiguredTask):
+    """Keeps the project's manifest parsed in memory and runs the commands
+    sent to it against that manifest.
+
+    The project's files are polled for changes when a command comes in, so
+    an idle daemon doesn't touch the filesystem. Changes to files in the root
+    project's source paths are handed to partial parsing as a FileDiff, so
+    only those files are read again; anything else, like dbt_project.yml or
+    installed packages, has the project read from disk, still partially
+    parsing against the manifest in memory. Installed packages are only
+    watched for being added, removed or installed again, not for edits to
+    their files.
+
+    Profiles and projects are kept between commands until profiles.yml or
+    one of the PROJECT_FILES changes. Adapters are registered again for every
+    command, as their relation cache is populated again by every run anyway,
+    and environment variables are the daemon's, not the client's.
+    """
+
+    def __init__(self, args, config, manifest: Optional[Manifest] = None) -> None:
+        super().__init__(args, config, manifest)
+        self.options: Dict[str, Any] = {
+            "profile": args.PROFILE,
+            "profiles_dir": os.path.abspath(args.PROFILES_DIR),
+            "project_dir": config.project_root,
+            "target": args.TARGET,
+            "target_path": args.TARGET_PATH,
+            "vars": args.VARS,
+        }
+        self.parse_args: List[str] = ["parse", *option_args(self.options)]
+        # The arguments of the parse that produced self.manifest
+        self.parsed_args: Optional[List[str]] = None
+
+        file_types = get_file_types_for_project(config)
+        source_paths = {
+            os.path.normpath(path)
+            for parse_file_type, file_type in file_types.items()
+            if parse_file_type != ParseFileType.Seed
+            for path in file_type["paths"]
+        }
+        # A FileDiff gets a file's type from the first directory in its path,
+        # so only files in top level source paths can go in one
+        self.diff_paths = {path for path in source_paths if len(PurePath(path).parts) == 1}
+        self.nested_paths = source_paths - self.diff_paths
+        profiles_path = os.path.join(self.options["profiles_dir"], "profiles.yml")
+        config_paths = [*PROJECT_FILES, os.path.relpath(profiles_path, config.project_root)]
+        self.watcher = FileWatcher(
+            config.project_root,
+            [*sorted(source_paths), *config.seed_paths, *config_paths],
+            shallow_paths=[config.packages_install_path],
+        )
+        # Watched separately, as commands that don't parse need to know about
+        # them too
+        self.config_watcher = FileWatcher(config.project_root, config_paths)
+        # Profiles and projects loaded by commands, see requires._cached
+        self.config_cache: Dict[Tuple, Any] = {}
+
+    def can_diff(self, path: str) -> bool:
+        parts = PurePath(path).parts
+        return (
+            len(parts) > 1
+            and parts[0] in self.diff_paths
+            and not any(path.startswith(nested + os.sep) for nested in self.nested_paths)
+        )
+
+    def build_file_diff(self, changes: FileChanges) -> Optional[FileDiff]:
+        """Return a FileDiff for the changes, or None if the project has to be
+        read from disk to pick them up.
+        """
+        if not all(self.can_diff(path) for path in changes.paths):
+            return None
+        try:
+            return FileDiff(
+                deleted=changes.deleted,
+                changed=[self.read_input_file(path) for path in changes.changed],
+                added=[self.read_input_file(path) for path in changes.added],
+            )
+        except OSError:
+            # The file went away after it was polled
+            return None
+
+    def read_input_file(self, path: str) -> InputFile:
+        absolute_path = os.path.join(self.config.project_root, path)
+        return InputFile(
+            path=path,
+            content=load_file_contents(absolute_path, strip=True),
+            modification_time=os.path.getmtime(absolute_path),
+        )
+
+    def runner(self, **kwargs):
+        """Return a dbtRunner that shares the daemon's profiles and projects,
+        dropping them first if their files changed.
+        """
+        # dbt.cli.main imports this module
+        from dbt.cli.main import dbtRunner
+
+        if self.config_watcher.poll():
+            self.config_cache.clear()
+        runner = dbtRunner(**kwargs)
+        runner.context_obj["config_cache"] = self.config_cache
+        return runner
+
+    def refresh(
+        self,
+        parse_args: Optional[List[str]] = None,
+        callbacks: Optional[List[Callable[[EventMsg], None]]] = None,
+    ):
+        """Parse the project if files changed since the last parse, if
+        parse_args differ from the ones it was parsed with, or if the last
+        parse failed. Returns the dbtRunnerResult of the parse, or None if
+        nothing had to be parsed.
+        """
+        if parse_args is None:
+            parse_args = self.parsed_args or self.parse_args
+        changes = self.watcher.poll()
+        if not changes and parse_args == self.parsed_args and self.manifest is not None:
+            return None
+
+        runner = self.runner(callbacks=callbacks)
+        if self.manifest is not None:
+            runner.context_obj["saved_manifest"] = self.manifest
+            runner.context_obj["file_diff"] = self.build_file_diff(changes)
+        result = runner.invoke(parse_args)
+        # A failed partial parse can leave the saved manifest half updated,
+        # so start over from partial_parse.msgpack next time
+        self.manifest = (
+            result.result if result.success and isinstance(result.result, Manifest) else None
+        )
+        self.parsed_args = parse_args
+        return result
+
+    def resolve_args(self, args: List[str]) -> Tuple[List[str], Optional[List[str]]]:
+        """Return the arguments to run the command with, and the arguments
+        to parse the project with first, or None if the command doesn't need
+        a manifest.
+        """
+        import click
+        from click.core import ParameterSource
+        from dbt.cli.main import cli
+
+        command_args = list(args)
+        ctx = cli.make_context(cli.name, command_args, resilient_parsing=True)
+        command: Optional[click.Command] = cli
+        command_path = ["dbt"]
+        while isinstance(command, click.Group):
+            # the arguments after the group's own options, from the command's name
+            command_args = command.make_parser(ctx).parse_args(command_args)[1]
+            if not command_args:
+                raise DbtRuntimeError("No command given")
+            name, command, _ = command.resolve_command(ctx, command_args)
+            if command is None or name is None:
+                raise DbtRuntimeError(f"No such command: {command_args[0]}")
+            command_path.append(name)
+            command_args = ctx.args
+            ctx = command.make_context(
+                name, list(command_args), parent=ctx, resilient_parsing=True
+            )
+        assert command is not None
+
+        if command.name in UNSUPPORTED_COMMANDS:
+            raise DbtRuntimeError(f"`{' '.join(command_path)}` can't be run by the daemon")
+
+        options = dict(self.options)
+        defaults = {}
+        for name in PARSE_OPTIONS:
+            if name not in ctx.params:
+                continue
+            if ctx.get_parameter_source(name) == ParameterSource.COMMANDLINE:
+                if name in FIXED_OPTIONS:
+                    raise DbtRuntimeError(
+                        f"--{name.replace('_', '-')} can't be set on commands run by the daemon"
+                    )
+                options[name] = ctx.params[name]
+            else:
+                defaults[name] = self.options[name]
+
+        command_args = [*args, *option_args(defaults)]
+        if command.name in NO_MANIFEST_COMMANDS:
+            return command_args, None
+        return command_args, ["parse", *option_args(options)]
+
+    def handle_request(
+        self, args: List[str], send: Callable[[Dict[str, Any]], None]
+    ) -> Dict[str, Any]:
+        def forward_event(msg: EventMsg) -> None:
+            if msg.info.level != EventLevel.DEBUG:
+                send({"level": msg.info.level, "msg": msg.info.msg})  # type: ignore
+
+        try:
+            command_args, parse_args = self.resolve_args(args)
+        except DbtRuntimeError as exc:
+            return {"success": False, "exception": str(exc)}
+
+        manifest = None
+        if parse_args is not None:
+            result = self.refresh(parse_args, callbacks=[forward_event])
+            if result is not None and not result.success:
+                return self.response(result)
+            assert self.manifest is not None
+            # Commands can change the nodes in the manifest, e.g. by compiling them
+            manifest = self.manifest.deepcopy()
+
+        return self.response(
+            self.runner(manifest=manifest, callbacks=[forward_event]).invoke(command_args)
+        )
+
+    def response(self, result) -> Dict[str, Any]:
+        response = {
+            "success": result.success,
+            "exception": str(result.exception) if result.exception is not None else None,
+        }
+        # `dbt ls` prints its results rather than logging them
+        if isinstance(result.result, list):
+            response["result"] = result.result
+        return response
+
+    def run(self):
+        socket_path = self.args.SOCKET_PATH or os.path.join(
+            self.config.project_target_path, SOCKET_FILE_NAME
+        )
+        if os.path.exists(socket_path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(socket_path)
+                except OSError:
+                    # Left behind by a daemon that didn't shut down cleanly
+                    os.unlink(socket_path)
+                else:
+                    raise DbtRuntimeError(f"A dbt daemon is already listening on {socket_path}")
+        os.makedirs(os.path.dirname(os.path.abspath(socket_path)), exist_ok=True)
+
+        result = self.refresh()
+        if result is not None and not result.success:
+            fire_event(
+                Note(msg=f"Parsing failed, will retry on the next command: {result.exception}")
+            )
+
+        with DaemonServer(socket_path, self) as server:
+            fire_event(Note(msg=f"dbt daemon listening on {socket_path}. Press Ctrl+C to exit."))
+            try:
+                server.serve_forever(poll_interval=POLL_INTERVAL)
+            finally:
+                os.unlink(socket_path)
@@ -1,7 +1,9 @@
 import os
 import threading
 import time
-from typing import Optional
+from collections import defaultdict
+from concurrent.futures import as_completed
+from typing import AbstractSet, Dict, List, Optional, Tuple
 
 from .base import BaseRunner
 from .printer import (
@@ -25,16 +27,28 @@ from dbt.events.types import (
 )
 from dbt.node_types import NodeType
 
+from dbt.adapters.base.impl import FreshnessResponse
 from dbt.adapters.capability import Capability
 from dbt.contracts.connection import AdapterResponse
 from dbt.contracts.graph.nodes import SourceDefinition
 from dbt.events.base_types import EventLevel
 from dbt.graph import ResourceTypeSelector
+from dbt.utils import executor
 
 RESULT_FILE_NAME = "sources.json"
 
+# the most sources to check with one query, in batch mode
+FRESHNESS_BATCH_SIZE = 100
+
+# the adapter response and freshness of a source, by its unique_id
+FreshnessCache = Dict[str, Tuple[Optional[AdapterResponse], FreshnessResponse]]
+
 
 class FreshnessRunner(BaseRunner):
+    def __init__(self, config, adapter, node, node_index, num_nodes) -> None:
+        super().__init__(config, adapter, node, node_index, num_nodes)
+        self.freshness_cache: FreshnessCache = {}
+
     def on_skip(self):
         raise DbtRuntimeError("Freshness: nodes cannot be skipped!")
 
@@ -100,6 +114,8 @@ class FreshnessRunner(BaseRunner):
 
     def execute(self, compiled_node, manifest):
         relation = self.adapter.Relation.create_from_source(compiled_node)
+        # the freshness of a source may already have been checked in a batch
+        cached = self.freshness_cache.get(compiled_node.unique_id)
         # given a Source, calculate its freshness.
         with self.adapter.connection_for(compiled_node):
             self.adapter.clear_transaction()
@@ -107,7 +123,7 @@ class FreshnessRunner(BaseRunner):
             freshness = None
 
             if compiled_node.loaded_at_field is not None:
-                adapter_response, freshness = self.adapter.calculate_freshness(
+                adapter_response, freshness = cached or self.adapter.calculate_freshness(
                     relation,
                     compiled_node.loaded_at_field,
                     compiled_node.freshness.filter,
@@ -124,7 +140,10 @@ class FreshnessRunner(BaseRunner):
                         )
                     )
 
-                adapter_response, freshness = self.adapter.calculate_freshness_from_metadata(
+                (
+                    adapter_response,
+                    freshness,
+                ) = cached or self.adapter.calculate_freshness_from_metadata(
                     relation,
                     manifest=manifest,
                 )
@@ -171,10 +190,102 @@ class FreshnessSelector(ResourceTypeSelector):
 
 
 class FreshnessTask(GraphRunnableTask):
+    def __init__(self, args, config, manifest) -> None:
+        super().__init__(args, config, manifest)
+        self.freshness_cache: FreshnessCache = {}
+
     def defer_to_manifest(self, adapter, selected_uids):
         # freshness don't defer
         return
 
+    def before_run(self, adapter, selected_uids: AbstractSet[str]):
+        super().before_run(adapter, selected_uids)
+        if getattr(self.args, "batch", False):
+            self.populate_freshness_cache(adapter, selected_uids)
+
+    def populate_freshness_cache(self, adapter, selected_uids: AbstractSet[str]) -> None:
+        """Check the freshness of the selected sources in batches of up to
+        FRESHNESS_BATCH_SIZE sources from the same schema, one query per
+        batch. Sources that a batch can't account for, including every source
+        in a batch that fails, are left to be checked one at a time.
+        """
+        if self.manifest is None:
+            raise DbtInternalError("manifest must be set to check freshness in batches")
+
+        loaded_at_batches: Dict[Tuple[str, str], List[SourceDefinition]] = defaultdict(list)
+        metadata_batches: Dict[Tuple[str, str], List[SourceDefinition]] = defaultdict(list)
+        for unique_id in sorted(selected_uids):
+            source = self.manifest.sources.get(unique_id)
+            if source is None:
+                continue
+            key = (source.database or "", source.schema)
+            if source.loaded_at_field is not None:
+                loaded_at_batches[key].append(source)
+            elif adapter.supports(Capability.TableLastModifiedMetadata):
+                metadata_batches[key].append(source)
+
+        with executor(self.config) as tpe:
+            futures = []
+            for batches, check in [
+                (loaded_at_batches, self._check_freshness_batch),
+                (metadata_batches, self._check_metadata_freshness_batch),
+            ]:
+                for (database, schema), sources in batches.items():
+                    for start in range(0, len(sources), FRESHNESS_BATCH_SIZE):
+                        futures.append(
+                            tpe.submit_connected(
+                                adapter,
+                                f"freshness:{database}.{schema}",
+                                check,
+                                adapter,
+                                sources[start : start + FRESHNESS_BATCH_SIZE],
+                            )
+                        )
+
+            for future in as_completed(futures):
+                try:
+                    self.freshness_cache.update(future.result())
+                except Exception as exc:
+                    fire_event(
+                        Note(
+                            msg=f"Source freshness could not be checked in a batch, so each source will be checked on its own: {exc}"
+                        ),
+                        EventLevel.WARN,
+                    )
+
+    def _check_freshness_batch(self, adapter, sources: List[SourceDefinition]) -> FreshnessCache:
+        adapter_response, freshnesses = adapter.calculate_freshness_batch(
+            [
+                (
+                    adapter.Relation.create_from_source(source),
+                    source.loaded_at_field,
+                    source.freshness.filter if source.freshness else None,
+                )
+                for source in sources
+            ],
+            manifest=self.manifest,
+        )
+        return {
+            source.unique_id: (adapter_response, freshness)
+            for source, freshness in zip(sources, freshnesses)
+            if freshness is not None
+        }
+
+    def _check_metadata_freshness_batch(
+        self, adapter, sources: List[SourceDefinition]
+    ) -> FreshnessCache:
+        relations = {
+            source.unique_id: adapter.Relation.create_from_source(source) for source in sources
+        }
+        adapter_response, freshnesses = adapter.calculate_freshness_from_metadata_batch(
+            list(relations.values()), manifest=self.manifest
+        )
+        return {
+            unique_id: (adapter_response, freshnesses[relation])
+            for unique_id, relation in relations.items()
+            if relation in freshnesses
+        }
+
     def result_path(self):
         if self.args.output:
             return os.path.realpath(self.args.output)
@@ -197,6 +308,12 @@ class FreshnessTask(GraphRunnableTask):
     def get_runner_type(self, _):
         return FreshnessRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        if isinstance(runner, FreshnessRunner):
+            runner.freshness_cache = self.freshness_cache
+        return runner
+
     def get_result(self, results, elapsed_time, generated_at):
         return FreshnessResult.from_node_results(
             elapsed_time=elapsed_time, generated_at=generated_at, results=results
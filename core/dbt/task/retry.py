@@ -117,6 +117,7 @@ class RetryTask(ConfiguredTask):
                     new_graph.graph,
                     self.manifest,
                     unique_ids,
+                    self.get_execution_times(),
                 )
 
         task = TaskWrapper(
@@ -335,7 +335,8 @@ class RunTask(CompileTask):
         # find all hooks defined in the manifest (could be multiple projects)
         hooks: List[HookNode] = get_hooks_by_tags(nodes, {hook_type})
         hooks.sort(key=self._hook_keyfunc)
-        return hooks
+        # run_hooks compiles them and updates their status
+        return [self.manifest.writable_node(hook) for hook in hooks]
 
     def run_hooks(self, adapter, hook_type: RunHookType, extra_context) -> None:
         ordered_hooks = self.get_hooks_by_type(hook_type)
@@ -12,6 +12,7 @@ import dbt.tracking
 import dbt.utils
 from dbt.adapters.base import BaseRelation
 from dbt.adapters.factory import get_adapter
+from dbt.clients.system import read_json
 from dbt.contracts.graph.manifest import WritableManifest
 from dbt.contracts.graph.nodes import ResultNode
 from dbt.contracts.results import (
@@ -134,10 +135,28 @@ class GraphRunnableTask(ConfiguredTask):
     def defer_to_manifest(self, adapter, selected_uids: AbstractSet[str]):
         raise NotImplementedError(f"defer_to_manifest not implemented for task {type(self)}")
 
+    def get_execution_times(self) -> Optional[Dict[str, float]]:
+        """Get the execution times of nodes in the previous run, for the
+        critical path scheduler. Returns None to schedule nodes by depth.
+        """
+        if getattr(get_flags(), "SCHEDULER", None) != "critical-path":
+            return None
+
+        path = os.path.join(self.config.project_target_path, RESULT_FILE_NAME)
+        try:
+            return {
+                result["unique_id"]: float(result["execution_time"])
+                for result in read_json(path).get("results", [])
+                if "unique_id" in result and "execution_time" in result
+            }
+        except (EnvironmentError, ValueError, AttributeError, TypeError):
+            # Missing, or not a run_results.json dbt wrote
+            return {}
+
     def get_graph_queue(self) -> GraphQueue:
         selector = self.get_node_selector()
         spec = self.get_selection_spec()
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, self.get_execution_times())
 
     def _runtime_initialize(self):
         self.compile_manifest()
@@ -147,12 +166,15 @@ class GraphRunnableTask(ConfiguredTask):
         self.job_queue = self.get_graph_queue()
 
         # we use this a couple of times. order does not matter.
+        # The runners change these nodes, e.g. by compiling them.
         self._flattened_nodes = []
         for uid in self.job_queue.get_selected_nodes():
             if uid in self.manifest.nodes:
-                self._flattened_nodes.append(self.manifest.nodes[uid])
+                self._flattened_nodes.append(self.manifest.writable_node(self.manifest.nodes[uid]))
             elif uid in self.manifest.sources:
-                self._flattened_nodes.append(self.manifest.sources[uid])
+                self._flattened_nodes.append(
+                    self.manifest.writable_node(self.manifest.sources[uid])
+                )
             else:
                 raise DbtInternalError(
                     f"Node selection returned {uid}, expected a node or a source"
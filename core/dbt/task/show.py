@@ -1,9 +1,12 @@
 import io
 import threading
 import time
+from typing import Callable, Optional
+
+import agate
 
 from dbt.context.providers import generate_runtime_model_context
-from dbt.contracts.graph.nodes import SeedNode
+from dbt.contracts.graph.nodes import ResultNode, SeedNode
 from dbt.contracts.results import RunResult, RunStatus
 from dbt.events.base_types import EventLevel
 from dbt.events.functions import fire_event
@@ -12,11 +15,51 @@ from dbt.exceptions import DbtRuntimeError
 from dbt.task.compile import CompileTask, CompileRunner
 from dbt.task.seed import SeedRunner
 
+BatchCallback = Callable[[ResultNode, agate.Table], None]
+
+
+def is_previewed(node: ResultNode, args) -> bool:
+    """Whether dbt show prints the results of node, rather than only running
+    it to show a node that depends on it."""
+    if getattr(args, "inline", None):
+        return node.name == "inline_query"
+    return node.name in args.select[0]
+
+
+def format_table(table, output_format: str) -> str:
+    # Hack to get Agate table output as string
+    output = io.StringIO()
+    if output_format == "json":
+        table.to_json(path=output)
+    elif output_format == "csv":
+        table.to_csv(path=output)
+    else:
+        table.print_table(output=output, max_rows=None)
+    return output.getvalue()
+
+
+def fire_show_node(node: ResultNode, table: agate.Table, args) -> None:
+    node_name = node.name
+
+    if hasattr(node, "version") and node.version:
+        node_name += f".v{node.version}"
+
+    fire_event(
+        ShowNode(
+            node_name=node_name,
+            preview=format_table(table, args.output),
+            is_inline=bool(getattr(args, "inline", None)),
+            output_format=args.output,
+            unique_id=node.unique_id,
+        )
+    )
+
 
 class ShowRunner(CompileRunner):
     def __init__(self, config, adapter, node, node_index, num_nodes) -> None:
         super().__init__(config, adapter, node, node_index, num_nodes)
         self.run_ephemeral_models = True
+        self.batch_callback: Optional[BatchCallback] = None
 
     def execute(self, compiled_node, manifest):
         start_time = time.time()
@@ -35,9 +78,20 @@ class ShowRunner(CompileRunner):
                 "limit": limit,
             },
         )
-        adapter_response, execute_result = self.adapter.execute(
-            compiled_node.compiled_code, fetch=True
-        )
+        if getattr(self.config.args, "stream", False):
+            # each batch is printed, and handed to batch_callback, as it is
+            # fetched, so the result never has all of the rows
+            adapter_response, stream = self.adapter.execute_stream(compiled_node.compiled_code)
+            for batch in stream.batches():
+                if self.batch_callback is not None:
+                    self.batch_callback(compiled_node, batch)
+                if is_previewed(compiled_node, self.config.args):
+                    fire_show_node(compiled_node, batch, self.config.args)
+            execute_result = None
+        else:
+            adapter_response, execute_result = self.adapter.execute(
+                compiled_node.compiled_code, fetch=True
+            )
 
         end_time = time.time()
 
@@ -55,6 +109,12 @@ class ShowRunner(CompileRunner):
 
 
 class ShowTask(CompileTask):
+    def __init__(
+        self, args, config, manifest, batch_callback: Optional[BatchCallback] = None
+    ) -> None:
+        super().__init__(args, config, manifest)
+        self.batch_callback = batch_callback
+
     def _runtime_initialize(self):
         if not (self.args.select or getattr(self.args, "inline", None)):
             raise DbtRuntimeError("Either --select or --inline must be passed to show")
@@ -66,46 +126,25 @@ class ShowTask(CompileTask):
         else:
             return ShowRunner
 
+    def get_runner(self, node):
+        runner = super().get_runner(node)
+        if isinstance(runner, ShowRunner):
+            runner.batch_callback = self.batch_callback
+        return runner
+
     def task_end_messages(self, results):
         is_inline = bool(getattr(self.args, "inline", None))
 
-        if is_inline:
-            matched_results = [result for result in results if result.node.name == "inline_query"]
-        else:
-            matched_results = []
-            for result in results:
-                if result.node.name in self.selection_arg[0]:
-                    matched_results.append(result)
-                else:
-                    fire_event(
-                        Note(msg=f"Excluded node '{result.node.name}' from results"),
-                        EventLevel.DEBUG,
-                    )
-
-        for result in matched_results:
-            table = result.agate_table
-
-            # Hack to get Agate table output as string
-            output = io.StringIO()
-            if self.args.output == "json":
-                table.to_json(path=output)
-            else:
-                table.print_table(output=output, max_rows=None)
-
-            node_name = result.node.name
-
-            if hasattr(result.node, "version") and result.node.version:
-                node_name += f".v{result.node.version}"
-
-            fire_event(
-                ShowNode(
-                    node_name=node_name,
-                    preview=output.getvalue(),
-                    is_inline=is_inline,
-                    output_format=self.args.output,
-                    unique_id=result.node.unique_id,
+        for result in results:
+            if is_previewed(result.node, self.args):
+                # streamed results were printed as they were fetched
+                if result.agate_table is not None:
+                    fire_show_node(result.node, result.agate_table, self.args)
+            elif not is_inline:
+                fire_event(
+                    Note(msg=f"Excluded node '{result.node.name}' from results"),
+                    EventLevel.DEBUG,
                 )
-            )
 
     def _handle_result(self, result):
         super()._handle_result(result)
@@ -12,6 +12,7 @@ from dbt.adapters.factory import Adapter
 from dbt.cli.main import dbtRunner
 from dbt.logger import log_manager
 from dbt.contracts.graph.manifest import Manifest
+from dbt.parser.manifest import PartialParseFile
 from dbt.events.functions import (
     fire_event,
     capture_stdout_logs,
@@ -154,7 +155,7 @@ def get_manifest(project_root) -> Optional[Manifest]:
     if os.path.exists(path):
         with open(path, "rb") as fp:
             manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
+        manifest: Manifest = PartialParseFile(manifest_mp).read_manifest()
         return manifest
     else:
         return None
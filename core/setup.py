@@ -91,6 +91,10 @@ setup(
         "urllib3~=1.0",
         # ----
     ],
+    extras_require={
+        # A compiled backend for validating configs, which makes parsing large projects faster.
+        "fast-validation": ["fastjsonschema>=2.16,<3"],
+    },
     zip_safe=False,
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -1,4 +1,6 @@
 from contextlib import contextmanager
+import time
+import uuid
 
 import psycopg2
 from psycopg2.extensions import string_types
@@ -6,12 +8,16 @@ from psycopg2.extensions import string_types
 import dbt.exceptions
 from dbt.adapters.base import Credentials
 from dbt.adapters.sql import SQLConnectionManager
-from dbt.contracts.connection import AdapterResponse
+from dbt.contracts.connection import AdapterResponse, Connection
 from dbt.events import AdapterLogger
+from dbt.events.contextvars import get_node_info
+from dbt.events.functions import fire_event
+from dbt.events.types import ConnectionUsed, SQLQuery, SQLQueryStatus
+from dbt.utils import cast_to_str
 
 from dbt.helper_types import Port
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, IO, Optional, Tuple
 from typing_extensions import Annotated
 from mashumaro.jsonschema.annotations import Maximum, Minimum
 
@@ -189,6 +195,61 @@ class PostgresConnectionManager(SQLConnectionManager):
 
         logger.debug("Cancel query '{}': {}".format(connection_name, res))
 
+    def copy_from(self, sql: str, file: IO[str]) -> Tuple[Connection, Any]:
+        """Run a `copy ... from stdin` statement, streaming its rows from file.
+        Like add_query, this begins a transaction if one isn't open.
+        """
+        return self._add_cursor_query(sql, True, lambda cursor: cursor.copy_expert(sql, file))
+
+    def add_streaming_query(self, sql: str, auto_begin: bool = False) -> Tuple[Connection, Any]:
+        # a named cursor is a server-side cursor, whose rows are only sent as
+        # they are fetched. They can't be used outside of a transaction.
+        connection = self.get_thread_connection()
+        if connection.handle.autocommit:
+            return super().add_streaming_query(sql, auto_begin)
+        return self._add_cursor_query(
+            sql,
+            auto_begin,
+            lambda cursor: cursor.execute(sql),
+            name=f"dbt_stream_{uuid.uuid4().hex}",
+        )
+
+    def _add_cursor_query(
+        self, sql: str, auto_begin: bool, run: Callable[[Any], None], **cursor_kwargs: Any
+    ) -> Tuple[Connection, Any]:
+        """add_query, for cursors created or run in some other way"""
+        connection = self.get_thread_connection()
+        if auto_begin and connection.transaction_open is False:
+            self.begin()
+        fire_event(
+            ConnectionUsed(
+                conn_type=self.TYPE,
+                conn_name=cast_to_str(connection.name),
+                node_info=get_node_info(),
+            )
+        )
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name), sql=sql, node_info=get_node_info()
+                )
+            )
+            pre = time.time()
+
+            cursor = connection.handle.cursor(**cursor_kwargs)
+            run(cursor)
+
+            fire_event(
+                SQLQueryStatus(
+                    status=str(self.get_response(cursor)),
+                    elapsed=round((time.time() - pre)),
+                    node_info=get_node_info(),
+                )
+            )
+
+            return connection, cursor
+
     @classmethod
     def get_credentials(cls, credentials):
         return credentials
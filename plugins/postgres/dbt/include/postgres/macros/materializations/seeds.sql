@@ -0,0 +1,9 @@
+{% macro postgres__load_csv_rows(model, agate_table) %}
+  {#-- Adapters built on the postgres macros may not support COPY --#}
+  {% if adapter.type() != 'postgres' %}
+    {{ return(default__load_csv_rows(model, agate_table)) }}
+  {% endif %}
+
+  {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
+  {{ return(adapter.copy_csv_rows(this, agate_table, cols_sql)) }}
+{% endmacro %}
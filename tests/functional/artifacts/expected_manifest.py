@@ -57,6 +57,7 @@ def get_rendered_seed_config(**updates):
         "post-hook": [],
         "column_types": {},
         "delimiter": ",",
+        "infer_types_from_all_rows": False,
         "quoting": {},
         "tags": [],
         "quote_columns": True,
@@ -1,21 +1,9 @@
 import pytest
-
-from dbt.tests.util import run_dbt, run_dbt_and_capture
-
-from dbt.contracts.graph.manifest import Manifest
-from dbt.contracts.graph.nodes import RefArgs
 import os
 
+from dbt.tests.util import get_manifest, run_dbt, run_dbt_and_capture
 
-def get_manifest():
-    path = "./target/partial_parse.msgpack"
-    if os.path.exists(path):
-        with open(path, "rb") as fp:
-            manifest_mp = fp.read()
-        manifest: Manifest = Manifest.from_msgpack(manifest_mp)
-        return manifest
-    else:
-        return None
+from dbt.contracts.graph.nodes import RefArgs
 
 
 basic__schema_yml = """
@@ -157,7 +145,7 @@ class TestBasicExperimentalParser(BasicExperimentalParser):
         project,
     ):
         run_dbt(["--use-experimental-parser", "parse"])
-        manifest = get_manifest()
+        manifest = get_manifest(project.project_root)
         node = manifest.nodes["model.test.model_a"]
         assert node.refs == [RefArgs(name="model_b")]
         assert node.sources == [["my_src", "my_tbl"]]
@@ -182,7 +170,7 @@ class TestBasicStaticParser(BasicExperimentalParser):
         # jinja rendering
         assert not ("1602: " in log_output)
 
-        manifest = get_manifest()
+        manifest = get_manifest(project.project_root)
         node = manifest.nodes["model.test.model_a"]
         assert node.refs == [RefArgs(name="model_b")]
         assert node.sources == [["my_src", "my_tbl"]]
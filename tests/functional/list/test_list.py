@@ -448,6 +448,7 @@ class TestList:
                     "quoting": {},
                     "column_types": {},
                     "delimiter": ",",
+                    "infer_types_from_all_rows": False,
                     "persist_docs": {},
                     "quote_columns": False,
                     "full_refresh": None,
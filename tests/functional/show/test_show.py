@@ -1,5 +1,6 @@
 import pytest
 
+from dbt.cli.main import dbtRunner
 from dbt.exceptions import DbtRuntimeError, Exception as DbtException
 from dbt.tests.util import run_dbt_and_capture, run_dbt
 from tests.functional.show.fixtures import (
@@ -151,6 +152,41 @@ class TestShowSeed(ShowBase):
         assert "Previewing node 'sample_seed'" in log_output
 
 
+class TestShowCsv(ShowBase):
+    def test_inline_csv(self, project):
+        (_, log_output) = run_dbt_and_capture(
+            ["show", "--inline", "select 1 as col_one, 'x' as col_two", "--output", "csv"]
+        )
+        assert "col_one,col_two\n1,x" in log_output
+
+
+class TestShowStream(ShowBase):
+    def test_stream(self, project):
+        (results, log_output) = run_dbt_and_capture(
+            [
+                "show",
+                "--inline",
+                "select n from generate_series(1, 2500) as g(n)",
+                "--limit",
+                "-1",
+                "--stream",
+            ]
+        )
+        # one preview for each batch of 1000 rows
+        assert log_output.count("Previewing inline node") == 3
+        assert results[0].agate_table is None
+
+    def test_stream_show(self, project):
+        batches = list(
+            dbtRunner().stream_show(
+                ["--inline", "select n from generate_series(1, 2500) as g(n)", "--limit", "-1"]
+            )
+        )
+        assert [node.name for node, _ in batches] == ["inline_query"] * 3
+        assert [len(batch) for _, batch in batches] == [1000, 1000, 500]
+        assert batches[2][1].rows[-1]["n"] == 2500
+
+
 class TestShowModelVersions:
     @pytest.fixture(scope="class")
     def models(self):
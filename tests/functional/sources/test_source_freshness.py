@@ -359,6 +359,45 @@ class TestOverrideSourceFreshness(SuccessfulSourceFreshnessTest):
         assert result_source_d["criteria"] == expected
 
 
+class TestSourceFreshnessBatch(SuccessfulSourceFreshnessTest):
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {"schema.yml": override_freshness_models_schema_yml}
+
+    def test_source_freshness_batch(self, project):
+        self._set_updated_at_to(project, timedelta(hours=-30))
+
+        results = self.run_dbt_with_vars(project, ["source", "freshness"], expect_pass=False)
+        batched_results = self.run_dbt_with_vars(
+            project, ["source", "freshness", "--batch"], expect_pass=False
+        )
+        assert len(batched_results) == 4
+        by_id = {r.node.unique_id: r for r in results}
+        for result in batched_results:
+            expected = by_id[result.node.unique_id]
+            assert result.status == expected.status
+            assert result.max_loaded_at == expected.max_loaded_at
+            # all four sources were checked by the same query
+            assert result.adapter_response == batched_results[0].adapter_response
+
+
+class TestSourceFreshnessBatchErrors(SuccessfulSourceFreshnessTest):
+    @pytest.fixture(scope="class")
+    def models(self):
+        return {
+            "schema.yml": error_models_schema_yml,
+            "model.sql": error_models_model_sql,
+        }
+
+    def test_source_freshness_batch_error(self, project):
+        # a failed batch falls back to checking each source on its own
+        results = self.run_dbt_with_vars(
+            project, ["source", "freshness", "--batch"], expect_pass=False
+        )
+        assert len(results) == 1
+        assert results[0].status == "runtime error"
+
+
 class TestSourceFreshnessMacroOverride(SuccessfulSourceFreshnessTest):
     @pytest.fixture(scope="class")
     def macros(self):
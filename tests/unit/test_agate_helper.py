@@ -2,13 +2,14 @@ import unittest
 
 import agate
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from isodate import tzinfo
 import os
 from shutil import rmtree
 from tempfile import mkdtemp
 from dbt.clients import agate_helper
+from dbt.exceptions import DbtRuntimeError
 
 SAMPLE_CSV_DATA = """a,b,c,d,e,f,g
 1,n,test,3.2,20180806T11:33:29.320Z,True,NULL
@@ -79,6 +80,86 @@ class TestAgateHelper(unittest.TestCase):
         for expected, row in zip(EXPECTED_STRINGS, tbl):
             self.assertEqual(list(row), expected)
 
+    def _write_csv(self, data):
+        path = os.path.join(self.tempdir, "input.csv")
+        with open(path, "wb") as fp:
+            fp.write(data.encode("utf-8"))
+        return path
+
+    def test_seed_from_csv_small(self):
+        path = self._write_csv(SAMPLE_CSV_BOM_DATA)
+        tbl = agate_helper.seed_from_csv(path, (), sample_size=2)
+        self.assertNotIsInstance(tbl, agate_helper.CsvTable)
+        self.assertEqual([list(row) for row in tbl], EXPECTED)
+
+    def test_seed_from_csv_sampled(self):
+        path = self._write_csv("\ufeffa,b,a\n1,x,\n2,y,2020-01-01\n3,z,\n")
+        tbl = agate_helper.seed_from_csv(path, (), sample_size=2, chunk_size=2)
+        self.assertIsInstance(tbl, agate_helper.CsvTable)
+        self.assertEqual(tbl.column_names, ("a", "b", "a_2"))
+        self.assertIsInstance(tbl.column_types[0], agate.data_types.Number)
+        self.assertIsInstance(tbl.column_types[2], agate.data_types.Date)
+        self.assertEqual(len(agate_helper.as_matrix(tbl)), 2)
+        self.assertEqual(len(tbl.rows), 3)
+        self.assertEqual(
+            [list(row) for row in tbl.rows],
+            [[1, "x", None], [2, "y", date(2020, 1, 1)], [3, "z", None]],
+        )
+
+    def test_seed_from_csv_sample_mismatch(self):
+        for data in ["a,b\n1,x\n2,y\nthree,z\n", "a,b\n1,x\n2,y\n2.5,z\n"]:
+            path = self._write_csv(data)
+            tbl = agate_helper.seed_from_csv(path, (), sample_size=2)
+            with self.assertRaisesRegex(DbtRuntimeError, "infer_types_from_all_rows"):
+                list(tbl.rows)
+
+        tbl = agate_helper.seed_from_csv(path, (), full_scan=True, sample_size=2)
+        self.assertEqual(len(tbl.rows), 3)
+        # the row with the most precise number is added to the sample, so
+        # adapters infer a decimal type for the column
+        self.assertEqual(tbl.aggregate(agate.MaxPrecision("a")), 1)
+        self.assertEqual([list(row) for row in tbl.rows][2], [Decimal("2.5"), "z"])
+
+    def _write_large_csv(self):
+        return self._write_csv("id,name\n" + "".join(f"{i},n{i}\n" for i in range(25)))
+
+    def test_seed_from_csv_agate_apis(self):
+        path = self._write_large_csv()
+        tbl = agate_helper.seed_from_csv(path, (), sample_size=10, chunk_size=7)
+        self.assertIsInstance(tbl, agate_helper.CsvTable)
+        self.assertEqual(len(tbl), 25)
+        self.assertEqual(len(list(tbl)), 25)
+        # adapters pick column types from the sample, without reading every row
+        self.assertEqual(tbl.aggregate(agate.MaxPrecision("id")), 0)
+        self.assertFalse(tbl.rows.loaded)
+        self.assertEqual(len(agate_helper.as_matrix(tbl)), 10)
+
+        self.assertEqual(list(tbl.rows[0]), [0, "n0"])
+        self.assertEqual(list(tbl[-1]), [24, "n24"])
+        self.assertEqual(tbl.rows[10:12][1]["name"], "n11")
+        self.assertEqual(len(tbl.columns["id"].values()), 25)
+        self.assertEqual(len(tbl.where(lambda row: row["id"] >= 10).rows), 15)
+        self.assertEqual(len(tbl.order_by("id", reverse=True).limit(20).rows), 20)
+        self.assertEqual(tbl.aggregate(agate.Sum("id")), 300)
+        self.assertEqual(tbl.aggregate(agate.MaxLength("name")), 3)
+        out = os.path.join(self.tempdir, "output.csv")
+        tbl.to_csv(out)
+        with open(out) as fp:
+            self.assertEqual(len(fp.readlines()), 26)
+        self.assertEqual(len(list(tbl.rows)), 25)
+
+    def test_seed_from_csv_max_length_mismatch(self):
+        path = self._write_large_csv()
+        tbl = agate_helper.seed_from_csv(path, (), sample_size=10, chunk_size=7)
+        self.assertEqual(len(list(tbl.rows)), 25)
+        self.assertEqual(tbl.aggregate(agate.MaxLength(1)), 2)
+        with self.assertRaisesRegex(DbtRuntimeError, "infer_types_from_all_rows"):
+            list(tbl.rows)
+
+        tbl = agate_helper.seed_from_csv(path, (), full_scan=True, sample_size=10)
+        self.assertEqual(tbl.aggregate(agate.MaxLength(1)), 3)
+        self.assertEqual(len(list(tbl.rows)), 25)
+
     def test_from_data(self):
         column_names = ["a", "b", "c", "d", "e", "f", "g"]
         data = [
@@ -202,6 +283,48 @@ class TestAgateHelper(unittest.TestCase):
         for i, row in enumerate(tbl):
             self.assertEqual(list(row), expected[i])
 
+    def test_table_from_result(self):
+        column_names = ["a", "b", "c", "d", "e", "f", "g", "h", "i", "j", "k"]
+        rows = [
+            (1, 1.5, Decimal("2.25"), "0005", True, date(2020, 1, 1), None, 1, {"x": 1}, "", 1),
+            (2, 2.0, Decimal("3"), "null", False, date(2020, 1, 2), None, 2.5, [1], "a", True),
+            (None, None, None, None, None, None, None, None, None, None, 0),
+        ]
+        expected = agate_helper.table_from_data_flat(
+            [dict(zip(column_names, row)) for row in rows], column_names
+        )
+
+        tbl = agate_helper.table_from_result(rows, column_names)
+        self.assertIsInstance(tbl, agate_helper.ResultTable)
+        self.assertEqual(len(tbl), 3)
+        self.assertEqual(tbl.column_names, expected.column_names)
+        self.assertEqual(
+            [type(t) for t in tbl.column_types], [type(t) for t in expected.column_types]
+        )
+        matrix = agate_helper.as_matrix(tbl)
+        self.assertEqual(matrix, agate_helper.as_matrix(expected))
+        self.assertEqual(
+            [[type(v) for v in row] for row in matrix],
+            [[type(v) for v in row] for row in expected.rows],
+        )
+        # the agate rows are only built once they're asked for
+        self.assertNotIn("_rows", vars(tbl))
+        self.assertEqual([list(row) for row in tbl.rows], [list(row) for row in expected.rows])
+        self.assertEqual(tbl.columns["h"].values(), expected.columns["h"].values())
+
+    def test_result_stream(self):
+        batches = [
+            agate_helper.table_from_result([(1,), (2,)], ["a"]),
+            agate_helper.table_from_result([(3,)], ["a"]),
+        ]
+        stream = agate_helper.ResultStream(iter(batches))
+        self.assertEqual(stream.column_names, ("a",))
+        self.assertEqual([row["a"] for row in stream], [1, 2, 3])
+        with self.assertRaises(DbtRuntimeError):
+            list(stream)
+
+        self.assertEqual(agate_helper.ResultStream(iter([])).column_names, ())
+
     def test_nocast_bool_01(self):
         # True and False values should not be cast to 1 and 0, and vice versa
         # See: https://github.com/dbt-labs/dbt-core/issues/4511
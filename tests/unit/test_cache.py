@@ -522,3 +522,63 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
         self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+    def test_drop_schema(self):
+        self.cache.drop_schema("dbt", "FOO")
+        self.assertEqual(len(self.cache.get_relations("dbt", "foo")), 0)
+        # dbt.bar.table3 and dbt_2.foo.table1 are cascaded out
+        self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
+        self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
+        self.assertEqual(len(self.cache.relations), 2)
+        self.assertNotIn(("dbt", "foo"), self.cache)
+
+
+class TestManySchemasCache(TestCase):
+    def setUp(self):
+        self.cache = RelationsCache()
+        for schema in range(30):
+            self.cache.update_schemas([("dbt", f"schema_{schema}")])
+            for identifier in range(20):
+                self.cache.add(make_relation("dbt", f"schema_{schema}", f"table_{identifier}"))
+
+    def assert_matches_scan(self, schema):
+        expected = [
+            r.inner
+            for key, r in self.cache.relations.items()
+            if (key.database, key.schema) == ("dbt", schema)
+        ]
+        self.assertEqual(self.cache.get_relations("dbt", schema.upper()), expected)
+
+    def _target(self, schema):
+        for identifier in range(20):
+            self.cache.add(make_relation("dbt", schema, f"new_{identifier}__tmp"))
+            self.cache.rename(
+                make_relation("dbt", schema, f"new_{identifier}__tmp"),
+                make_relation("dbt", schema, f"new_{identifier}"),
+            )
+            self.cache.drop(make_relation("dbt", schema, f"table_{identifier}"))
+        return schema, self.cache.get_relations("dbt", schema)
+
+    def test_threaded(self):
+        schemas = [f"schema_{schema}" for schema in range(30)]
+        pool = ThreadPool(8)
+        results = list(pool.imap_unordered(self._target, schemas))
+        pool.close()
+        pool.join()
+
+        for schema, relations in results:
+            self.assertEqual({r.identifier for r in relations}, {f"new_{i}" for i in range(20)})
+            self.assert_matches_scan(schema)
+
+    def test_rename_across_schemas(self):
+        self.cache.rename(
+            make_relation("dbt", "schema_0", "table_0"), make_relation("dbt", "schema_1", "moved")
+        )
+        self.assertEqual(len(self.cache.get_relations("dbt", "schema_0")), 19)
+        self.assertEqual(len(self.cache.get_relations("dbt", "schema_1")), 21)
+        self.assert_matches_scan("schema_0")
+        self.assert_matches_scan("schema_1")
+
+        self.cache.drop_schema("dbt", "schema_1")
+        self.assertEqual(self.cache.get_relations("dbt", "schema_1"), [])
+        self.assertEqual(len(self.cache.relations), 28 * 20 + 19)
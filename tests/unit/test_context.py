@@ -8,7 +8,7 @@ import pytest
 
 from dbt.adapters import postgres
 from dbt.adapters import factory
-from dbt.clients.jinja import MacroStack
+from dbt.clients.jinja import MacroStack, get_rendered
 from dbt.contracts.graph.nodes import (
     ModelNode,
     NodeConfig,
@@ -17,7 +17,9 @@ from dbt.contracts.graph.nodes import (
 )
 from dbt.config.project import VarProvider
 from dbt.context import base, providers, docs, manifest, macros
-from dbt.contracts.files import FileHash
+from dbt.constants import DEFAULT_ENV_PLACEHOLDER
+from dbt.contracts.files import FileHash, FilePath, SourceFile
+from dbt.contracts.graph.manifest import Manifest
 from dbt.events.functions import reset_metadata_vars
 from dbt.node_types import NodeType
 import dbt.exceptions
@@ -114,6 +116,40 @@ class TestVar(unittest.TestCase):
         self.assertEqual(var("foo", "bar"), "bar")
         self.assertEqual(var("foo"), None)
 
+    def test_parser_var_saved_for_partial_parsing(self):
+        self.config.cli_vars = {"foo": "baz"}
+        source_file = SourceFile(
+            path=FilePath(
+                searched_path="",
+                relative_path="model_one.sql",
+                project_root="/",
+                modification_time=0.0,
+            ),
+            checksum=FileHash.from_contents(""),
+            project_name="root",
+        )
+        manifest = Manifest(files={self.model.file_id: source_file})
+        var = providers.ParseVar(self.context, self.config, self.model, manifest)
+        self.assertEqual(var("foo"), "baz")
+        self.assertEqual(var("bar", "default"), "default")
+        self.assertEqual(source_file.vars, ["foo", "bar"])
+        self.assertEqual(
+            manifest.vars,
+            {
+                "foo": base.get_cli_var_checksum({"foo": "baz"}, "foo"),
+                "bar": DEFAULT_ENV_PLACEHOLDER,
+            },
+        )
+        self.assertEqual(manifest.state_check.vars, {})
+
+        # a hook isn't in a file that can be reparsed by itself
+        self.model.original_file_path = "dbt_project.yml"
+        var = providers.ParseVar(self.context, self.config, self.model, manifest)
+        var("foo")
+        self.assertEqual(
+            manifest.state_check.vars, {"foo": base.get_cli_var_checksum({"foo": "baz"}, "foo")}
+        )
+
 
 class TestParseWrapper(unittest.TestCase):
     def setUp(self):
@@ -454,14 +490,14 @@ def test_docs_runtime_context(config_postgres):
 
 def test_macro_namespace_duplicates(config_postgres, manifest_fx):
     mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
-    mn.add_macros(manifest_fx.macros.values(), {})
+    mn.add_macros(manifest_fx.macros.values())
 
     # same pkg, same name: error
     with pytest.raises(dbt.exceptions.CompilationError):
-        mn.add_macro(mock_macro("macro_a", "root"), {})
+        mn.add_macro(mock_macro("macro_a", "root"))
 
     # different pkg, same name: no error
-    mn.add_macros(mock_macro("macro_a", "dbt"), {})
+    mn.add_macros([mock_macro("macro_a", "dbt")])
 
 
 def test_macro_namespace(config_postgres, manifest_fx):
@@ -494,6 +530,94 @@ def test_macro_namespace(config_postgres, manifest_fx):
         assert result["some_macro"].macro is package_macro
 
 
+def test_macro_namespace_lazy_generators(config_postgres, manifest_fx):
+    mn = macros.MacroNamespaceBuilder("root", "search", MacroStack(), ["dbt_postgres", "dbt"])
+    dep_macro = mock_macro("dep_macro", "dep")
+    all_macros = itertools.chain(manifest_fx.macros.values(), [dep_macro])
+
+    namespace = mn.build_namespace(all_macros, {})
+    # nothing is bound to the context until it's accessed
+    assert namespace._generators == {}
+    assert "dep" in namespace
+    assert "dep_macro" in namespace["dep"]
+    assert namespace._generators == {}
+
+    macro_func = namespace["macro_a"]
+    assert macro_func.macro is manifest_fx.macros["macro.root.macro_a"]
+    # the same generator is shared between the flat and package namespaces
+    assert namespace["root"]["macro_a"] is macro_func
+    assert namespace.get_from_package("root", "macro_a") is macro_func
+    assert namespace.get_from_package("dep", "dep_macro").macro is dep_macro
+    assert set(namespace._generators) == {"macro.root.macro_a", "macro.dep.dep_macro"}
+
+
+def test_manifest_context_lazy_generators(config_postgres, manifest_fx):
+    # a root project macro with the same name as a context member overrides it
+    fromjson = mock_macro("fromjson", "root")
+    manifest_fx.macros[fromjson.unique_id] = fromjson
+    ctx = manifest.generate_query_header_context(config=config_postgres, manifest=manifest_fx)
+    namespace = ctx.lazy
+
+    # building the context doesn't bind any macros
+    assert namespace._generators == {}
+    assert "macro_a" in ctx
+    assert "fromjson" in ctx
+    assert namespace._generators == {}
+
+    # jinja finds the macros when a template uses them
+    assert get_rendered("{{ macro_a.macro.unique_id }}", ctx) == "macro.root.macro_a"
+    assert set(namespace._generators) == {"macro.root.macro_a"}
+    assert ctx["fromjson"].macro is fromjson
+    assert get_rendered("{{ fromjson.macro.unique_id }}", ctx) == "macro.root.fromjson"
+    assert ctx.get("macro_b").macro is manifest_fx.macros["macro.root.macro_b"]
+    assert ctx.get("not_a_macro") is None
+
+
+def test_manifest_context_macros_shadow_jinja_globals(config_postgres, manifest_fx):
+    for name in ["cycler", "range"]:
+        macro = mock_macro(name, "root")
+        macro.macro_sql = f"{{% macro {name}() %}}macro-{name}{{% endmacro %}}"
+        manifest_fx.macros[macro.unique_id] = macro
+    ctx = manifest.generate_query_header_context(config=config_postgres, manifest=manifest_fx)
+
+    # the project's macros take precedence over jinja's globals of the same name
+    assert get_rendered("{{ cycler() }} | {{ range() }}", ctx) == "macro-cycler | macro-range"
+    assert get_rendered("{{ range() }}", ctx, native=True) == "macro-range"
+    assert set(ctx.lazy._generators) == {"macro.root.cycler", "macro.root.range"}
+
+    # copies of the context have all of the macros
+    for copy in [dict(ctx), {**ctx}, ctx.copy(), dict(ctx.items())]:
+        assert copy["range"].macro.unique_id == "macro.root.range"
+        assert copy["macro_a"].macro.unique_id == "macro.root.macro_a"
+    assert {"cycler", "range", "macro_a", "macro_b", "context"} <= set(ctx.keys())
+    assert len(ctx) == len(set(ctx))
+
+
+def test_macro_namespace_layout_cache(config_postgres, manifest_fx):
+    layouts = {}
+    all_macros = list(manifest_fx.macros.values())
+
+    namespaces = []
+    for node_ctx in [{"name": "first"}, {"name": "second"}]:
+        mn = macros.MacroNamespaceBuilder("root", "root", MacroStack(), ["dbt_postgres", "dbt"])
+        namespaces.append(mn.build_namespace(all_macros, node_ctx, layouts=layouts))
+    assert len(layouts) == 1
+
+    # a different search package gets its own layout
+    mn = macros.MacroNamespaceBuilder("root", "dep", MacroStack(), ["dbt_postgres", "dbt"])
+    with mock.patch.object(mn, "build_layout", wraps=mn.build_layout) as build_layout:
+        mn.build_namespace(all_macros, {}, layouts=layouts)
+        mn.build_namespace(all_macros, {}, layouts=layouts)
+    assert build_layout.call_count == 1
+    assert len(layouts) == 2
+
+    # each namespace binds the macros to its own context
+    first, second = (namespace["macro_a"] for namespace in namespaces)
+    assert first.macro is second.macro
+    assert first.context == {"name": "first"}
+    assert second.context == {"name": "second"}
+
+
 def test_dbt_metadata_envs(
     monkeypatch, config_postgres, manifest_fx, get_adapter, get_include_paths
 ):
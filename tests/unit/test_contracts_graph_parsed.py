@@ -501,6 +501,7 @@ def basic_parsed_seed_dict():
         "config": {
             "column_types": {},
             "delimiter": ",",
+            "infer_types_from_all_rows": False,
             "enabled": True,
             "materialized": "seed",
             "persist_docs": {},
@@ -593,6 +594,7 @@ def complex_parsed_seed_dict():
         "config": {
             "column_types": {},
             "delimiter": ",",
+            "infer_types_from_all_rows": False,
             "enabled": True,
             "materialized": "seed",
             "persist_docs": {"relation": True, "columns": True},
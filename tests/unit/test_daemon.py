@@ -0,0 +1,195 @@
+import os
+import stat
+import warnings
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.cli.main import dbtRunnerResult
+from dbt.contracts.graph.manifest import Manifest
+from dbt.exceptions import DbtRuntimeError
+from dbt.task.daemon import DaemonServer, DaemonTask, FileChanges, FileWatcher, option_args
+
+
+def write(root, path, contents):
+    path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as fp:
+        fp.write(contents)
+
+
+@pytest.fixture
+def project_root(tmp_path):
+    write(tmp_path, "dbt_project.yml", "name: test")
+    write(tmp_path, "models/model_a.sql", "select 1")
+    write(tmp_path, "tests/generic/my_test.sql", "{% test my_test(model) %}{% endtest %}")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def task(project_root):
+    args = Namespace(
+        PROFILE=None,
+        PROFILES_DIR=project_root,
+        TARGET="dev",
+        TARGET_PATH=None,
+        VARS={},
+    )
+    config = Namespace(
+        project_root=project_root,
+        macro_paths=["macros"],
+        model_paths=["models"],
+        snapshot_paths=["snapshots"],
+        analysis_paths=["analyses"],
+        test_paths=["tests"],
+        generic_test_paths=["tests/generic"],
+        seed_paths=["seeds"],
+        docs_paths=["models"],
+        all_source_paths=["models", "macros", "tests"],
+        packages_install_path="dbt_packages",
+    )
+    return DaemonTask(args, config)
+
+
+def test_file_watcher(project_root):
+    watcher = FileWatcher(project_root, ["models", "dbt_project.yml"])
+    assert not watcher.poll()
+
+    write(project_root, "models/model_b.sql", "select 2")
+    write(project_root, "models/.model_b.sql.swp", "")
+    os.utime(os.path.join(project_root, "models/model_a.sql"), ns=(0, 0))
+    os.remove(os.path.join(project_root, "dbt_project.yml"))
+    assert watcher.poll() == FileChanges(
+        added=["models/model_b.sql"],
+        changed=["models/model_a.sql"],
+        deleted=["dbt_project.yml"],
+    )
+    assert not watcher.poll()
+
+
+def test_file_watcher_shallow_paths(project_root):
+    write(project_root, "dbt_packages/dbt_utils/macros/a.sql", "")
+    watcher = FileWatcher(project_root, [], shallow_paths=["dbt_packages"])
+    assert list(watcher.files) == ["dbt_packages/dbt_utils"]
+
+    # edits inside a package aren't picked up, installing it again is
+    write(project_root, "dbt_packages/dbt_utils/macros/a.sql", "select 1")
+    assert not watcher.poll()
+    os.utime(os.path.join(project_root, "dbt_packages/dbt_utils"), ns=(0, 0))
+    assert watcher.poll() == FileChanges(changed=["dbt_packages/dbt_utils"])
+
+
+def test_file_watcher_symlinks(project_root):
+    os.symlink(project_root, os.path.join(project_root, "models", "loop"))
+    watcher = FileWatcher(project_root, ["models"])
+    assert list(watcher.files) == ["models/model_a.sql"]
+
+
+def test_option_args():
+    assert option_args({"target": "dev", "profile": None, "vars": {"a": 1}}) == [
+        "--target",
+        "dev",
+        "--vars",
+        '{"a": 1}',
+    ]
+    assert option_args({"vars": {}}) == []
+
+
+def test_build_file_diff(task, project_root):
+    write(project_root, "models/model_b.sql", "select 2\n")
+    file_diff = task.build_file_diff(
+        FileChanges(added=["models/model_b.sql"], deleted=["models/model_a.sql"])
+    )
+    assert file_diff.deleted == ["models/model_a.sql"]
+    assert [(f.path, f.content) for f in file_diff.added] == [("models/model_b.sql", "select 2")]
+
+    # a FileDiff can't place files by anything but their top directory, or
+    # files outside the root project's source paths
+    for path in ["tests/generic/my_test.sql", "dbt_project.yml", "seeds/seed.csv"]:
+        assert task.build_file_diff(FileChanges(changed=[path])) is None
+
+
+def test_resolve_args(task):
+    command_args, parse_args = task.resolve_args(["run", "-s", "model_a", "--vars", "{a: 1}"])
+    assert command_args == [
+        "run",
+        "-s",
+        "model_a",
+        "--vars",
+        "{a: 1}",
+        "--profiles-dir",
+        task.options["profiles_dir"],
+        "--project-dir",
+        task.options["project_dir"],
+        "--target",
+        "dev",
+    ]
+    assert parse_args == ["parse", *option_args({**task.options, "vars": {"a": 1}})]
+
+    command_args, parse_args = task.resolve_args(["deps"])
+    assert parse_args is None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        command_args, parse_args = task.resolve_args(["--debug", "source", "freshness"])
+    assert command_args[:3] == ["--debug", "source", "freshness"]
+    assert parse_args is not None
+
+    for args in [
+        [],
+        ["--debug"],
+        ["source"],
+        ["docs", "serve"],
+        ["run", "--project-dir", "."],
+        ["nope"],
+    ]:
+        with pytest.raises(DbtRuntimeError):
+            task.resolve_args(args)
+
+
+def test_socket_permissions(task, tmp_path):
+    socket_path = str(tmp_path / "dbt.sock")
+    with DaemonServer(socket_path, task):
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+
+def test_refresh(task, project_root):
+    manifest = Manifest()
+    with mock.patch("dbt.cli.main.dbtRunner.invoke") as invoke:
+        invoke.return_value = dbtRunnerResult(success=True, result=manifest)
+        task.refresh()
+        assert invoke.call_args.args == (task.parse_args,)
+        assert task.manifest is manifest
+
+        invoke.reset_mock()
+        assert task.refresh() is None
+        invoke.assert_not_called()
+
+        write(project_root, "models/model_b.sql", "select 2")
+        task.refresh()
+        invoke.assert_called_once()
+
+        # a failed parse drops the manifest, so the next refresh parses again
+        invoke.return_value = dbtRunnerResult(success=False, exception=Exception("oops"))
+        task.refresh(task.parse_args + ["--target", "prod"])
+        assert task.manifest is None
+        invoke.reset_mock()
+        task.refresh()
+        invoke.assert_called_once()
+
+
+def test_config_cache(task, project_root):
+    def invoke(runner, args):
+        assert runner.context_obj["config_cache"] is task.config_cache
+        task.config_cache[("profile",)] = object()
+        return dbtRunnerResult(success=True)
+
+    with mock.patch("dbt.cli.main.dbtRunner.invoke", autospec=True, side_effect=invoke):
+        task.handle_request(["debug"], lambda message: None)
+        assert task.config_cache
+
+        # profiles and projects are loaded again once their files change
+        write(project_root, "profiles.yml", "test: {}")
+        task.runner()
+        assert not task.config_cache
@@ -0,0 +1,41 @@
+from argparse import Namespace
+from unittest import mock
+
+import agate
+import pytest
+
+from dbt.cli.main import dbtRunner, dbtRunnerResult
+from dbt.exceptions import DbtRuntimeError
+
+
+def test_stream_show():
+    node = Namespace(name="inline_query")
+    tables = [agate.Table([[1], [2]], ["n"]), agate.Table([[3]], ["n"])]
+    callback_errors = []
+
+    def invoke(runner, args, **kwargs):
+        assert args[:2] == ["show", "--stream"]
+        try:
+            for table in tables:
+                runner.context_obj["show_batch_callback"](node, table)
+        except DbtRuntimeError as exc:
+            callback_errors.append(exc)
+            return dbtRunnerResult(success=False, exception=exc)
+        return dbtRunnerResult(success=True)
+
+    with mock.patch.object(dbtRunner, "invoke", autospec=True, side_effect=invoke):
+        assert list(dbtRunner().stream_show(["--inline", "select 1"])) == [
+            (node, table) for table in tables
+        ]
+
+        # closing the stream early stops dbt at the next batch that doesn't fit
+        # in the queue
+        tables.append(agate.Table([[4]], ["n"]))
+        stream = dbtRunner().stream_show(["--inline", "select 1"])
+        assert next(stream) == (node, tables[0])
+        stream.close()
+        assert len(callback_errors) == 1
+
+    with mock.patch.object(dbtRunner, "invoke", return_value=dbtRunnerResult(success=False)):
+        with pytest.raises(DbtRuntimeError, match="dbt show failed"):
+            list(dbtRunner().stream_show(["--inline", "select 1"]))
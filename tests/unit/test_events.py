@@ -1,3 +1,4 @@
+import io
 import logging
 import re
 from argparse import Namespace
@@ -12,6 +13,7 @@ from dbt.events.base_types import (
     DebugLevel,
     DynamicLevel,
     ErrorLevel,
+    EventLevel,
     InfoLevel,
     TestLevel,
     WarnLevel,
@@ -20,6 +22,7 @@ from dbt.events.base_types import (
 from dbt.events.eventmgr import TestEventManager, EventManager
 from dbt.events.functions import msg_to_dict, msg_to_json, ctx_set_event_manager
 from dbt.events.helpers import get_json_string_utcnow
+from dbt.events.logger import LoggerConfig
 from dbt.events.types import RunResultError
 from dbt.flags import set_from_args
 from dbt.task.printer import print_run_result_error
@@ -546,3 +549,41 @@ def test_single_run_error():
         # attempt at unit testing events, and we need to think about how it
         # could be done in a thread safe way in the long run.
         ctx_set_event_manager(EventManager())
+
+
+class TestEventManagerFiltering:
+    def _event_manager(self, level):
+        event_manager = EventManager()
+        event_manager.add_logger(
+            LoggerConfig(name="test_filtering", level=level, output_stream=io.StringIO())
+        )
+        return event_manager
+
+    def test_filtered_event_is_not_built(self, mocker):
+        event_manager = self._event_manager(EventLevel.INFO)
+        build = mocker.patch("dbt.events.eventmgr.msg_from_base_event", wraps=msg_from_base_event)
+        event_manager.fire_event(types.SQLQuery(conn_name="master", sql="select 1", node_info={}))
+        event_manager.fire_event(types.Note(msg="a note"), level=EventLevel.DEBUG)
+        assert build.call_count == 0
+
+        event_manager.fire_event(types.Note(msg="a note"), level=EventLevel.INFO)
+        assert build.call_count == 1
+
+    def test_callbacks_get_filtered_events(self):
+        event_manager = self._event_manager(EventLevel.ERROR)
+        received = []
+        event_manager.callbacks.append(received.append)
+        event_manager.fire_event(types.SQLQuery(conn_name="master", sql="select 1", node_info={}))
+        assert [msg.info.name for msg in received] == ["SQLQuery"]
+        assert received[0].info.level == "debug"
+
+    def test_logger_level(self):
+        stream = io.StringIO()
+        event_manager = EventManager()
+        event_manager.add_logger(
+            LoggerConfig(name="test_logger_level", level=EventLevel.WARN, output_stream=stream)
+        )
+        event_manager.fire_event(types.Note(msg="not written"), level=EventLevel.INFO)
+        event_manager.fire_event(types.Note(msg="written"), level=EventLevel.WARN)
+        assert "not written" not in stream.getvalue()
+        assert "written" in stream.getvalue()
@@ -1,4 +1,5 @@
 import os
+import time
 
 from argparse import Namespace
 import unittest
@@ -28,9 +29,13 @@ except ImportError:
 from .utils import config_from_parts_or_dicts, generate_name_macros, inject_plugin
 
 
+def _hung_parse_worker(project_name, file_ids):
+    time.sleep(60)
+
+
 class GraphTest(unittest.TestCase):
     def tearDown(self):
-        self.mock_filesystem_search.stop()
+        self.filesystem_search.stop()
         self.mock_hook_constructor.stop()
         self.load_state_check.stop()
         self.load_source_file_patcher.stop()
@@ -63,7 +68,9 @@ class GraphTest(unittest.TestCase):
         # Create file filesystem searcher
         self.filesystem_search = patch("dbt.parser.read_files.filesystem_search")
 
-        def mock_filesystem_search(project, relative_dirs, extension, ignore_spec):
+        def mock_filesystem_search(
+            project, relative_dirs, extension, ignore_spec, walked_files=None
+        ):
             if "sql" not in extension:
                 return []
             if "models" not in relative_dirs:
@@ -367,3 +374,111 @@ class GraphTest(unittest.TestCase):
         manifest.metadata.dbt_version = "99999.99.99"
         is_partial_parsable, _ = loader.is_partial_parsable(manifest)
         self.assertFalse(is_partial_parsable)
+
+    def _load_manifest_with_workers(self, models, parse_workers):
+        self.mock_models = []
+        self.use_models(models)
+        config = self.get_config()
+        object.__setattr__(dbt.flags.get_flags(), "PARSE_WORKERS", parse_workers)
+        # the static parser's threads have already been started by other
+        # tests, so it can't be used in forked workers here
+        object.__setattr__(dbt.flags.get_flags(), "STATIC_PARSER", False)
+        # there's no dbt_project.yml to load hooks from
+        with patch("dbt.parser.manifest.process_is_single_threaded", return_value=True), patch(
+            "dbt.parser.manifest.load_source_file", return_value=None
+        ), patch.object(
+            dbt.parser.manifest.ManifestLoader,
+            "parse_model_files_in_workers",
+            autospec=True,
+            side_effect=dbt.parser.manifest.ManifestLoader.parse_model_files_in_workers,
+        ) as parse_in_workers:
+            manifest = self.load_manifest(config)
+        self.assertEqual(parse_in_workers.called, parse_workers > 1)
+        return manifest
+
+    def test__parse_in_workers(self):
+        models = {f"model_{i}": f"select {i} as id" for i in range(10)}
+        models[
+            "model_config"
+        ] = "{{ config(materialized='table') }} select * from {{ ref('model_1') }}"
+        models["model_disabled"] = "{{ config(enabled=false) }} select 1 as id"
+        models["model_env_var"] = "select '{{ env_var('DBT_TEST_PARSE_WORKERS') }}' as id"
+
+        with patch.dict(os.environ, {"DBT_TEST_PARSE_WORKERS": "value"}):
+            serial = self._load_manifest_with_workers(models, 1)
+            parallel = self._load_manifest_with_workers(models, 3)
+
+        def without_created_at(node):
+            dct = node.to_dict()
+            del dct["created_at"]
+            return dct
+
+        self.assertEqual(list(parallel.nodes), list(serial.nodes))
+        for unique_id, node in serial.nodes.items():
+            self.assertEqual(
+                without_created_at(parallel.nodes[unique_id]), without_created_at(node)
+            )
+        self.assertEqual(list(parallel.disabled), ["model.test_models_compile.model_disabled"])
+        self.assertEqual(
+            [
+                without_created_at(n)
+                for n in parallel.disabled["model.test_models_compile.model_disabled"]
+            ],
+            [
+                without_created_at(n)
+                for n in serial.disabled["model.test_models_compile.model_disabled"]
+            ],
+        )
+        self.assertEqual(parallel.env_vars, {"DBT_TEST_PARSE_WORKERS": "value"})
+        self.assertEqual(parallel.env_vars, serial.env_vars)
+        for file_id, source_file in serial.files.items():
+            self.assertEqual(parallel.files[file_id].nodes, source_file.nodes)
+            self.assertEqual(parallel.files[file_id].env_vars, source_file.env_vars)
+
+    def test__parse_in_workers_error(self):
+        models = {f"model_{i}": f"select {i} as id" for i in range(10)}
+        models["model_bad"] = "select * from {{ ref( }}"
+
+        with self.assertRaises(dbt.exceptions.CompilationError) as serial_exc:
+            self._load_manifest_with_workers(models, 1)
+        with self.assertRaises(dbt.exceptions.CompilationError) as parallel_exc:
+            self._load_manifest_with_workers(models, 3)
+        self.assertEqual(str(parallel_exc.exception), str(serial_exc.exception))
+
+    def test__parse_in_workers_native_threads(self):
+        self.use_models({f"model_{i}": f"select {i} as id" for i in range(10)})
+        config = self.get_config()
+        object.__setattr__(dbt.flags.get_flags(), "PARSE_WORKERS", 3)
+        with patch(
+            "dbt.parser.manifest.process_is_single_threaded", return_value=False
+        ), patch.object(
+            dbt.parser.manifest.ManifestLoader, "parse_model_files_in_workers"
+        ) as parse_in_workers:
+            manifest = self.load_manifest(config)
+        parse_in_workers.assert_not_called()
+        self.assertEqual(len(manifest.nodes), 10)
+
+    def test__process_is_single_threaded(self):
+        with patch("os.listdir", return_value=["1"]):
+            self.assertTrue(dbt.parser.manifest.process_is_single_threaded())
+            # e.g. dbtRunner.stream_show running dbt on a background thread
+            with patch("threading.active_count", return_value=2):
+                self.assertFalse(dbt.parser.manifest.process_is_single_threaded())
+        # a native thread, which only shows up in /proc
+        with patch("os.listdir", return_value=["1", "2"]):
+            self.assertFalse(dbt.parser.manifest.process_is_single_threaded())
+        # no /proc, e.g. on macOS
+        with patch("os.listdir", side_effect=FileNotFoundError):
+            self.assertFalse(dbt.parser.manifest.process_is_single_threaded())
+
+    def test__parse_in_workers_timeout(self):
+        models = {f"model_{i}": f"select {i} as id" for i in range(10)}
+        serial = self._load_manifest_with_workers(models, 1)
+        # workers that never answer are stopped, and the files parsed serially
+        start = time.time()
+        with patch("dbt.parser.manifest.PARSE_WORKER_TIMEOUT", 0.5), patch(
+            "dbt.parser.manifest.parse_model_files_in_worker", _hung_parse_worker
+        ):
+            parallel = self._load_manifest_with_workers(models, 3)
+        self.assertLess(time.time() - start, 30)
+        self.assertEqual(list(parallel.nodes), list(serial.nodes))
@@ -2,7 +2,10 @@ from unittest import mock
 
 import pytest
 
+import random
 import string
+from itertools import product
+
 import dbt.exceptions
 import dbt.graph.selector as graph_selector
 import dbt.graph.cli as graph_cli
@@ -216,3 +219,88 @@ invalid_specs = [
 def test_invalid_specs(invalid):
     with pytest.raises(dbt.exceptions.DbtRuntimeError):
         graph_selector.SelectionCriteria.from_single_spec(invalid)
+
+
+def _get_subset_graph_by_splicing(graph, selected):
+    """The original Graph.get_subset_graph, which removes the unselected nodes
+    one at a time, to check the single pass implementation against.
+    """
+    new_graph = graph.copy()
+    include_nodes = set(selected)
+    still_removing = True
+    while still_removing:
+        nodes_to_remove = list(
+            node
+            for node in new_graph
+            if node not in include_nodes
+            and (new_graph.in_degree(node) * new_graph.out_degree(node)) == 0
+        )
+        if len(nodes_to_remove) == 0:
+            still_removing = False
+        else:
+            new_graph.remove_nodes_from(nodes_to_remove)
+    remaining_nodes = list(new_graph.nodes())
+    remaining_nodes.sort(key=lambda node: new_graph.in_degree(node) * new_graph.out_degree(node))
+    for node in remaining_nodes:
+        if node not in include_nodes:
+            source_nodes = [x for x, _ in new_graph.in_edges(node)]
+            target_nodes = [x for _, x in new_graph.out_edges(node)]
+            new_graph.add_edges_from(
+                (source, target)
+                for source, target in product(source_nodes, target_nodes)
+                if source != target and not new_graph.has_edge(source, target)
+            )
+            new_graph.remove_node(node)
+    return new_graph
+
+
+def _wide_graph(width=200):
+    # one root fanning out to many models, each with one child
+    graph = nx.DiGraph()
+    for i in range(width):
+        graph.add_edge("m.root", f"m.wide_{i}")
+        graph.add_edge(f"m.wide_{i}", f"m.leaf_{i}")
+    return graph
+
+
+def _deep_graph(depth=200):
+    # a long chain, with a second edge skipping ahead every few models
+    graph = nx.DiGraph()
+    for i in range(depth - 1):
+        graph.add_edge(f"m.deep_{i}", f"m.deep_{i + 1}")
+        if i % 5 == 0 and i + 3 < depth:
+            graph.add_edge(f"m.deep_{i}", f"m.deep_{i + 3}")
+    return graph
+
+
+def _diamond_graph(diamonds=60, width=3):
+    # diamonds in series: each join node fans out and back in again
+    graph = nx.DiGraph()
+    for i in range(diamonds):
+        for j in range(width):
+            graph.add_edge(f"m.join_{i}", f"m.side_{i}_{j}")
+            graph.add_edge(f"m.side_{i}_{j}", f"m.join_{i + 1}")
+    return graph
+
+
+@pytest.mark.parametrize("make_graph", [_wide_graph, _deep_graph, _diamond_graph])
+@pytest.mark.parametrize("fraction", [0.0, 0.01, 0.1, 0.5, 1.0])
+def test_get_subset_graph_matches_splicing(make_graph, fraction):
+    graph = make_graph()
+    # tests edges carry an edge_type, which must be kept between selected nodes
+    for node in list(graph)[::7]:
+        graph.add_edge(f"t.{node}", node, edge_type="parent_test")
+    rng = random.Random(f"{make_graph.__name__}-{fraction}")
+    nodes = sorted(graph)
+    for _ in range(5):
+        selected = set(rng.sample(nodes, int(len(nodes) * fraction)))
+        expected = _get_subset_graph_by_splicing(graph, selected)
+        subset = graph_selector.Graph(graph).get_subset_graph(selected).graph
+        assert set(subset) == selected
+        assert set(subset.edges(data="edge_type")) == set(expected.edges(data="edge_type"))
+
+
+def test_get_subset_graph_missing_node():
+    graph = _get_graph()
+    with pytest.raises(ValueError):
+        graph.get_subset_graph({"m.X.a", "m.X.missing"})
@@ -1,12 +1,18 @@
 from contextlib import contextmanager
+from copy import deepcopy
+from unittest import mock
+import os
 import pytest
+import tempfile
 import unittest
 import yaml
 
+from dbt.clients.jinja import get_environment
 from dbt.clients.jinja import get_rendered
 from dbt.clients.jinja import get_template
 from dbt.clients.jinja import extract_toplevel_blocks
-from dbt.exceptions import CompilationError, JinjaRenderingError
+from dbt.clients.jinja import set_bytecode_cache_dir
+from dbt.exceptions import CompilationError, JinjaRenderingError, UndefinedCompilationError
 
 
 @contextmanager
@@ -417,6 +423,97 @@ class TestJinja(unittest.TestCase):
         assert value == "1991"
 
 
+class TestEnvironmentCache(unittest.TestCase):
+    def test_environments_are_shared(self):
+        node = mock.MagicMock()
+        env = get_environment()
+        self.assertIs(env, get_environment())
+        self.assertIs(env, get_environment(node))
+        self.assertIsNot(env, get_environment(native=True))
+        self.assertIsNot(env, get_environment(capture_macros=True))
+        self.assertIs(
+            get_environment(node, capture_macros=True, native=True),
+            get_environment(None, capture_macros=True, native=True),
+        )
+
+    def test_compiled_code_is_shared(self):
+        source = "{{ a_value ~ '_compiled_code_is_shared' }}"
+        env = get_environment()
+        with mock.patch.object(env, "compile", wraps=env.compile) as compile:
+            first = get_template(source, {"a_value": "first"})
+            second = get_template(source, {"a_value": "second"})
+        self.assertEqual(compile.call_count, 1)
+        self.assertEqual(first.render(), "first_compiled_code_is_shared")
+        self.assertEqual(second.render(), "second_compiled_code_is_shared")
+
+    def test_capture_macros_undefined_node(self):
+        first_node = mock.MagicMock()
+        second_node = mock.MagicMock()
+        ctx = {}
+        source = "{% do captured.append(some_missing_macro.attr) %}"
+        for node in (first_node, second_node):
+            ctx["captured"] = []
+            get_rendered(source, ctx, node, capture_macros=True)
+            (undefined,) = ctx["captured"]
+            self.assertIs(undefined.node, node)
+            with self.assertRaises(UndefinedCompilationError):
+                deepcopy(undefined)
+
+
+class TestBytecodeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmpdir.name, "jinja_cache")
+        set_bytecode_cache_dir(self.cache_dir)
+        self.env = get_environment()
+
+    def tearDown(self):
+        set_bytecode_cache_dir(None)
+        self.tmpdir.cleanup()
+
+    def compile_count(self, source):
+        # drop the in-memory code, like a new invocation would
+        self.env._code_cache.clear()
+        with mock.patch.object(self.env, "compile", wraps=self.env.compile) as compile:
+            self.assertEqual(get_template(source, {"a": "x"}).render(), "x_cached")
+        return compile.call_count
+
+    def test_cache_is_written_and_reused(self):
+        source = "{{ a ~ '_cached' }}"
+        self.assertEqual(self.compile_count(source), 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(self.compile_count(source), 0)
+
+    def test_changed_source_is_recompiled(self):
+        self.assertEqual(self.compile_count("{{ a ~ '_cached' }}"), 1)
+        self.assertEqual(self.compile_count("{{ a ~ '_' ~ 'cached' }}"), 1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_changed_dbt_version_is_recompiled(self):
+        source = "{{ a ~ '_cached' }}"
+        self.assertEqual(self.compile_count(source), 1)
+        prefix = self.env._bytecode_cache_prefix.replace("|", "-other|", 1)
+        with mock.patch.object(self.env, "_bytecode_cache_prefix", prefix):
+            self.assertEqual(self.compile_count(source), 1)
+
+    def test_environments_are_not_shared(self):
+        source = "{{ a ~ '_cached' }}"
+        self.assertEqual(self.compile_count(source), 1)
+        native_env = get_environment(native=True)
+        native_env._code_cache.clear()
+        with mock.patch.object(native_env, "compile", wraps=native_env.compile) as compile:
+            get_template(source, {"a": "x"}, native=True)
+        self.assertEqual(compile.call_count, 1)
+
+    def test_disabled(self):
+        set_bytecode_cache_dir(None)
+        self.assertIsNone(self.env.bytecode_cache)
+        source = "{{ a ~ '_cached' }}"
+        self.assertEqual(self.compile_count(source), 1)
+        self.assertEqual(self.compile_count(source), 1)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+
 class TestBlockLexer(unittest.TestCase):
     def test_basic(self):
         body = '{{ config(foo="bar") }}\r\nselect * from this.that\r\n'
@@ -1,8 +1,11 @@
 import os
+import random
 import tempfile
 import unittest
 from unittest import mock
 
+import networkx as nx
+
 from dbt import compilation
 
 try:
@@ -12,6 +15,7 @@ except ImportError:
 
 from dbt.graph.selector import NodeSelector
 from dbt.graph.cli import parse_difference
+from dbt.node_types import NodeType
 
 
 def _mock_manifest(nodes):
@@ -67,7 +71,7 @@ class LinkerTest(unittest.TestCase):
         """test join() without timeout risk"""
         self.assertEqual(queue.inner.unfinished_tasks, 0)
 
-    def _get_graph_queue(self, manifest, include=None, exclude=None):
+    def _get_graph_queue(self, manifest, include=None, exclude=None, execution_times=None):
         graph = compilation.Graph(self.linker.graph)
         selector = NodeSelector(graph, manifest)
         # TODO:  The "eager" string below needs to be replaced with programatic access
@@ -76,7 +80,7 @@ class LinkerTest(unittest.TestCase):
         #
         # Doing that is actually a little tricky, so I'm punting it to a new ticket GH #6397
         spec = parse_difference(include, exclude, "eager")
-        return selector.get_graph_queue(spec)
+        return selector.get_graph_queue(spec, execution_times)
 
     def test_linker_add_dependency(self):
         actual_deps = [("A", "B"), ("A", "C"), ("B", "C")]
@@ -174,6 +178,44 @@ class LinkerTest(unittest.TestCase):
         queue_2.mark_done("A")
         self.assert_would_join(queue_2)
 
+    def test_linker_critical_path_scheduling(self):
+        actual_deps = [("A", "B"), ("B", "C")]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node("Z")
+
+        # by depth, C and Z are tied and C comes first
+        queue = self._get_graph_queue(_mock_manifest("ABCZ"))
+        self.assertEqual(queue.get(block=False).unique_id, "C")
+
+        # Z takes longer than the whole A-B-C chain
+        execution_times = {"A": 1.0, "B": 1.0, "C": 1.0, "Z": 10.0}
+        queue = self._get_graph_queue(_mock_manifest("ABCZ"), execution_times=execution_times)
+        self.assertEqual(queue._scores, {"A": -1.0, "B": -2.0, "C": -3.0, "Z": -10.0})
+        first = queue.get(block=False)
+        self.assertEqual(first.unique_id, "Z")
+        second = queue.get(block=False)
+        self.assertEqual(second.unique_id, "C")
+        queue.mark_done("Z")
+        queue.mark_done("C")
+        self.assertEqual(queue.get(block=False).unique_id, "B")
+
+    def test_linker_critical_path_unknown_execution_times(self):
+        actual_deps = [("A", "B"), ("B", "C")]
+
+        for (l, r) in actual_deps:
+            self.linker.dependency(l, r)
+        self.linker.add_node("Z")
+
+        # nodes without a previous run take the average time
+        queue = self._get_graph_queue(_mock_manifest("ABCZ"), execution_times={"Z": 4.0})
+        self.assertEqual(queue._scores, {"A": -4.0, "B": -8.0, "C": -12.0, "Z": -4.0})
+
+        # without any previous run, the longest chain of nodes goes first
+        queue = self._get_graph_queue(_mock_manifest("ABCZ"), execution_times={})
+        self.assertEqual(queue._scores, {"A": -1.0, "B": -2.0, "C": -3.0, "Z": -1.0})
+
     def test__find_cycles__cycles(self):
         actual_deps = [("A", "B"), ("B", "C"), ("C", "A")]
 
@@ -189,3 +231,104 @@ class LinkerTest(unittest.TestCase):
             self.linker.dependency(l, r)
 
         self.assertIsNone(self.linker.find_cycles())
+
+
+def _add_test_edges_by_traversal(graph, manifest):
+    """The original add_test_edges, which walks the upstream nodes of every
+    node, to check the bitset implementation against.
+    """
+    for node_id in graph:
+        if node_id in manifest.nodes and manifest.nodes[node_id].resource_type != NodeType.Test:
+            all_upstream_nodes = nx.traversal.bfs_tree(graph, node_id, reverse=True)
+            upstream_nodes = set([n for n in all_upstream_nodes if n != node_id])
+            upstream_tests = []
+            for upstream_node in upstream_nodes:
+                upstream_tests += compilation._get_tests_for_node(manifest, upstream_node)
+            for upstream_test in upstream_tests:
+                test_depends_on = set(manifest.nodes[upstream_test].depends_on_nodes)
+                if test_depends_on.issubset(upstream_nodes):
+                    graph.add_edge(upstream_test, node_id, edge_type="parent_test")
+
+
+def _random_project(rng, num_models):
+    sources = [f"source.pkg.src.t{i}" for i in range(rng.randint(0, 3))]
+    nodes = {}
+    for i in range(num_models):
+        upstream = sources + list(nodes)
+        depends_on = rng.sample(upstream, rng.randint(0, min(3, len(upstream))))
+        nodes[f"model.pkg.m{i}"] = mock.MagicMock(
+            resource_type=NodeType.Model, depends_on_nodes=depends_on
+        )
+    tested = sources + list(nodes)
+    for i in range(rng.randint(0, 2 * num_models)):
+        # mostly single-node tests, with some relationship tests
+        depends_on = rng.sample(tested, min(rng.choice([1, 1, 1, 2, 2, 3]), len(tested)))
+        nodes[f"test.pkg.t{i}"] = mock.MagicMock(
+            resource_type=NodeType.Test, depends_on_nodes=depends_on
+        )
+
+    graph = nx.DiGraph()
+    graph.add_nodes_from(sources)
+    child_map = {unique_id: [] for unique_id in sources}
+    for unique_id, node in nodes.items():
+        graph.add_node(unique_id)
+        child_map.setdefault(unique_id, [])
+        for parent in node.depends_on_nodes:
+            graph.add_edge(parent, unique_id)
+            child_map[parent].append(unique_id)
+    return graph, mock.MagicMock(nodes=nodes, child_map=child_map)
+
+
+class AddTestEdgesTest(unittest.TestCase):
+    def assert_same_test_edges(self, graph, manifest):
+        expected = graph.copy()
+        _add_test_edges_by_traversal(expected, manifest)
+        linker = compilation.Linker()
+        linker.graph = graph.copy()
+        linker.add_test_edges(manifest)
+        self.assertEqual(
+            set(linker.graph.edges(data="edge_type")), set(expected.edges(data="edge_type"))
+        )
+
+    def test_add_test_edges(self):
+        # model1 --> model2 --> model3, with test1 on model1 and test2 on model2
+        graph, manifest = nx.DiGraph(), mock.MagicMock()
+        manifest.nodes = {
+            "model.pkg.model1": mock.MagicMock(resource_type=NodeType.Model, depends_on_nodes=[]),
+            "model.pkg.model2": mock.MagicMock(
+                resource_type=NodeType.Model, depends_on_nodes=["model.pkg.model1"]
+            ),
+            "model.pkg.model3": mock.MagicMock(
+                resource_type=NodeType.Model, depends_on_nodes=["model.pkg.model2"]
+            ),
+            "test.pkg.test1": mock.MagicMock(
+                resource_type=NodeType.Test, depends_on_nodes=["model.pkg.model1"]
+            ),
+            "test.pkg.test2": mock.MagicMock(
+                resource_type=NodeType.Test, depends_on_nodes=["model.pkg.model2"]
+            ),
+        }
+        manifest.child_map = {unique_id: [] for unique_id in manifest.nodes}
+        for unique_id, node in manifest.nodes.items():
+            for parent in node.depends_on_nodes:
+                graph.add_edge(parent, unique_id)
+                manifest.child_map[parent].append(unique_id)
+
+        linker = compilation.Linker()
+        linker.graph = graph
+        linker.add_test_edges(manifest)
+        self.assertEqual(
+            {(u, v) for u, v, t in graph.edges(data="edge_type") if t == "parent_test"},
+            {
+                ("test.pkg.test1", "model.pkg.model2"),
+                ("test.pkg.test1", "model.pkg.model3"),
+                ("test.pkg.test2", "model.pkg.model3"),
+            },
+        )
+
+    def test_add_test_edges_matches_traversal(self):
+        rng = random.Random(8675309)
+        for num_models in [0, 1, 2, 5, 10, 30, 60]:
+            for _ in range(20):
+                graph, manifest = _random_project(rng, num_models)
+                self.assert_same_test_edges(graph, manifest)
@@ -1,4 +1,6 @@
+import json
 import os
+import pickle
 import unittest
 from argparse import Namespace
 from collections import namedtuple
@@ -14,6 +16,7 @@ import dbt.flags
 import dbt.version
 from dbt import tracking
 from dbt.adapters.base.plugin import AdapterPlugin
+from dbt.context.base import BaseContext
 from dbt.contracts.files import FileHash
 from dbt.contracts.graph.manifest import Manifest, ManifestMetadata
 from dbt.contracts.graph.nodes import (
@@ -676,6 +679,101 @@ class ManifestTest(unittest.TestCase):
         copy = original.deepcopy()
         self.assertEqual(original.flat_graph, copy.flat_graph)
 
+    def test_deepcopy_copies_on_write(self):
+        nodes = deepcopy(self.nested_nodes)
+        original = make_manifest(nodes=list(nodes.values()))
+        original.build_flat_graph()
+        copy = original.deepcopy()
+
+        # nothing is copied until it's written
+        for unique_id, node in original.nodes.items():
+            self.assertIs(copy.nodes[unique_id], node)
+
+        events = copy.writable_node(copy.nodes["model.root.events"])
+        self.assertIsNot(events, original.nodes["model.root.events"])
+        self.assertIs(copy.nodes["model.root.events"], events)
+        # the same node is returned from then on, even for the shared one
+        self.assertIs(copy.writable_node(original.nodes["model.root.events"]), events)
+        events.compiled = True
+        events.compiled_code = "select 1"
+        self.assertIsNone(original.nodes["model.root.events"].compiled_code)
+        self.assertEqual(
+            copy.flat_graph["nodes"]["model.root.events"]["compiled_code"], "select 1"
+        )
+        self.assertNotIn("compiled_code", original.flat_graph["nodes"]["model.root.events"])
+        self.assertIs(copy.nodes["model.root.dep"], original.nodes["model.root.dep"])
+
+        # containers aren't shared
+        del copy.nodes["model.root.dep"]
+        self.assertIn("model.root.dep", original.nodes)
+
+        # manifests that aren't copies are changed in place
+        self.assertIs(
+            original.writable_node(original.nodes["model.root.dep"]),
+            original.nodes["model.root.dep"],
+        )
+
+    def test_flat_graph_is_lazy(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = make_manifest(nodes=list(nodes.values()))
+        with mock.patch.object(
+            ModelNode, "to_dict", autospec=True, side_effect=ModelNode.to_dict
+        ) as to_dict:
+            manifest.build_flat_graph()
+            flat_nodes = manifest.flat_graph["nodes"]
+            self.assertEqual(set(flat_nodes), set(nodes))
+            self.assertEqual(to_dict.call_count, 0)
+
+            flat_node = flat_nodes["model.root.events"]
+            self.assertEqual(to_dict.call_count, 1)
+            self.assertIs(flat_nodes["model.root.events"], flat_node)
+            self.assertEqual(to_dict.call_count, 1)
+
+            # patching in place needs an invalidation
+            manifest.nodes["model.root.events"].description = "patched"
+            self.assertEqual(flat_nodes["model.root.events"]["description"], "")
+            manifest.invalidate_flat_graph_entry("model.root.events")
+            self.assertEqual(flat_nodes["model.root.events"]["description"], "patched")
+
+            # replacing the node does not
+            manifest.nodes["model.root.events"] = nodes["model.root.events"].replace(alias="other")
+            self.assertEqual(flat_nodes["model.root.events"]["alias"], "other")
+            self.assertEqual(to_dict.call_count, 3)
+
+    def test_flat_graph_serializes_as_dicts(self):
+        nodes = deepcopy(self.nested_nodes)
+        manifest = make_manifest(nodes=list(nodes.values()))
+        manifest.build_flat_graph()
+        flat_nodes = manifest.flat_graph["nodes"]
+        expected = {unique_id: node.to_dict(omit_none=False) for unique_id, node in nodes.items()}
+
+        self.assertIsInstance(flat_nodes, dict)
+        self.assertEqual(json.loads(json.dumps(flat_nodes)), json.loads(json.dumps(expected)))
+        self.assertEqual(
+            json.loads(BaseContext.tojson(flat_nodes)), json.loads(json.dumps(expected))
+        )
+        self.assertEqual(
+            set(json.loads(json.dumps(manifest.flat_graph))), set(manifest.flat_graph)
+        )
+        self.assertEqual(dict(flat_nodes), expected)
+        self.assertEqual({**flat_nodes}, expected)
+        self.assertEqual(flat_nodes.copy(), expected)
+        self.assertEqual(flat_nodes.get("model.root.events"), expected["model.root.events"])
+        self.assertIsNone(flat_nodes.get("model.root.nope"))
+        with self.assertRaises(TypeError):
+            flat_nodes["model.root.nope"] = {}
+
+        # an empty section is still an empty dict
+        self.assertEqual(json.dumps(manifest.flat_graph["exposures"]), "{}")
+
+        # still lazy once copied or pickled
+        unpickled = pickle.loads(pickle.dumps(manifest.flat_graph))
+        self.assertEqual(unpickled["nodes"], flat_nodes)
+        self.assertEqual(deepcopy(manifest.flat_graph)["nodes"], flat_nodes)
+
+        data = manifest.to_msgpack()
+        self.assertEqual(Manifest.from_msgpack(data).flat_graph["nodes"], expected)
+
 
 class MixedManifestTest(unittest.TestCase):
     def setUp(self):
@@ -1237,6 +1335,74 @@ def test_find_generate_macros_by_name(macros, expectations):
             assert result.package_name == expected
 
 
+def test_macro_lookup_maintained_by_add_and_remove():
+    manifest = make_manifest(macros=[MockMacro("dep")])
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "dep"
+
+    # once the lookup exists, add_macro and remove_macro keep it up to date
+    source_file = mock.MagicMock(macros=[])
+    manifest.add_macro(source_file, MockMacro("root"))
+    assert source_file.macros == ["macro.root.my_macro"]
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "root"
+
+    manifest.remove_macro("macro.root.my_macro")
+    assert "macro.root.my_macro" not in manifest.macros
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "dep"
+
+    manifest.remove_macro("macro.dep.my_macro")
+    assert manifest.find_macro_by_name("my_macro", "root", None) is None
+
+
+def test_macro_lookup_changes_reset_namespace_layouts():
+    manifest = make_manifest(macros=[MockMacro("dep")])
+    manifest.macro_lookup.namespace_layouts["key"] = "layout"
+
+    manifest.add_macro(mock.MagicMock(macros=[]), MockMacro("root"))
+    assert manifest.macro_lookup.namespace_layouts == {}
+
+    manifest.macro_lookup.namespace_layouts["key"] = "layout"
+    manifest.remove_macro("macro.root.my_macro")
+    assert manifest.macro_lookup.namespace_layouts == {}
+
+
+class NoScanDict(dict):
+    """A dict that can't be iterated once 'locked', to verify that lookups
+    don't scan every macro in the manifest.
+    """
+
+    locked = False
+
+    def _check(self):
+        assert not self.locked, "macros were scanned during lookup"
+
+    def values(self):
+        self._check()
+        return super().values()
+
+    def items(self):
+        self._check()
+        return super().items()
+
+    def __iter__(self):
+        self._check()
+        return super().__iter__()
+
+
+@pytest.mark.parametrize("macro_count", [10, 1000, 10000])
+def test_find_macro_by_name_does_not_scan_all_macros(macro_count):
+    macros = [MockMacro("dep", name=f"other_macro_{idx}") for idx in range(macro_count)]
+    macros.extend([MockMacro("root"), MockMacro("dep"), MockMacro("dbt")])
+    manifest = make_manifest(macros=macros)
+    manifest.macros = NoScanDict(manifest.macros)
+    # building the lookup is the only full scan
+    assert manifest.find_macro_by_name("my_macro", "root", None).package_name == "root"
+
+    manifest.macros.locked = True
+    assert manifest.find_macro_by_name("my_macro", "root", "dep").package_name == "dep"
+    assert manifest.find_macro_by_name("other_macro_1", "root", None).package_name == "dep"
+    assert manifest.find_macro_by_name("missing_macro", "root", None) is None
+
+
 FindMaterializationSpec = namedtuple("FindMaterializationSpec", "macros,adapter_type,expected")
 
 
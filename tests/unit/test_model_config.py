@@ -1,7 +1,16 @@
+import copy
 from dataclasses import dataclass, field
-from dbt.dataclass_schema import dbtClassMixin
+from unittest import mock
+
+from dbt import dataclass_schema
+from dbt.dataclass_schema import dbtClassMixin, ValidationError
 from typing import List, Dict
-from dbt.contracts.graph.model_config import MergeBehavior, ShowBehavior, CompareBehavior
+from dbt.contracts.graph.model_config import (
+    MergeBehavior,
+    ShowBehavior,
+    CompareBehavior,
+    NodeConfig,
+)
 
 
 @dataclass
@@ -89,3 +98,41 @@ def test_compare_behavior_from_field():
     assert CompareBehavior.from_field(fields["default_behavior"]) == CompareBehavior.Include
     assert CompareBehavior.from_field(fields["included"]) == CompareBehavior.Include
     assert CompareBehavior.from_field(fields["excluded"]) == CompareBehavior.Exclude
+
+
+def _node_config_validation_error(data):
+    try:
+        NodeConfig.validate(data)
+    except ValidationError as exc:
+        return exc.message
+    return None
+
+
+def test_validator_is_cached():
+    assert dataclass_schema._get_validator(NodeConfig) is dataclass_schema._get_validator(
+        NodeConfig
+    )
+
+
+def test_fast_validator_keeps_errors_and_data():
+    # fastjsonschema is in dev-requirements.txt, so the compiled path always runs here
+    assert dataclass_schema.fastjsonschema is not None
+    good = {"enabled": True, "materialized": "view", "tags": ["a"], "meta": {"x": 1}}
+    bad = {"enabled": "yes", "materialized": "view"}
+
+    with mock.patch.object(dataclass_schema, "fastjsonschema", None):
+        slow_error = _node_config_validation_error(bad)
+    assert slow_error is not None
+
+    with mock.patch.object(dataclass_schema, "FAST_VALIDATOR_THRESHOLD", 1), mock.patch.dict(
+        dataclass_schema._fast_validators
+    ), mock.patch.dict(dataclass_schema._validation_counts):
+        original = copy.deepcopy(good)
+        NodeConfig.validate(good)
+        assert dataclass_schema._fast_validators[NodeConfig] is not None
+        # valid data never reaches jsonschema
+        with mock.patch.object(dataclass_schema, "_get_validator", side_effect=AssertionError):
+            NodeConfig.validate(good)
+        # validation must not fill in defaults
+        assert good == original
+        assert _node_config_validation_error(bad) == slow_error
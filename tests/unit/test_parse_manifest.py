@@ -1,3 +1,7 @@
+import datetime
+import os
+import shutil
+import tempfile
 import unittest
 from unittest import mock
 from unittest.mock import patch, MagicMock
@@ -5,11 +9,16 @@ from argparse import Namespace
 
 from .utils import config_from_parts_or_dicts, normalize
 
+from dbt.context.base import get_cli_var_checksum
 from dbt.contracts.files import SourceFile, FileHash, FilePath
 from dbt.contracts.graph.manifest import Manifest, ManifestStateCheck
+from dbt.contracts.graph.node_args import ModelNodeArgs
 from dbt.parser import manifest
 from dbt.parser.manifest import ManifestLoader
+from dbt.clients.system import load_file_contents
+from dbt.parser.read_files import ReadFilesFromFileSystem, load_skipped_contents
 from dbt.config import RuntimeConfig
+from dbt.exceptions import ParsingError
 from dbt.flags import set_from_args
 
 
@@ -121,3 +130,267 @@ class TestPartialParse(unittest.TestCase):
         ManifestLoader(mock_project, {})
         # if specified in flags, we use the specified path
         patched_open.assert_called_with("specified_partial_parse_path", "rb")
+
+
+class TestPartialParseFile(unittest.TestCase):
+    def setUp(self):
+        self.target_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.target_path)
+        path = FilePath(
+            searched_path="models",
+            relative_path="model.sql",
+            project_root=self.target_path,
+            modification_time=0.0,
+        )
+        source_file = SourceFile(
+            path=path,
+            checksum=FileHash.from_contents("select 1"),
+            project_name="test",
+            env_vars=["DBT_TEST_VAR"],
+        )
+        self.manifest = Manifest(
+            files={source_file.file_id: source_file}, env_vars={"DBT_TEST_VAR": "value"}
+        )
+        self.manifest.state_check = self._state_check("vars")
+
+    def _state_check(self, vars):
+        return ManifestStateCheck(
+            vars_hash=FileHash.from_contents(vars),
+            project_env_vars_hash=FileHash.from_contents(""),
+            profile_env_vars_hash=FileHash.from_contents(""),
+            profile_hash=FileHash.from_contents("profile"),
+            project_hashes={},
+        )
+
+    def test_read_header(self):
+        data = self.manifest.to_msgpack(manifest.encode_partial_parse_file)
+        saved_file = manifest.PartialParseFile(data)
+        self.assertTrue(saved_file.is_current_format)
+        self.assertIn("files", saved_file.sections)
+        self.assertNotIn("state_check", saved_file.sections)
+        header = saved_file.read_header()
+        self.assertEqual(header.state_check, self.manifest.state_check)
+        self.assertEqual(header.metadata.dbt_version, self.manifest.metadata.dbt_version)
+        self.assertEqual(header.files, {})
+
+    def test_read_manifest(self):
+        data = self.manifest.to_msgpack(manifest.encode_partial_parse_file)
+        saved_manifest = manifest.PartialParseFile(data).read_manifest()
+        self.assertEqual(saved_manifest.files, self.manifest.files)
+        self.assertEqual(saved_manifest.env_vars, self.manifest.env_vars)
+        self.assertEqual(saved_manifest.state_check, self.manifest.state_check)
+        self.assertEqual(saved_manifest.metadata.project_id, self.manifest.metadata.project_id)
+
+    def test_old_format(self):
+        data = self.manifest.to_msgpack(manifest.extended_mashumaro_encoder)
+        self.assertFalse(manifest.PartialParseFile(data).is_current_format)
+
+    def _load_saved_manifest(self, state_check, cli_vars=None):
+        path = os.path.join(self.target_path, "partial_parse.msgpack")
+        with open(path, "wb") as fp:
+            fp.write(self.manifest.to_msgpack(manifest.encode_partial_parse_file))
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_target_path = self.target_path
+        mock_project.cli_vars = cli_vars or {}
+        set_from_args(Namespace(partial_parse=True), {})
+        with patch.object(
+            ManifestLoader, "build_manifest_state_check", return_value=state_check
+        ), patch.object(
+            manifest.PartialParseFile,
+            "read_manifest",
+            autospec=True,
+            side_effect=manifest.PartialParseFile.read_manifest,
+        ) as read_manifest:
+            loader = ManifestLoader(mock_project, {})
+        return loader.saved_manifest, read_manifest
+
+    def test_saved_manifest_is_read(self):
+        saved_manifest, read_manifest = self._load_saved_manifest(self.manifest.state_check)
+        read_manifest.assert_called_once()
+        self.assertEqual(saved_manifest.files, self.manifest.files)
+
+    def test_sections_not_decoded_when_not_partial_parsable(self):
+        saved_manifest, read_manifest = self._load_saved_manifest(
+            self._state_check("changed vars")
+        )
+        read_manifest.assert_not_called()
+        self.assertIsNone(saved_manifest)
+
+    def test_state_check_vars(self):
+        self.manifest.state_check.vars = {
+            "target_schema": get_cli_var_checksum({"target_schema": "a"}, "target_schema")
+        }
+        saved_manifest, _ = self._load_saved_manifest(
+            self.manifest.state_check, {"target_schema": "a", "run_date": "2000-01-01"}
+        )
+        self.assertIsNotNone(saved_manifest)
+        saved_manifest, _ = self._load_saved_manifest(
+            self.manifest.state_check, {"target_schema": "b"}
+        )
+        self.assertIsNone(saved_manifest)
+
+    def _load_in_memory_manifest(self, state_check):
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_target_path = self.target_path
+        mock_project.cli_vars = {}
+        set_from_args(Namespace(partial_parse=True), {})
+        with patch.object(ManifestLoader, "build_manifest_state_check", return_value=state_check):
+            loader = ManifestLoader(mock_project, {}, saved_manifest=self.manifest)
+        return loader.saved_manifest
+
+    def test_in_memory_manifest(self):
+        self.manifest.build_flat_graph()
+        self.manifest.ref_lookup
+        saved_manifest = self._load_in_memory_manifest(self.manifest.state_check)
+        self.assertIs(saved_manifest, self.manifest)
+        self.assertIsNone(saved_manifest._ref_lookup)
+        self.assertEqual(saved_manifest.flat_graph, {})
+        self.assertIsNone(self._load_in_memory_manifest(self._state_check("changed vars")))
+
+    def test_invocation_metadata_not_saved(self):
+        data = self.manifest.to_msgpack(manifest.encode_partial_parse_file)
+        self.assertNotIn("invocation_id", manifest.PartialParseFile(data).header["metadata"])
+        self.manifest.metadata.invocation_id = "another-invocation"
+        self.manifest.metadata.generated_at = datetime.datetime(2000, 1, 1)
+        self.assertEqual(self.manifest.to_msgpack(manifest.encode_partial_parse_file), data)
+
+
+class TestInjectExternalNodes(unittest.TestCase):
+    def setUp(self):
+        mock_project = MagicMock(RuntimeConfig)
+        mock_project.project_name = "test"
+        set_from_args(Namespace(partial_parse=False), {})
+        with patch.object(ManifestLoader, "build_manifest_state_check"):
+            self.loader = ManifestLoader(mock_project, {})
+        self.loader.manifest = Manifest()
+
+    def _inject(self, generated_at):
+        node_args = ModelNodeArgs(
+            name="external",
+            package_name="upstream",
+            identifier="external",
+            schema="upstream_schema",
+            generated_at=generated_at,
+        )
+        plugin_manager = MagicMock()
+        plugin_manager.get_nodes.return_value.models = {node_args.unique_id: node_args}
+        with patch("dbt.parser.manifest.plugins.get_plugin_manager", return_value=plugin_manager):
+            modified = self.loader.inject_external_nodes()
+        self.loader.manifest.build_parent_and_child_maps()
+        return modified
+
+    def test_unchanged_external_nodes(self):
+        generated_at = datetime.datetime(2000, 1, 1)
+        self.assertTrue(self._inject(generated_at))
+        self.assertEqual(
+            self.loader.manifest.external_node_unique_ids, ["model.upstream.external"]
+        )
+        self.assertFalse(self._inject(generated_at))
+        self.assertTrue(self._inject(datetime.datetime(2000, 1, 2)))
+        self.assertEqual(
+            self.loader.manifest.external_node_unique_ids, ["model.upstream.external"]
+        )
+
+
+class TestReadFilesFromFileSystem(unittest.TestCase):
+    def setUp(self):
+        self.project_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.project_root)
+        for dirname in ("models", "models/sub", "tests", "tests/generic", "seeds"):
+            os.makedirs(os.path.join(self.project_root, dirname))
+        for i in range(20):
+            self._write(f"models/model_{i}.sql", f"select {i} as id\n")
+            self._write(f"models/sub/model_sub_{i}.sql", f"select {i} as id\n")
+            self._write(f"models/schema_{i}.yml", f"version: 2\nmodels:\n  - name: model_{i}\n")
+        self._write("tests/my_test.sql", "select 1 where false")
+        self._write("tests/generic/my_generic.sql", "{% test x(model) %}{% endtest %}")
+        self._write("seeds/my_seed.csv", "a,b\n1,2\n")
+        self.project = Namespace(
+            project_name="test",
+            project_root=self.project_root,
+            macro_paths=["macros"],
+            model_paths=["models"],
+            snapshot_paths=["snapshots"],
+            analysis_paths=["analyses"],
+            test_paths=["tests"],
+            generic_test_paths=["tests/generic"],
+            seed_paths=["seeds"],
+            docs_paths=["models"],
+            all_source_paths=["models"],
+        )
+
+    def _write(self, path, contents):
+        with open(os.path.join(self.project_root, path), "w") as fp:
+            fp.write(contents)
+
+    def _read(self, threads, saved_files=None, verify_skipped_files=False):
+        reader = ReadFilesFromFileSystem(
+            all_projects={"test": self.project},
+            saved_files=saved_files or {},
+            threads=threads,
+            verify_skipped_files=verify_skipped_files,
+        )
+        reader.read_files()
+        return reader
+
+    def test_threaded_read_matches_sequential_read(self):
+        sequential = self._read(1)
+        threaded = self._read(4)
+        self.assertEqual(list(sequential.files), list(threaded.files))
+        self.assertEqual(sequential.files, threaded.files)
+        self.assertEqual(sequential.project_parser_files, threaded.project_parser_files)
+        parser_files = threaded.project_parser_files["test"]
+        self.assertEqual(len(parser_files["ModelParser"]), 40)
+        self.assertEqual(len(parser_files["SchemaParser"]), 20)
+        self.assertEqual(parser_files["SingularTestParser"], ["test://tests/my_test.sql"])
+        schema_file = threaded.files["test://models/schema_3.yml"]
+        self.assertEqual(schema_file.dfy["models"], [{"name": "model_3"}])
+
+    def test_threaded_read_raises_errors(self):
+        self._write("models/schema_bad.yml", "version: 2\nmodels: {}\n")
+        with self.assertRaises(ParsingError):
+            self._read(4)
+
+    def test_unchanged_files_are_not_read(self):
+        saved = self._read(1)
+        self.assertEqual(saved.skipped_file_count, 0)
+        self._write("models/model_1.sql", "select 100 as id\n")
+
+        with mock.patch(
+            "dbt.parser.read_files.load_file_contents", wraps=load_file_contents
+        ) as patched_load:
+            reader = self._read(1, saved_files=saved.files)
+        self.assertEqual(patched_load.call_count, 1)
+        self.assertEqual(reader.skipped_file_count, len(saved.files) - 1)
+        self.assertEqual(list(reader.files), list(saved.files))
+
+        changed = reader.files["test://models/model_1.sql"]
+        self.assertEqual(changed.contents, "select 100 as id")
+        self.assertNotEqual(changed.checksum, saved.files[changed.file_id].checksum)
+
+        model = reader.files["test://models/model_2.sql"]
+        self.assertIsNone(model.contents)
+        self.assertEqual(model.checksum, saved.files[model.file_id].checksum)
+        self.assertEqual(load_skipped_contents(model).contents, "select 2 as id")
+        schema_file = reader.files["test://models/schema_3.yml"]
+        self.assertEqual(schema_file.dfy["models"], [{"name": "model_3"}])
+        self.assertEqual(reader.files["test://seeds/my_seed.csv"].contents, "")
+
+    def test_verify_skipped_files(self):
+        saved = self._read(1)
+        # same size and modification time, different contents
+        path = os.path.join(self.project_root, "models/model_5.sql")
+        stat = os.stat(path)
+        self._write("models/model_5.sql", "select 6 as id\n")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        file_id = "test://models/model_5.sql"
+        unverified = self._read(1, saved_files=saved.files)
+        self.assertEqual(unverified.files[file_id].checksum, saved.files[file_id].checksum)
+        for threads in (1, 4):
+            verified = self._read(threads, saved_files=saved.files, verify_skipped_files=True)
+            self.assertEqual(verified.files[file_id].contents, "select 6 as id")
+            self.assertEqual(
+                verified.files[file_id].checksum, FileHash.from_contents("select 6 as id")
+            )
+            self.assertEqual(list(verified.files), list(saved.files))
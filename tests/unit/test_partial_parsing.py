@@ -1,6 +1,7 @@
 import unittest
 import time
 
+from dbt.context.base import get_cli_var_checksum
 from dbt.parser.partial import PartialParsing
 from dbt.contracts.graph.manifest import Manifest
 from dbt.contracts.graph.nodes import ModelNode
@@ -194,3 +195,32 @@ class TestPartialParsing(unittest.TestCase):
         )
         expected_model_descriptions = set(["Test model", "python"])
         self.assertEqual(schema_file_model_descriptions, expected_model_descriptions)
+
+    def test_changed_vars(self):
+        sql_model_file_id = "my_test://" + normalize("models/my_model.sql")
+        schema_file_id = "my_test://" + normalize("models/schema.yml")
+        self.saved_files[sql_model_file_id].vars = ["run_date"]
+        self.saved_files[schema_file_id].vars = {"models": {"python_model": ["run_date"]}}
+        self.saved_manifest.vars = {"run_date": get_cli_var_checksum({"run_date": 1}, "run_date")}
+
+        # The var hasn't changed
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, {"run_date": 1})
+        self.assertTrue(partial_parsing.skip_parsing())
+
+        # The var has changed, so the model file and the schema file entry using it are reparsed
+        partial_parsing = PartialParsing(self.saved_manifest, self.new_files, {"run_date": 2})
+        self.assertFalse(partial_parsing.skip_parsing())
+        self.assertEqual(partial_parsing.file_diff["changed"], [sql_model_file_id])
+        self.assertEqual(partial_parsing.file_diff["changed_schema_files"], [schema_file_id])
+        pp_files = partial_parsing.get_parsing_files()
+        self.assertEqual(
+            pp_files,
+            {"my_test": {"ModelParser": [sql_model_file_id], "SchemaParser": [schema_file_id]}},
+        )
+        schema_file = self.saved_files[schema_file_id]
+        schema_file_model_names = set([model["name"] for model in schema_file.pp_dict["models"]])
+        self.assertEqual(schema_file_model_names, set(["python_model", "my_model"]))
+        self.assertEqual(schema_file.vars, {})
+        self.assertEqual(
+            self.saved_manifest.vars["run_date"], get_cli_var_checksum({"run_date": 2}, "run_date")
+        )
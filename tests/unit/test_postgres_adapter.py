@@ -1,4 +1,5 @@
 import agate
+import datetime
 import decimal
 import unittest
 from unittest import mock
@@ -497,6 +498,136 @@ class TestConnectingPostgresAdapter(unittest.TestCase):
             ]
         )
 
+    def test_copy_csv_rows(self):
+        relation = self.adapter.Relation.create(
+            database="postgres",
+            schema="test_schema",
+            identifier="seed",
+            type="table",
+            quote_policy=self.adapter.config.quoting,
+        )
+        table = agate.Table(
+            rows=[
+                [1, "a", True, datetime.date(2020, 1, 1)],
+                [None, 'say "hi", bye', None, None],
+                [decimal.Decimal("2.5"), "", False, datetime.date(2020, 1, 2)],
+            ],
+            column_names=["id", "name", "flag", "day"],
+            column_types=[
+                agate.data_types.Number(),
+                agate.data_types.Text(null_values=()),
+                agate.data_types.Boolean(),
+                agate.data_types.Date(),
+            ],
+        )
+
+        copied = []
+
+        def copy_expert(sql, file):
+            # read in chunks that don't line up with rows, like psycopg2 does
+            while True:
+                data = file.read(5)
+                if not data:
+                    break
+                copied.append(data)
+
+        self.cursor.copy_expert.side_effect = copy_expert
+        sql = self.adapter.copy_csv_rows(relation, table, "id, name, flag, day")
+
+        self.assertEqual(
+            sql,
+            'copy "postgres"."test_schema".seed (id, name, flag, day) from stdin with (format csv)',
+        )
+        self.cursor.copy_expert.assert_called_once()
+        self.assertEqual(self.cursor.copy_expert.call_args.args[0], sql)
+        self.assertEqual(
+            "".join(copied),
+            '"1","a","True","2020-01-01"\n'
+            ',"say ""hi"", bye",,\n'
+            '"2.5","","False","2020-01-02"\n',
+        )
+
+    def test_execute_stream(self):
+        self.handle.autocommit = False
+        self.cursor.description = [("id",)]
+        self.cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)]]
+
+        _, stream = self.adapter.execute_stream("select 1", limit=3, batch_size=2)
+        self.assertTrue(self.handle.cursor.call_args.kwargs["name"].startswith("dbt_stream_"))
+        self.assertEqual([len(batch) for batch in stream.batches()], [2, 1])
+        self.assertEqual(self.cursor.fetchmany.call_args_list, [mock.call(2), mock.call(1)])
+        self.cursor.close.assert_called_once()
+
+    def test_calculate_freshness_batch(self):
+        sources = [
+            (
+                self.adapter.Relation.create(
+                    database="postgres", schema="test_schema", identifier=identifier
+                ),
+                loaded_at_field,
+                filter,
+            )
+            for identifier, loaded_at_field, filter in [
+                ("a", "loaded_at", None),
+                ("b", "updated_at", "id > 1"),
+                ("c", "loaded_at", None),
+                ("d", "name", None),
+            ]
+        ]
+        snapshotted_at = datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc)
+        self.cursor.description = [(f"max_loaded_at_{i}",) for i in range(4)] + [
+            ("snapshotted_at",)
+        ]
+        self.cursor.fetchall.return_value = [
+            (
+                datetime.datetime(2020, 1, 1),
+                None,
+                datetime.datetime(2020, 1, 1, 12),
+                "x",
+                snapshotted_at,
+            )
+        ]
+
+        with self.adapter.connection_named("freshness"):
+            _, freshnesses = self.adapter.calculate_freshness_batch(sources)
+
+        sql = self.mock_execute.call_args.args[0]
+        self.assertIn('from "postgres"."test_schema"."b"', sql)
+        self.assertIn("where id > 1", sql)
+        self.assertEqual(self.mock_execute.call_count, 1)
+        self.assertEqual(freshnesses[0]["age"], 86400)
+        self.assertEqual(freshnesses[2]["age"], 43200)
+        self.assertEqual(freshnesses[2]["snapshotted_at"], snapshotted_at)
+        # no rows is infinitely old
+        self.assertEqual(freshnesses[1]["max_loaded_at"].year, 1)
+        # a max that isn't a timestamp is left for the source to be checked on its own
+        self.assertIsNone(freshnesses[3])
+
+    def test_calculate_freshness_from_metadata_batch(self):
+        relations = [
+            self.adapter.Relation.create(
+                database="postgres", schema="test_schema", identifier=identifier
+            )
+            for identifier in ["a", "b", "c"]
+        ]
+        snapshotted_at = datetime.datetime(2020, 1, 2)
+        table = agate.Table(
+            [
+                ["TEST_SCHEMA", "B", datetime.datetime(2020, 1, 1), snapshotted_at],
+                ["test_schema", "a", None, snapshotted_at],
+                ["test_schema", "other", datetime.datetime(2020, 1, 1), snapshotted_at],
+            ],
+            ["schema", "identifier", "last_modified", "snapshotted_at"],
+        )
+        with mock.patch.object(self.adapter, "execute_macro") as execute_macro:
+            execute_macro.return_value = mock.Mock(response=None, table=table)
+            _, freshnesses = self.adapter.calculate_freshness_from_metadata_batch(relations)
+
+        self.assertEqual(execute_macro.call_args.kwargs["kwargs"]["relations"], relations)
+        self.assertEqual(set(freshnesses), set(relations[:2]))
+        self.assertEqual(freshnesses[relations[1]]["age"], 86400)
+        self.assertEqual(freshnesses[relations[0]]["max_loaded_at"].year, 1)
+
     def test_debug_connection_ok(self):
         DebugTask.validate_connection(self.target_dict)
         self.mock_execute.assert_has_calls([mock.call("/* dbt */\nselect 1 as id", None)])
@@ -3,6 +3,7 @@ from dbt.task.retry import TASK_DICT, CMD_DICT
 
 EXCLUDED_COMMANDS = {
     "clean",
+    "daemon",
     "debug",
     "deps",
     "freshness",
@@ -0,0 +1,87 @@
+import json
+import os
+from argparse import Namespace
+from unittest import mock
+
+import pytest
+
+from dbt.task.run import RunTask
+
+
+@pytest.fixture
+def task(tmp_path):
+    args = Namespace(state=None, defer_state=None)
+    config = Namespace(project_target_path=str(tmp_path))
+    return RunTask(args, config, None)
+
+
+def write_run_results(task, contents):
+    with open(os.path.join(task.config.project_target_path, "run_results.json"), "w") as fp:
+        fp.write(contents)
+
+
+@pytest.fixture
+def critical_path():
+    with mock.patch("dbt.task.runnable.get_flags") as get_flags:
+        get_flags.return_value = Namespace(SCHEDULER="critical-path")
+        yield
+
+
+def test_execution_times_by_depth(task):
+    write_run_results(task, json.dumps({"results": []}))
+    with mock.patch("dbt.task.runnable.get_flags", return_value=Namespace(SCHEDULER="depth")):
+        assert task.get_execution_times() is None
+
+
+@pytest.mark.usefixtures("critical_path")
+def test_execution_times(task):
+    # the previous run only selected some nodes, and some results are from
+    # older versions of dbt or were cut short
+    write_run_results(
+        task,
+        json.dumps(
+            {
+                "results": [
+                    {"unique_id": "model.test.a", "execution_time": 1.5},
+                    {"unique_id": "model.test.b", "execution_time": 0},
+                    {"unique_id": "model.test.c"},
+                    {"execution_time": 2.0},
+                ]
+            }
+        ),
+    )
+    assert task.get_execution_times() == {"model.test.a": 1.5, "model.test.b": 0.0}
+
+
+@pytest.mark.usefixtures("critical_path")
+@pytest.mark.parametrize(
+    "contents",
+    [
+        None,
+        "",
+        '{"results": [{"unique_id": "model.test.a", "execu',
+        "[]",
+        '{"results": 1}',
+        '{"results": [{"unique_id": "model.test.a", "execution_time": "fast"}]}',
+    ],
+)
+def test_execution_times_unreadable(task, contents):
+    if contents is not None:
+        write_run_results(task, contents)
+    # schedule by critical path without execution times, rather than failing
+    assert task.get_execution_times() == {}
+
+
+@pytest.mark.usefixtures("critical_path")
+def test_graph_queue_execution_times(task):
+    write_run_results(
+        task, json.dumps({"results": [{"unique_id": "model.test.a", "execution_time": 3.0}]})
+    )
+    selector = mock.Mock()
+    with mock.patch.object(task, "get_node_selector", return_value=selector), mock.patch.object(
+        task, "get_selection_spec"
+    ) as get_selection_spec:
+        assert task.get_graph_queue() is selector.get_graph_queue.return_value
+    selector.get_graph_queue.assert_called_once_with(
+        get_selection_spec.return_value, {"model.test.a": 3.0}
+    )
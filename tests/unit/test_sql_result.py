@@ -1,5 +1,8 @@
 import unittest
+from unittest import mock
+
 from dbt.adapters.sql.connections import SQLConnectionManager
+from dbt.clients.agate_helper import ResultTable
 
 
 class TestProcessSQLResult(unittest.TestCase):
@@ -17,3 +20,25 @@ class TestProcessSQLResult(unittest.TestCase):
             SQLConnectionManager.process_results(cols_with_more_dupes, rows),
             [{"a": 1, "a_2": 2, "a_3": 3, "b": 4}],
         )
+
+    def test_result_from_cursor(self):
+        cursor = mock.MagicMock()
+        cursor.description = [("a",), ("b",), ("a",)]
+        cursor.fetchall.return_value = [(1, "x", True), (2, "y", False)]
+        table = SQLConnectionManager.get_result_from_cursor(cursor, None)
+        self.assertIsInstance(table, ResultTable)
+        self.assertEqual(table.column_names, ("a", "b", "a_2"))
+        self.assertEqual([list(row) for row in table], [[1, "x", True], [2, "y", False]])
+
+        class DictConnectionManager(SQLConnectionManager):
+            @classmethod
+            def process_results(cls, column_names, rows):
+                return [
+                    {**row, "b": row["b"].upper()}
+                    for row in super().process_results(column_names, rows)
+                ]
+
+        cursor.description = [("a",), ("b",), ("a",)]
+        table = DictConnectionManager.get_result_from_cursor(cursor, None)
+        self.assertNotIsInstance(table, ResultTable)
+        self.assertEqual([list(row) for row in table], [[1, "X", True], [2, "Y", False]])
@@ -1,4 +1,6 @@
+import fnmatch
 import os
+import re
 import shutil
 import stat
 import unittest
@@ -6,6 +8,7 @@ import tarfile
 import pathspec
 from pathlib import Path
 from tempfile import mkdtemp, NamedTemporaryFile
+from unittest import mock
 
 from dbt.exceptions import ExecutableError, WorkingDirectoryError
 import dbt.clients.system
@@ -171,6 +174,8 @@ class TestFindMatching(unittest.TestCase):
                     "absolute_path": named_file.name,
                     "relative_path": os.path.basename(named_file.name),
                     "modification_time": out[0]["modification_time"],
+                    "file_size": 0,
+                    "inode": os.stat(named_file.name).st_ino,
                 }
             ]
             self.assertEqual(out, expected_output)
@@ -186,6 +191,8 @@ class TestFindMatching(unittest.TestCase):
                     "absolute_path": named_file.name,
                     "relative_path": os.path.basename(named_file.name),
                     "modification_time": out[0]["modification_time"],
+                    "file_size": 0,
+                    "inode": os.stat(named_file.name).st_ino,
                 }
             ]
             self.assertEqual(out, expected_output)
@@ -207,6 +214,98 @@ class TestFindMatching(unittest.TestCase):
             )
             self.assertEqual(out, [])
 
+    def _make_tree(self):
+        for path in (
+            "models/a.sql",
+            "models/a.yml",
+            "models/sub/b.sql",
+            "models/vendor/c.sql",
+            "models/vendor/deep/d.sql",
+            "models/vendor/keep.sql",
+            "models/other/vendor.sql",
+            "tests/e.sql",
+            "tests/generic/f.sql",
+        ):
+            full_path = os.path.join(self.tempdir, path)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
+            Path(full_path).write_text("select 1")
+
+    def _find_matching_by_walking(self, relative_paths_to_search, file_pattern, ignore_spec):
+        # find_matching as it was before it pruned ignored directories
+        reobj = re.compile(fnmatch.translate(file_pattern), re.IGNORECASE)
+        matching = []
+        for relative_path_to_search in relative_paths_to_search:
+            absolute_path_to_search = os.path.join(self.tempdir, relative_path_to_search)
+            for current_path, _, local_files in os.walk(absolute_path_to_search):
+                for local_file in local_files:
+                    absolute_path = os.path.join(current_path, local_file)
+                    relative_path = os.path.relpath(absolute_path, absolute_path_to_search)
+                    relative_path_to_root = os.path.join(relative_path_to_search, relative_path)
+                    if reobj.match(local_file) and (
+                        not ignore_spec or not ignore_spec.match_file(relative_path_to_root)
+                    ):
+                        matching.append((relative_path_to_search, absolute_path, relative_path))
+        return matching
+
+    def _find_matching(self, relative_paths_to_search, file_pattern, ignore_spec, **kwargs):
+        out = dbt.clients.system.find_matching(
+            self.tempdir, relative_paths_to_search, file_pattern, ignore_spec, **kwargs
+        )
+        return [(r["searched_path"], r["absolute_path"], r["relative_path"]) for r in out]
+
+    def test_ignored_directories_are_not_walked(self):
+        self._make_tree()
+        ignore_spec = pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, ["vendor/"]
+        )
+        with mock.patch("os.scandir", wraps=os.scandir) as patched_scandir:
+            out = self._find_matching(["models"], "*.sql", ignore_spec)
+        self.assertEqual(out, self._find_matching_by_walking(["models"], "*.sql", ignore_spec))
+        self.assertEqual(
+            sorted(os.path.relpath(path, self.tempdir) for _, path, _ in out),
+            ["models/a.sql", "models/other/vendor.sql", "models/sub/b.sql"],
+        )
+        scanned = {
+            os.path.relpath(call.args[0], self.tempdir)
+            for call in patched_scandir.mock_calls
+            if call.args
+        }
+        self.assertNotIn("models/vendor", scanned)
+        self.assertIn("models/sub", scanned)
+
+    def test_negated_patterns_are_respected(self):
+        self._make_tree()
+        ignore_spec = pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, ["vendor/", "!models/vendor/keep.sql"]
+        )
+        out = self._find_matching(["models"], "*.sql", ignore_spec)
+        self.assertEqual(out, self._find_matching_by_walking(["models"], "*.sql", ignore_spec))
+        self.assertIn(
+            os.path.join(self.tempdir, "models", "vendor", "keep.sql"), [o[1] for o in out]
+        )
+
+    def test_walk_search_paths(self):
+        self._make_tree()
+        ignore_spec = pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, ["deep", "*.yml"]
+        )
+        search_paths = ["models", "tests", "tests/generic", "models/", "missing", ""]
+        with mock.patch(
+            "dbt.clients.system._walk_files", wraps=dbt.clients.system._walk_files
+        ) as patched_walk:
+            walked_files = dbt.clients.system.walk_search_paths(
+                self.tempdir, search_paths, ignore_spec
+            )
+        self.assertEqual(patched_walk.call_count, 1)
+        for pattern in ("*.sql", "*.yml"):
+            for search_path in search_paths:
+                self.assertEqual(
+                    self._find_matching(
+                        [search_path], pattern, ignore_spec, walked_files=walked_files
+                    ),
+                    self._find_matching_by_walking([search_path], pattern, ignore_spec),
+                )
+
     def tearDown(self):
         try:
             shutil.rmtree(self.base_dir)
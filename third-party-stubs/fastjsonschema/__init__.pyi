@@ -0,0 +1,15 @@
+from typing import Any, Callable, Dict, Union
+
+class JsonSchemaException(ValueError): ...
+class JsonSchemaValueException(JsonSchemaException): ...
+class JsonSchemaDefinitionException(JsonSchemaException): ...
+
+def compile(
+    definition: Union[Dict[str, Any], bool],
+    handlers: Dict[str, Callable[[str], Any]] = ...,
+    formats: Dict[str, Any] = ...,
+    use_default: bool = ...,
+    use_formats: bool = ...,
+    detailed_exceptions: bool = ...,
+    fast_fail: bool = ...,
+) -> Callable[[Any], Any]: ...